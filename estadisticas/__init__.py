@@ -12,7 +12,23 @@ from .core import (
     AnalizadorCuantitativo,
     AnalizadorCualitativo,
     AnalizadorBivariado,
-    analizar
+    AnalizadorBivariadoIncremental,
+    AnalizadorCuantitativoIncremental,
+    AnalizadorAgrupado,
+    AnalizadorMultivariado,
+    AcumuladorMomentos,
+    AcumuladorComomentos,
+    AcumuladorCovarianzas,
+    SketchKLL,
+    SketchCountMin,
+    SketchMisraGries,
+    SketchHyperLogLog,
+    VentanaMovil,
+    HistogramaHDR,
+    Perfilador,
+    analizar,
+    analizar_async,
+    analizar_lote
 )
 
 __version__ = '1.0'
@@ -23,5 +39,21 @@ __all__ = [
     'AnalizadorCuantitativo',
     'AnalizadorCualitativo',
     'AnalizadorBivariado',
-    'analizar'
+    'AnalizadorBivariadoIncremental',
+    'AnalizadorCuantitativoIncremental',
+    'AnalizadorAgrupado',
+    'AnalizadorMultivariado',
+    'AcumuladorMomentos',
+    'AcumuladorComomentos',
+    'AcumuladorCovarianzas',
+    'SketchKLL',
+    'SketchCountMin',
+    'SketchMisraGries',
+    'SketchHyperLogLog',
+    'VentanaMovil',
+    'HistogramaHDR',
+    'Perfilador',
+    'analizar',
+    'analizar_async',
+    'analizar_lote'
 ]
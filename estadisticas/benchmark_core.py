@@ -0,0 +1,418 @@
+"""
+Benchmarks de rendimiento para la librería CorePy
+Ejecutar:
+    python benchmark_core.py suite --tamanos 1e3 1e4 1e5 1e6 --salida resultados.json
+    python benchmark_core.py suite --tamanos 1e8 --filtro memoryview --sin-memoria
+    python benchmark_core.py suite --linea-base linea_base.json
+    python benchmark_core.py paralelo --n 2000000 --max-trabajadores 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime
+
+import core
+from core import (
+    AnalizadorCuantitativo,
+    AnalizadorCualitativo,
+    AnalizadorBivariado,
+    AnalizadorMultivariado,
+    analizar,
+    analizar_async,
+    analizar_lote
+)
+
+
+def _cronometrar(funcion, repeticiones: int = 3) -> float:
+    """Retorna el mejor tiempo (en segundos) de varias ejecuciones"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def _memoria_pico(funcion) -> int:
+    """Retorna el pico de memoria (bytes) asignada durante una ejecución"""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# Elementos generados por bloque: acota la memoria temporal de la generación
+TAMANO_BLOQUE = 1 << 20
+
+
+def _generar_numericos(n: int, semilla: int = 42):
+    """
+    Genera pares (x, y) reproducibles como array('d'), por bloques
+
+    Con NumPy cada bloque se genera vectorizado y se copia al array; sin
+    NumPy se usa random. Un array('d') ocupa 8 bytes por elemento frente
+    a los ~32 de una lista de floats, lo que permite llegar a n = 1e8.
+    """
+    numericos, pares_y = array('d'), array('d')
+    if core.np is not None:
+        generador = core.np.random.default_rng(semilla)
+        for inicio in range(0, n, TAMANO_BLOQUE):
+            x = generador.normal(100, 15, min(TAMANO_BLOQUE, n - inicio))
+            numericos.frombytes(x.tobytes())
+            pares_y.frombytes((2 * x + generador.normal(0, 5, len(x))).tobytes())
+        return numericos, pares_y
+    generador = random.Random(semilla)
+    for inicio in range(0, n, TAMANO_BLOQUE):
+        bloque = array('d', [generador.gauss(100, 15)
+                             for _ in range(min(TAMANO_BLOQUE, n - inicio))])
+        numericos.extend(bloque)
+        pares_y.extend([2 * x + generador.gauss(0, 5) for x in bloque])
+    return numericos, pares_y
+
+
+def _generar_categoricos(n: int, cardinalidad: int, semilla: int = 42):
+    """
+    Genera n categorías reproducibles entre `cardinalidad` nombres
+
+    Los nombres se crean una sola vez y la lista sólo guarda referencias
+    a ellos, de modo que el costo por elemento es un puntero.
+    """
+    nombres = [f"cat{i}" for i in range(cardinalidad)]
+    categoricos = []
+    if core.np is not None:
+        generador = core.np.random.default_rng(semilla + 1)
+        for inicio in range(0, n, TAMANO_BLOQUE):
+            indices = generador.integers(cardinalidad, size=min(TAMANO_BLOQUE, n - inicio))
+            categoricos.extend([nombres[i] for i in indices.tolist()])
+        return categoricos
+    generador = random.Random(semilla + 1)
+    for inicio in range(0, n, TAMANO_BLOQUE):
+        categoricos.extend([nombres[generador.randrange(cardinalidad)]
+                            for _ in range(min(TAMANO_BLOQUE, n - inicio))])
+    return categoricos
+
+
+def _generar_datos(n: int, cardinalidad: int, semilla: int = 42):
+    """Genera datos numéricos, categóricos y pares (x, y) reproducibles"""
+    numericos, pares_y = _generar_numericos(n, semilla)
+    return numericos, _generar_categoricos(n, cardinalidad, semilla), pares_y
+
+
+# Por encima de este n se omite el caso que convierte los datos a lista
+LIMITE_LISTAS = 10 ** 7
+
+
+def casos_de_prueba(numericos, categoricos, pares_y, filtro: str = None):
+    """
+    Retorna {nombre del caso: función sin argumentos}
+
+    Cada caso construye un analizador nuevo, de modo que los resultados
+    memoizados de una ejecución no ocultan el costo de la siguiente. Los
+    datos auxiliares costosos (copias, muestras, instantáneas) sólo se
+    preparan si `filtro` incluye algún caso que los usa.
+    """
+    casos = {}
+
+    def incluir(nombre):
+        return not filtro or filtro in nombre
+
+    def cuantitativo(metodo, *argumentos):
+        return lambda: getattr(AnalizadorCuantitativo(numericos), metodo)(*argumentos)
+
+    def cualitativo(metodo):
+        return lambda: getattr(AnalizadorCualitativo(categoricos), metodo)()
+
+    def bivariado(metodo):
+        return lambda: getattr(AnalizadorBivariado(numericos, pares_y), metodo)()
+
+    # Los datos numéricos llegan como array('d'): se usan sin copiar, el
+    # pico de memoria no crece con n
+    casos['AnalizadorCuantitativo.__init__'] = lambda: AnalizadorCuantitativo(numericos)
+    casos['AnalizadorCuantitativo[memoryview].media'] = (
+        lambda: AnalizadorCuantitativo(memoryview(numericos)).media())
+    if len(numericos) <= LIMITE_LISTAS and incluir('AnalizadorCuantitativo[lista].__init__'):
+        lista = numericos.tolist()
+        casos['AnalizadorCuantitativo[lista].__init__'] = lambda: AnalizadorCuantitativo(lista)
+    # Muchos analizadores pequeños vivos a la vez: mide el tamaño por objeto
+    if incluir('AnalizadorCuantitativo[muchos].__init__'):
+        muestras = [numericos[inicio:inicio + 10] for inicio in range(0, len(numericos), 10)]
+        casos['AnalizadorCuantitativo[muchos].__init__'] = (
+            lambda: [AnalizadorCuantitativo(muestra) for muestra in muestras])
+    for metodo in ['media', 'mediana', 'moda', 'varianza', 'desviacion_estandar',
+                   'coeficiente_variacion', 'cuartiles', 'rango_intercuartilico',
+                   'asimetria', 'curtosis', 'minimo', 'maximo', 'rango',
+                   'resumen', 'resumen_cinco_numeros']:
+        casos[f'AnalizadorCuantitativo.{metodo}'] = cuantitativo(metodo)
+    # Suma compensada: costo frente a la ruta por defecto de los mismos métodos
+    for metodo in ['media', 'varianza', 'asimetria', 'curtosis']:
+        casos[f'AnalizadorCuantitativo[compensado].{metodo}'] = (
+            lambda metodo=metodo: getattr(AnalizadorCuantitativo(numericos), metodo)(
+                compensado=True))
+    # Perfilado: costo de la instrumentación frente a AnalizadorCuantitativo.resumen
+    def perfilado():
+        analizador = AnalizadorCuantitativo(numericos)
+        with analizador.perfilar():
+            return analizador.resumen()
+    casos['AnalizadorCuantitativo[perfilado].resumen'] = perfilado
+    casos['AnalizadorCuantitativo.percentil'] = cuantitativo('percentil', 95)
+    casos['AnalizadorCuantitativo.percentiles'] = cuantitativo('percentiles', [50, 95, 99])
+    casos['AnalizadorCuantitativo.histograma'] = cuantitativo('histograma')
+    casos['AnalizadorCuantitativo.histograma_hdr'] = cuantitativo('histograma_hdr')
+    casos['AnalizadorCuantitativo.intervalo_confianza'] = cuantitativo(
+        'intervalo_confianza', 'media', 0.95, 100, None, 42)
+
+    # Instantáneas: la carga reutiliza la muestra ordenada y los momentos
+    casos['AnalizadorCuantitativo.serializar'] = cuantitativo('serializar')
+    if incluir('AnalizadorCuantitativo.deserializar.resumen'):
+        instantanea = AnalizadorCuantitativo(numericos).serializar()
+        casos['AnalizadorCuantitativo.deserializar.resumen'] = (
+            lambda: AnalizadorCuantitativo.deserializar(instantanea).resumen())
+    if incluir('AnalizadorCuantitativo.combinar'):
+        mitad = AnalizadorCuantitativo(numericos[:len(numericos) // 2]).serializar()
+        casos['AnalizadorCuantitativo.combinar'] = (
+            lambda: AnalizadorCuantitativo.deserializar(mitad).combinar(
+                AnalizadorCuantitativo.deserializar(mitad)))
+
+    casos['AnalizadorCualitativo.__init__'] = lambda: AnalizadorCualitativo(categoricos)
+    for metodo in ['frecuencias_absolutas', 'frecuencias_relativas',
+                   'frecuencias_porcentuales', 'moda', 'categorias_unicas', 'entropia',
+                   'indice_diversidad_simpson', 'tabla_frecuencias', 'resumen']:
+        casos[f'AnalizadorCualitativo.{metodo}'] = cualitativo(metodo)
+    casos['AnalizadorCualitativo.serializar'] = cualitativo('serializar')
+    for metodo in ['moda', 'tabla_frecuencias', 'categorias_unicas', 'resumen']:
+        casos[f'AnalizadorCualitativo[aproximado].{metodo}'] = (
+            lambda metodo=metodo: getattr(AnalizadorCualitativo(categoricos, modo='aproximado'), metodo)())
+
+    casos['AnalizadorCualitativo[codificado].__init__'] = (
+        lambda: AnalizadorCualitativo(categoricos, codificar=True))
+    casos['AnalizadorCualitativo[codificado].resumen'] = (
+        lambda: AnalizadorCualitativo(categoricos, codificar=True).resumen())
+
+    casos['AnalizadorBivariado.__init__'] = lambda: AnalizadorBivariado(numericos, pares_y)
+    for metodo in ['covarianza', 'correlacion_pearson', 'correlacion_spearman',
+                   'correlacion_kendall', 'coeficiente_determinacion',
+                   'regresion_lineal_simple', 'resumen']:
+        casos[f'AnalizadorBivariado.{metodo}'] = bivariado(metodo)
+    casos['AnalizadorBivariado[compensado].covarianza'] = (
+        lambda: AnalizadorBivariado(numericos, pares_y).covarianza(compensado=True))
+
+    if incluir('AnalizadorMultivariado.matriz_correlacion'):
+        columnas = [numericos, pares_y, numericos[::-1], pares_y[::-1]]
+        casos['AnalizadorMultivariado.matriz_correlacion'] = (
+            lambda: AnalizadorMultivariado(columnas).matriz_correlacion())
+
+    casos['analizar.cuantitativo'] = lambda: analizar(numericos).resumen()
+
+    async def resumen_async():
+        return await (await analizar_async(numericos)).resumen_async()
+
+    async def flujo():
+        for inicio in range(0, len(numericos), 65536):
+            yield numericos[inicio:inicio + 65536]
+
+    async def flujo_async():
+        return (await analizar_async(flujo())).resumen()
+
+    casos['analizar_async.resumen_async'] = lambda: asyncio.run(resumen_async())
+    casos['analizar_async.flujo'] = lambda: asyncio.run(flujo_async())
+    casos['analizar.cualitativo'] = lambda: analizar(categoricos).resumen()
+    tabla = {'numericos': numericos, 'categoricos': categoricos, 'pares_y': pares_y}
+    casos['analizar_lote.resumir'] = lambda: analizar_lote(tabla, resumir=True)
+    return casos
+
+
+def ejecutar_suite(tamanos, cardinalidad: float, repeticiones: int = 3,
+                   medir_memoria: bool = True, filtro: str = None):
+    """
+    Ejecuta todos los casos para cada tamaño de entrada
+
+    Args:
+        tamanos: Tamaños de entrada (p. ej. 1e3 ... 1e8). Los datos se
+            generan por bloques como array('d'); a partir de ~1e7 el
+            límite lo ponen los métodos que ordenan o que crean un objeto
+            Python por elemento (categóricos, bootstrap, muestras)
+        cardinalidad: Categorías distintas como fracción de n (si es < 1)
+            o como cantidad absoluta
+        repeticiones: Ejecuciones por caso (se guarda la mejor)
+        medir_memoria: Si True mide el pico de memoria en una ejecución
+            aparte (tracemalloc ralentiza el cronometraje)
+        filtro: Si se indica, sólo los casos cuyo nombre lo contienen
+    """
+    resultados = []
+    for n in tamanos:
+        distintas = max(1, int(n * cardinalidad) if cardinalidad < 1 else int(cardinalidad))
+        print("\n" + "="*70)
+        print(f"n = {n:,}  (categorías distintas: {distintas:,})")
+        print("="*70)
+        print(f"{'Caso':<48} {'Tiempo(s)':<11} {'Elem/s':<12} {'Pico MB':<8}")
+        print("-" * 70)
+
+        casos = casos_de_prueba(*_generar_datos(n, distintas), filtro)
+        for nombre, funcion in casos.items():
+            if filtro and filtro not in nombre:
+                continue
+            segundos = _cronometrar(funcion, repeticiones)
+            pico = _memoria_pico(funcion) if medir_memoria else None
+            resultados.append({
+                'caso': nombre,
+                'n': n,
+                'cardinalidad': distintas,
+                'segundos': segundos,
+                'elementos_por_segundo': n / segundos if segundos > 0 else None,
+                'memoria_pico_bytes': pico
+            })
+            memoria = f"{pico / 2**20:.1f}" if pico is not None else "-"
+            print(f"{nombre:<48} {segundos:<11.5f} {n / max(segundos, 1e-12):<12.3g} {memoria:<8}")
+    return resultados
+
+
+def detectar_regresiones(resultados, linea_base, tolerancia: float):
+    """
+    Compara contra una línea base y retorna los casos que empeoraron
+
+    Un caso es una regresión si su tiempo o su pico de memoria supera el
+    de la línea base (mismo caso y mismo n) en más de `tolerancia`.
+    """
+    base = {(r['caso'], r['n']): r for r in linea_base['resultados']}
+    regresiones = []
+    for resultado in resultados:
+        anterior = base.get((resultado['caso'], resultado['n']))
+        if anterior is None:
+            continue
+        for metrica in ('segundos', 'memoria_pico_bytes'):
+            actual, previo = resultado.get(metrica), anterior.get(metrica)
+            if actual is None or not previo:
+                continue
+            if actual > previo * (1 + tolerancia):
+                regresiones.append({
+                    'caso': resultado['caso'],
+                    'n': resultado['n'],
+                    'metrica': metrica,
+                    'linea_base': previo,
+                    'actual': actual,
+                    'variacion': actual / previo - 1
+                })
+    return regresiones
+
+
+def _metadatos():
+    """Información del entorno para hacer comparables los resultados"""
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'procesador': platform.processor(),
+        'cpus': os.cpu_count(),
+        'numpy': core.np.__version__ if core.np is not None else None
+    }
+
+
+def benchmark_paralelo(n: int, max_trabajadores: int, repeticiones: int = 3):
+    """
+    Mide la escalabilidad de la reducción por bloques de 1 a N procesos
+
+    El tiempo incluye crear el pool y enviar los bloques a los procesos,
+    es decir, el costo real que paga quien usa trabajadores > 1.
+    """
+    print("\n" + "="*70)
+    print(f"ESCALABILIDAD PARALELA (n={n:,}, hasta {max_trabajadores} procesos)")
+    print("="*70)
+
+    datos_x, datos_y = _generar_numericos(n)
+
+    def cuantitativo(trabajadores):
+        analizador = AnalizadorCuantitativo(datos_x, trabajadores=trabajadores)
+        return analizador.media(), analizador.varianza(), analizador.curtosis()
+
+    def bivariado(trabajadores):
+        analizador = AnalizadorBivariado(datos_x, datos_y, trabajadores=trabajadores)
+        return analizador.correlacion_pearson(), analizador.regresion_lineal_simple()
+
+    resultados = []
+    base_cuant = base_biv = None
+    print(f"{'Procesos':<10} {'Cuant.(s)':<12} {'Acel.':<8} {'Biv.(s)':<12} {'Acel.':<8}")
+    print("-" * 70)
+
+    trabajadores = 1
+    while trabajadores <= max_trabajadores:
+        t_cuant = _cronometrar(lambda: cuantitativo(trabajadores), repeticiones)
+        t_biv = _cronometrar(lambda: bivariado(trabajadores), repeticiones)
+        if base_cuant is None:
+            base_cuant, base_biv = t_cuant, t_biv
+        resultados.append({
+            'trabajadores': trabajadores,
+            'cuantitativo_s': t_cuant,
+            'bivariado_s': t_biv,
+            'aceleracion_cuantitativo': base_cuant / t_cuant,
+            'aceleracion_bivariado': base_biv / t_biv
+        })
+        print(f"{trabajadores:<10} {t_cuant:<12.4f} {base_cuant / t_cuant:<8.2f} "
+              f"{t_biv:<12.4f} {base_biv / t_biv:<8.2f}")
+        trabajadores *= 2
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de CorePy")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    suite = subcomandos.add_parser('suite', help="Todos los métodos en varios tamaños")
+    suite.add_argument('--tamanos', type=float, nargs='+', default=[1e3, 1e4, 1e5, 1e6],
+                       help="Tamaños de entrada, p. ej. 1e3 1e5 1e7 1e8")
+    suite.add_argument('--cardinalidad', type=float, default=0.5,
+                       help="Categorías distintas: fracción de n (< 1) o cantidad")
+    suite.add_argument('--repeticiones', type=int, default=3)
+    suite.add_argument('--sin-memoria', action='store_true',
+                       help="No medir el pico de memoria (más rápido)")
+    suite.add_argument('--filtro', help="Ejecutar sólo los casos que contienen este texto")
+    suite.add_argument('--salida', help="Archivo JSON donde guardar los resultados")
+    suite.add_argument('--linea-base', help="JSON de una ejecución anterior para comparar")
+    suite.add_argument('--tolerancia', type=float, default=0.2,
+                       help="Empeoramiento relativo permitido antes de marcar regresión")
+
+    paralelo = subcomandos.add_parser('paralelo', help="Escalabilidad de 1 a N procesos")
+    paralelo.add_argument('--n', type=int, default=1_000_000)
+    paralelo.add_argument('--max-trabajadores', type=int, default=os.cpu_count() or 1)
+    paralelo.add_argument('--repeticiones', type=int, default=3)
+
+    argumentos = parser.parse_args()
+    if argumentos.comando == 'paralelo':
+        benchmark_paralelo(argumentos.n, argumentos.max_trabajadores, argumentos.repeticiones)
+        return
+
+    resultados = ejecutar_suite([int(n) for n in argumentos.tamanos], argumentos.cardinalidad,
+                                argumentos.repeticiones, not argumentos.sin_memoria,
+                                argumentos.filtro)
+    informe = {'metadatos': _metadatos(), 'resultados': resultados}
+    if argumentos.salida:
+        with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {argumentos.salida}")
+
+    if argumentos.linea_base:
+        with open(argumentos.linea_base, encoding='utf-8') as archivo:
+            regresiones = detectar_regresiones(resultados, json.load(archivo),
+                                               argumentos.tolerancia)
+        print("\n" + "="*70)
+        if regresiones:
+            print(f"⚠️ {len(regresiones)} REGRESIÓN(ES) DETECTADA(S)")
+            for r in regresiones:
+                print(f"{r['caso']} (n={r['n']:,}) {r['metrica']}: "
+                      f"{r['linea_base']:.4g} → {r['actual']:.4g} ({r['variacion']:+.0%})")
+            sys.exit(1)
+        print("✅ Sin regresiones respecto a la línea base")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,20 +9,2394 @@ Versión: 1.0
 Una librería orientada a objetos para realizar análisis estadístico
 descriptivo de datos cuantitativos y cualitativos.
 """
+import os
+import sys
+import asyncio
+import copy
 from abc import ABC, abstractmethod
 from typing import List, Union, Dict, Tuple
+import csv
+import inspect
+import json
 import math
-from collections import Counter
+import mmap
+import random
+import struct
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from functools import wraps
+from hashlib import blake2b
+from heapq import merge, nlargest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from operator import mul, sub
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa la ruta en Python puro
+    np = None
+
+
+class AcumuladorMomentos:
+    """
+    Acumula en una sola pasada los momentos centrales de una muestra
+    (n, media, M2, M3, M4, mínimo y máximo) con las actualizaciones
+    de Welford/Pébay, numéricamente estables.
+    
+    `orden` indica el momento central más alto disponible: 1 (sólo n y
+    media), 2 (además M2, mínimo y máximo) o 4 (todos). Los acumuladores
+    construidos con desde_secuencia/desde_arreglo pueden calcular sólo
+    lo necesario; agregar y extender siempre mantienen los cuatro.
+    """
+    
+    __slots__ = ('n', 'media', 'm2', 'm3', 'm4', 'minimo', 'maximo', 'orden')
+    
+    _MAGICO = b'MOM'
+    _VERSION = 1
+    _FORMATO = struct.Struct('<3sBB3xQ6d')
+    TAMANO_BLOQUE = 65536
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.orden = 4
+
+    def agregar(self, x: float):
+        """Incorpora un valor actualizando todos los momentos."""
+        n1 = self.n
+        n = n1 + 1
+        delta = x - self.media
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        termino1 = delta * delta_n * n1
+        self.media += delta_n
+        self.m4 += (termino1 * delta_n2 * (n * n - 3 * n + 3)
+                    + 6 * delta_n2 * self.m2 - 4 * delta_n * self.m3)
+        self.m3 += termino1 * delta_n * (n - 2) - 3 * delta_n * self.m2
+        self.m2 += termino1
+        self.n = n
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+
+    def extender(self, valores):
+        """
+        Incorpora todos los valores de un iterable en una sola pasada
+        Las secuencias se procesan por bloques con desde_secuencia y se
+        fusionan; los demás iterables, valor a valor con Welford/Pébay.
+        """
+        if hasattr(valores, '__len__') and hasattr(valores, '__getitem__'):
+            return self.combinar(type(self).desde_secuencia(valores))
+        # Variables locales: evita accesos a atributos en el bucle caliente
+        n, media, m2, m3, m4 = self.n, self.media, self.m2, self.m3, self.m4
+        minimo, maximo = self.minimo, self.maximo
+        for x in valores:
+            n1 = n
+            n += 1
+            delta = x - media
+            delta_n = delta / n
+            delta_n2 = delta_n * delta_n
+            termino1 = delta * delta_n * n1
+            media += delta_n
+            m4 += (termino1 * delta_n2 * (n * n - 3 * n + 3)
+                   + 6 * delta_n2 * m2 - 4 * delta_n * m3)
+            m3 += termino1 * delta_n * (n - 2) - 3 * delta_n * m2
+            m2 += termino1
+            if x < minimo:
+                minimo = x
+            if x > maximo:
+                maximo = x
+        self.n, self.media, self.m2, self.m3, self.m4 = n, media, m2, m3, m4
+        self.minimo, self.maximo = minimo, maximo
+        return self
+
+    def _requerir_orden(self, orden: int):
+        """Verifica que los momentos hasta `orden` estén calculados."""
+        if self.orden < orden:
+            raise ValueError(f"El acumulador sólo tiene momentos hasta el orden {self.orden}")
+
+    def varianza(self, muestral: bool = True) -> float:
+        """Varianza a partir de M2 (muestral con n-1 o poblacional con n)."""
+        self._requerir_orden(2)
+        divisor = self.n - 1 if muestral else self.n
+        return self.m2 / divisor
+
+    def asimetria(self) -> float:
+        """Coeficiente de asimetría de Fisher a partir de M2 y M3."""
+        n = self.n
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 datos para calcular asimetría")
+        self._requerir_orden(4)
+        desv_std = math.sqrt(self.m2 / (n - 1))
+        if desv_std == 0:
+            return 0.0
+        suma_cubos = self.m3 / desv_std ** 3
+        return (n * suma_cubos) / ((n - 1) * (n - 2))
+
+    def curtosis(self) -> float:
+        """Exceso de curtosis de Fisher a partir de M2 y M4."""
+        n = self.n
+        if n < 4:
+            raise ValueError("Se necesitan al menos 4 datos para calcular curtosis")
+        self._requerir_orden(4)
+        desv_std = math.sqrt(self.m2 / (n - 1))
+        if desv_std == 0:
+            return 0.0
+        suma_cuartos = self.m4 / desv_std ** 4
+        termino1 = (n * (n + 1)) / ((n - 1) * (n - 2) * (n - 3))
+        termino2 = (3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+        return termino1 * suma_cuartos - termino2
+
+    def combinar(self, otro: 'AcumuladorMomentos') -> 'AcumuladorMomentos':
+        """
+        Fusiona los momentos de otro acumulador (fórmulas de Pébay/Chan)
+        El resultado equivale a haber procesado ambas muestras juntas.
+        """
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media = otro.n, otro.media
+            self.m2, self.m3, self.m4 = otro.m2, otro.m3, otro.m4
+            self.minimo, self.maximo = otro.minimo, otro.maximo
+            self.orden = otro.orden
+            return self
+        
+        self.orden = min(self.orden, otro.orden)
+        na, nb = self.n, otro.n
+        n = na + nb
+        delta = otro.media - self.media
+        delta2 = delta * delta
+        
+        m4 = (self.m4 + otro.m4
+              + delta2 * delta2 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+              + 6 * delta2 * (na * na * otro.m2 + nb * nb * self.m2) / n ** 2
+              + 4 * delta * (na * otro.m3 - nb * self.m3) / n)
+        m3 = (self.m3 + otro.m3
+              + delta * delta2 * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * otro.m2 - nb * self.m2) / n)
+        m2 = self.m2 + otro.m2 + delta2 * na * nb / n
+        
+        self.n = n
+        self.media += delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+
+    @classmethod
+    def desde_arreglo(cls, arreglo, orden: int = 4) -> 'AcumuladorMomentos':
+        """
+        Construye el acumulador con kernels vectorizados de NumPy
+        
+        Args:
+            arreglo: ndarray unidimensional
+            orden: Momento central más alto a calcular (1, 2 o 4)
+        """
+        acumulador = cls()
+        acumulador.n = int(arreglo.size)
+        if acumulador.n == 0:
+            return acumulador
+        media = arreglo.mean()
+        acumulador.media = float(media)
+        acumulador.orden = orden
+        if orden < 2:
+            return acumulador
+        desvios = arreglo - media
+        cuadrados = desvios * desvios
+        acumulador.m2 = float(cuadrados.sum())
+        if orden >= 4:
+            acumulador.m3 = float((cuadrados * desvios).sum())
+            acumulador.m4 = float((cuadrados * cuadrados).sum())
+        acumulador.minimo = float(arreglo.min())
+        acumulador.maximo = float(arreglo.max())
+        return acumulador
+
+    @classmethod
+    def desde_secuencia(cls, valores, orden: int = 4) -> 'AcumuladorMomentos':
+        """
+        Construye el acumulador sin bucles de Python por elemento
+        
+        La media de orden 1 es un sum() directo. Para órdenes mayores cada
+        bloque de TAMANO_BLOQUE valores se resuelve en dos pasadas con
+        sum/map (a nivel de C): media del bloque, desvíos y sumas de sus
+        potencias, corregidas con el residuo Σ(x - x̄)/n. Los bloques se
+        fusionan con las fórmulas de Chan de combinar().
+        
+        Args:
+            valores: Lista, array o memoryview de números
+            orden: Momento central más alto a calcular (1, 2 o 4)
+        """
+        acumulador = cls()
+        n = len(valores)
+        if n == 0:
+            return acumulador
+        if orden < 2:
+            acumulador.n, acumulador.media, acumulador.orden = n, sum(valores) / n, 1
+            return acumulador
+        for inicio in range(0, n, cls.TAMANO_BLOQUE):
+            bloque = valores[inicio:inicio + cls.TAMANO_BLOQUE]
+            k = len(bloque)
+            parcial = cls()
+            media = sum(bloque) / k
+            desvios = list(map(sub, bloque, repeat(media)))
+            residuo = sum(desvios) / k
+            cuadrados = list(map(mul, desvios, desvios))
+            s2 = sum(cuadrados)
+            parcial.n, parcial.media = k, media + residuo
+            parcial.m2 = s2 - k * residuo * residuo
+            if orden >= 4:
+                s3 = sum(map(mul, cuadrados, desvios))
+                s4 = sum(map(mul, cuadrados, cuadrados))
+                parcial.m3 = s3 - 3 * residuo * s2 + 2 * k * residuo ** 3
+                parcial.m4 = (s4 - 4 * residuo * s3 + 6 * residuo ** 2 * s2
+                              - 3 * k * residuo ** 4)
+            parcial.minimo, parcial.maximo = min(bloque), max(bloque)
+            parcial.orden = orden
+            acumulador.combinar(parcial)
+        return acumulador
+
+    def serializar(self) -> bytes:
+        """Serializa los momentos en un formato binario compacto y versionado (64 bytes)."""
+        return self._FORMATO.pack(self._MAGICO, self._VERSION, self.orden, self.n,
+                                  self.media, self.m2, self.m3, self.m4,
+                                  self.minimo, self.maximo)
+
+    @classmethod
+    def deserializar(cls, datos: bytes) -> 'AcumuladorMomentos':
+        """Reconstruye el acumulador a partir de serializar()."""
+        magico, version, orden, *campos = cls._FORMATO.unpack_from(datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de momentos no reconocido")
+        acumulador = cls()
+        acumulador.orden = orden or 4  # 0: instantáneas sin el campo, completas
+        (acumulador.n, acumulador.media, acumulador.m2, acumulador.m3,
+         acumulador.m4, acumulador.minimo, acumulador.maximo) = campos
+        return acumulador
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n={self.n}, media={self.media})"
+
+
+class AcumuladorComomentos:
+    """
+    Acumula en una sola pasada los co-momentos de pares (x, y): n, medias,
+    M2 de cada variable y el co-momento C_xy = Σ(x - x̄)(y - ȳ), con
+    actualizaciones de Welford y fusión estable entre particiones.
+    """
+    
+    __slots__ = ('n', 'media_x', 'media_y', 'm2_x', 'm2_y', 'c_xy')
+
+    def __init__(self):
+        self.n = 0
+        self.media_x = 0.0
+        self.media_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def agregar(self, x: float, y: float):
+        """Incorpora un par (x, y)."""
+        self.n += 1
+        delta_x = x - self.media_x
+        delta_y = y - self.media_y
+        self.media_x += delta_x / self.n
+        self.media_y += delta_y / self.n
+        self.m2_x += delta_x * (x - self.media_x)
+        self.m2_y += delta_y * (y - self.media_y)
+        self.c_xy += delta_x * (y - self.media_y)
+
+    def extender(self, datos_x, datos_y):
+        """Incorpora todos los pares de dos iterables en una sola pasada."""
+        n, media_x, media_y = self.n, self.media_x, self.media_y
+        m2_x, m2_y, c_xy = self.m2_x, self.m2_y, self.c_xy
+        for x, y in zip(datos_x, datos_y):
+            n += 1
+            delta_x = x - media_x
+            delta_y = y - media_y
+            media_x += delta_x / n
+            media_y += delta_y / n
+            m2_x += delta_x * (x - media_x)
+            m2_y += delta_y * (y - media_y)
+            c_xy += delta_x * (y - media_y)
+        self.n, self.media_x, self.media_y = n, media_x, media_y
+        self.m2_x, self.m2_y, self.c_xy = m2_x, m2_y, c_xy
+        return self
+
+    def combinar(self, otro: 'AcumuladorComomentos') -> 'AcumuladorComomentos':
+        """Fusiona los co-momentos de otro acumulador (fórmulas de Chan)."""
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media_x, self.media_y = otro.n, otro.media_x, otro.media_y
+            self.m2_x, self.m2_y, self.c_xy = otro.m2_x, otro.m2_y, otro.c_xy
+            return self
+        na, nb = self.n, otro.n
+        n = na + nb
+        delta_x = otro.media_x - self.media_x
+        delta_y = otro.media_y - self.media_y
+        factor = na * nb / n
+        self.m2_x += otro.m2_x + delta_x * delta_x * factor
+        self.m2_y += otro.m2_y + delta_y * delta_y * factor
+        self.c_xy += otro.c_xy + delta_x * delta_y * factor
+        self.media_x += delta_x * nb / n
+        self.media_y += delta_y * nb / n
+        self.n = n
+        return self
+
+    @classmethod
+    def desde_arreglos(cls, arreglo_x, arreglo_y) -> 'AcumuladorComomentos':
+        """Construye el acumulador con kernels vectorizados de NumPy."""
+        acumulador = cls()
+        acumulador.n = int(arreglo_x.size)
+        if acumulador.n == 0:
+            return acumulador
+        media_x, media_y = arreglo_x.mean(), arreglo_y.mean()
+        desvios_x, desvios_y = arreglo_x - media_x, arreglo_y - media_y
+        acumulador.media_x, acumulador.media_y = float(media_x), float(media_y)
+        acumulador.m2_x = float(desvios_x @ desvios_x)
+        acumulador.m2_y = float(desvios_y @ desvios_y)
+        acumulador.c_xy = float(desvios_x @ desvios_y)
+        return acumulador
+
+    def covarianza(self, muestral: bool = True) -> float:
+        """Covarianza a partir de C_xy."""
+        divisor = self.n - 1 if muestral else self.n
+        return self.c_xy / divisor
+
+    def correlacion(self) -> float:
+        """Coeficiente de correlación de Pearson."""
+        if self.m2_x == 0 or self.m2_y == 0:
+            raise ValueError("No se puede calcular correlación con d.s 0")
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+    def regresion(self) -> Tuple[float, float]:
+        """Intercepto y pendiente de la recta de mínimos cuadrados."""
+        if self.m2_x == 0:
+            raise ValueError("No se puede calcular regresión: varianza de X es 0")
+        pendiente = self.c_xy / self.m2_x
+        return self.media_y - pendiente * self.media_x, pendiente
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n={self.n})"
+
+
+class AcumuladorCovarianzas:
+    """
+    Generaliza AcumuladorComomentos a p columnas: n, medias y la matriz de
+    co-momentos C[i][j] = Σ(x_i - x̄_i)(x_j - x̄_j). Se alimenta por bloques
+    de filas y los bloques se fusionan con las fórmulas de Chan, por lo que
+    permite recorrer los datos por partes o combinar particiones.
+    
+    Con NumPy cada bloque se reduce con un producto matricial Xcᵀ·Xc (BLAS,
+    por bloques); sin NumPy cada par de columnas es un producto punto.
+    """
+
+    def __init__(self, p: int):
+        if p < 1:
+            raise ValueError("Se necesita al menos una columna")
+        self.p = p
+        self.n = 0
+        if np is not None:
+            self.medias = np.zeros(p)
+            self.comomentos = np.zeros((p, p))
+        else:
+            self.medias = [0.0] * p
+            self.comomentos = [[0.0] * p for _ in range(p)]
+
+    @classmethod
+    def _desde_bloque(cls, bloque) -> 'AcumuladorCovarianzas':
+        """Momentos de un bloque dado como lista de columnas o matriz filas × p."""
+        es_matriz = np is not None and isinstance(bloque, np.ndarray) and bloque.ndim == 2
+        columnas = None if es_matriz else list(bloque)
+        if columnas is not None and len({len(columna) for columna in columnas}) > 1:
+            raise ValueError("Todas las columnas deben tener el mismo tamaño")
+        acumulador = cls(bloque.shape[1] if es_matriz else len(columnas))
+        try:
+            if np is not None:
+                matriz = (bloque.astype(float, copy=False) if es_matriz else
+                          np.column_stack([np.asarray(c, dtype=float) for c in columnas]))
+                acumulador.n = matriz.shape[0]
+                if acumulador.n:
+                    acumulador.medias = matriz.mean(axis=0)
+                    centrada = matriz - acumulador.medias
+                    acumulador.comomentos = centrada.T @ centrada
+                return acumulador
+            columnas = [[float(x) for x in columna] for columna in columnas]
+        except (ValueError, TypeError) as e:
+            raise TypeError("Todos los datos deben ser numéricos") from e
+        
+        n = acumulador.n = len(columnas[0])
+        if n == 0:
+            return acumulador
+        acumulador.medias = [math.fsum(columna) / n for columna in columnas]
+        centradas = [[x - media for x in columna]
+                     for columna, media in zip(columnas, acumulador.medias)]
+        comomentos = acumulador.comomentos
+        for i, ci in enumerate(centradas):
+            for j in range(i, len(centradas)):
+                comomentos[i][j] = comomentos[j][i] = sum(map(mul, ci, centradas[j]))
+        return acumulador
+
+    def extender(self, bloque) -> 'AcumuladorCovarianzas':
+        """
+        Incorpora un bloque de filas
+        
+        Args:
+            bloque: Lista de p columnas (mismo tamaño) o ndarray filas × p
+        """
+        return self.combinar(self._desde_bloque(bloque))
+
+    def combinar(self, otro: 'AcumuladorCovarianzas') -> 'AcumuladorCovarianzas':
+        """Fusiona otro acumulador con las mismas columnas (fórmulas de Chan)."""
+        if otro.p != self.p:
+            raise ValueError("Sólo se pueden combinar acumuladores con las mismas columnas")
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            # Copias: las fusiones siguientes no deben modificar a `otro`
+            self.n = otro.n
+            if np is not None:
+                self.medias, self.comomentos = np.array(otro.medias), np.array(otro.comomentos)
+            else:
+                self.medias = list(otro.medias)
+                self.comomentos = [fila[:] for fila in otro.comomentos]
+            return self
+        na, nb = self.n, otro.n
+        n = na + nb
+        factor = na * nb / n
+        if np is not None:
+            delta = np.asarray(otro.medias) - self.medias
+            self.comomentos = self.comomentos + otro.comomentos + np.outer(delta, delta) * factor
+            self.medias = self.medias + delta * (nb / n)
+        else:
+            delta = [mb - ma for ma, mb in zip(self.medias, otro.medias)]
+            for fila, fila_otro, di in zip(self.comomentos, otro.comomentos, delta):
+                for j, dj in enumerate(delta):
+                    fila[j] += fila_otro[j] + di * dj * factor
+            self.medias = [ma + d * nb / n for ma, d in zip(self.medias, delta)]
+        self.n = n
+        return self
+
+    def covarianzas(self, muestral: bool = True) -> List[List[float]]:
+        """Matriz de covarianzas p × p."""
+        divisor = self.n - 1 if muestral else self.n
+        if np is not None:
+            return (self.comomentos / divisor).tolist()
+        return [[c / divisor for c in fila] for fila in self.comomentos]
+
+    def correlaciones(self) -> List[List[float]]:
+        """Matriz de correlaciones de Pearson (nan si una columna tiene d.s. 0)."""
+        if np is not None:
+            escala = np.sqrt(np.diag(self.comomentos))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                matriz = self.comomentos / np.outer(escala, escala)
+            ceros = escala == 0
+            matriz[ceros, :] = np.nan
+            matriz[:, ceros] = np.nan
+            return matriz.tolist()
+        escala = [math.sqrt(self.comomentos[i][i]) for i in range(self.p)]
+        return [[c / (ei * ej) if ei and ej else float('nan') for c, ej in zip(fila, escala)]
+                for fila, ei in zip(self.comomentos, escala)]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(p={self.p}, n={self.n})"
+
+
+class SketchKLL:
+    """
+    Sketch KLL (Karnin-Lang-Liberty) para cuantiles aproximados
+    
+    Usa memoria acotada, O(k) valores más O(log(n/k)) niveles, sin
+    importar cuántos datos procese. Los sketches construidos por separado
+    (p. ej. en distintos trabajadores) se pueden combinar. El cuantil
+    devuelto tiene un error de rango normalizado de aproximadamente
+    error_rango() (≈1.3% con k=200, ≈0.3% con k=1000); el mínimo y el
+    máximo son exactos.
+    """
+    
+    _C = 2 / 3
+    _MAGICO = b'KLL'
+    _VERSION = 1
+    
+    def __init__(self, k: int = 200, semilla=None):
+        """
+        Args:
+            k: Parámetro de precisión; más grande = más exacto y más memoria
+            semilla: Semilla del generador aleatorio de las compactaciones
+        """
+        if k < 8:
+            raise ValueError("El parámetro k del sketch debe ser al menos 8")
+        self.k = k
+        self.n = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self._compactores = [[]]
+        self._tamano = 0
+        self._azar = random.Random(semilla)
+        self._actualizar_capacidad()
+    
+    def _capacidad(self, altura: int) -> int:
+        """Capacidad del compactor de un nivel (decrece geométricamente hacia abajo)."""
+        profundidad = len(self._compactores) - altura - 1
+        return int(math.ceil(self.k * self._C ** profundidad)) + 1
+    
+    def _actualizar_capacidad(self):
+        self._capacidad_max = sum(self._capacidad(h) for h in range(len(self._compactores)))
+    
+    def _comprimir(self):
+        """Compacta niveles llenos hasta que el tamaño vuelva a estar acotado."""
+        while self._tamano >= self._capacidad_max:
+            for altura, compactor in enumerate(self._compactores):
+                if len(compactor) >= self._capacidad(altura):
+                    if altura + 1 == len(self._compactores):
+                        self._compactores.append([])
+                        self._actualizar_capacidad()
+                    # Ordenar y promover uno de cada dos valores (con peso doble)
+                    compactor.sort()
+                    resto = [compactor.pop()] if len(compactor) % 2 else []
+                    desplazamiento = self._azar.randint(0, 1)
+                    self._compactores[altura + 1].extend(compactor[desplazamiento::2])
+                    self._tamano -= len(compactor) // 2
+                    compactor[:] = resto
+                    break
+    
+    def agregar(self, x: float) -> 'SketchKLL':
+        """Incorpora un valor al sketch."""
+        x = float(x)
+        self._compactores[0].append(x)
+        self.n += 1
+        self._tamano += 1
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+        if self._tamano >= self._capacidad_max:
+            self._comprimir()
+        return self
+    
+    def extender(self, valores) -> 'SketchKLL':
+        """Incorpora todos los valores de un iterable, por bloques."""
+        iterador = iter(valores)
+        while True:
+            bloque = [float(x) for x in islice(iterador, max(1, self._capacidad_max - self._tamano))]
+            if not bloque:
+                return self
+            self._compactores[0].extend(bloque)
+            self.n += len(bloque)
+            self._tamano += len(bloque)
+            self.minimo = min(self.minimo, min(bloque))
+            self.maximo = max(self.maximo, max(bloque))
+            self._comprimir()
+    
+    def combinar(self, otro: 'SketchKLL') -> 'SketchKLL':
+        """Fusiona otro sketch con el mismo k en este."""
+        if otro.k != self.k:
+            raise ValueError("Sólo se pueden combinar sketches con el mismo k")
+        while len(self._compactores) < len(otro._compactores):
+            self._compactores.append([])
+        for compactor, compactor_otro in zip(self._compactores, otro._compactores):
+            compactor.extend(compactor_otro)
+        self.n += otro.n
+        self._tamano += otro._tamano
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self._actualizar_capacidad()
+        self._comprimir()
+        return self
+    
+    def _ponderados(self) -> Tuple[List[float], List[int]]:
+        """Valores retenidos ordenados junto con su peso acumulado."""
+        pares = sorted((x, 1 << altura)
+                       for altura, compactor in enumerate(self._compactores)
+                       for x in compactor)
+        valores, acumulados = [], []
+        total = 0
+        for x, peso in pares:
+            total += peso
+            valores.append(x)
+            acumulados.append(total)
+        return valores, acumulados
+    
+    def cuantiles(self, qs: List[float]) -> List[float]:
+        """
+        Calcula cuantiles aproximados
+        
+        Args:
+            qs: Cuantiles a calcular (0-1)
+        """
+        if self.n == 0:
+            raise ValueError("El sketch está vacío")
+        valores, acumulados = self._ponderados()
+        total = acumulados[-1]
+        resultado = []
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("El cuantil debe estar entre 0 y 1")
+            if q == 0:
+                resultado.append(self.minimo)
+            elif q == 1:
+                resultado.append(self.maximo)
+            else:
+                indice = bisect_left(acumulados, q * total)
+                resultado.append(valores[min(indice, len(valores) - 1)])
+        return resultado
+    
+    def cuantil(self, q: float) -> float:
+        """Calcula un cuantil aproximado (0-1)."""
+        return self.cuantiles([q])[0]
+    
+    def rango(self, x: float) -> float:
+        """Fracción aproximada de los datos que son menores o iguales que x."""
+        if self.n == 0:
+            raise ValueError("El sketch está vacío")
+        valores, acumulados = self._ponderados()
+        indice = bisect_right(valores, x)
+        return acumulados[indice - 1] / acumulados[-1] if indice else 0.0
+    
+    def error_rango(self) -> float:
+        """
+        Error de rango normalizado esperado (con ~99% de confianza)
+        Aproximación empírica para KLL: 2.296 / k^0.9723.
+        """
+        return 2.296 / self.k ** 0.9723
+    
+    def serializar(self) -> bytes:
+        """Serializa el sketch en un formato binario compacto y versionado."""
+        partes = [struct.pack('<3sBIQddI', self._MAGICO, self._VERSION, self.k,
+                              self.n, self.minimo, self.maximo, len(self._compactores))]
+        for compactor in self._compactores:
+            partes.append(struct.pack('<I', len(compactor)))
+            partes.append(struct.pack(f'<{len(compactor)}d', *compactor))
+        return b''.join(partes)
+    
+    @classmethod
+    def deserializar(cls, datos: bytes, semilla=None) -> 'SketchKLL':
+        """Reconstruye un sketch a partir de serializar()."""
+        encabezado = struct.Struct('<3sBIQddI')
+        magico, version, k, n, minimo, maximo, niveles = encabezado.unpack_from(datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de sketch KLL no reconocido")
+        sketch = cls(k, semilla)
+        sketch.n, sketch.minimo, sketch.maximo = n, minimo, maximo
+        sketch._compactores = []
+        posicion = encabezado.size
+        for _ in range(niveles):
+            (cantidad,) = struct.unpack_from('<I', datos, posicion)
+            posicion += 4
+            sketch._compactores.append(list(struct.unpack_from(f'<{cantidad}d', datos, posicion)))
+            posicion += 8 * cantidad
+        sketch._tamano = sum(len(c) for c in sketch._compactores)
+        sketch._actualizar_capacidad()
+        return sketch
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}(k={self.k}, n={self.n}, retenidos={self._tamano})"
+
+
+def _hash_estable(valor) -> int:
+    """
+    Hash de 128 bits estable entre procesos y ejecuciones
+    hash() de str está aleatorizado por proceso, por lo que no sirve para
+    sketches que se construyen en distintos trabajadores y luego se combinan.
+    """
+    if isinstance(valor, str):
+        contenido = b's' + valor.encode('utf-8', 'surrogatepass')
+    elif isinstance(valor, bytes):
+        contenido = b'b' + valor
+    else:
+        contenido = type(valor).__name__.encode() + b':' + repr(valor).encode()
+    return int.from_bytes(blake2b(contenido, digest_size=16).digest(), 'little')
+
+
+class SketchCountMin:
+    """
+    Sketch Count-Min para frecuencias aproximadas en memoria acotada
+    
+    Garantía: la estimación nunca es menor que la frecuencia real y, con
+    probabilidad 1 - delta, la excede en a lo sumo epsilon * N (N = total
+    de datos procesados). Usa ancho = ⌈e/epsilon⌉ y profundidad =
+    ⌈ln(1/delta)⌉ contadores. Sketches con las mismas dimensiones se
+    combinan sumando sus tablas.
+    """
+    
+    _MAGICO = b'CMS'
+    _VERSION = 1
+    
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        """
+        Args:
+            epsilon: Error máximo relativo al total de datos
+            delta: Probabilidad de superar ese error
+        """
+        if not (0 < epsilon < 1 and 0 < delta < 1):
+            raise ValueError("epsilon y delta deben estar entre 0 y 1")
+        self.ancho = int(math.ceil(math.e / epsilon))
+        self.profundidad = int(math.ceil(math.log(1 / delta)))
+        self.n = 0
+        self._tabla = [array('Q', bytes(8 * self.ancho)) for _ in range(self.profundidad)]
+    
+    @property
+    def epsilon(self) -> float:
+        """Error relativo garantizado por las dimensiones del sketch."""
+        return math.e / self.ancho
+    
+    def _posiciones(self, h: int):
+        """Columna de cada fila por doble hashing (h1 + i*h2) de un hash de 128 bits."""
+        h1, h2 = h & 0xFFFFFFFFFFFFFFFF, (h >> 64) | 1
+        return [(h1 + i * h2) % self.ancho for i in range(self.profundidad)]
+    
+    def _agregar_hash(self, h: int, cantidad: int):
+        for fila, columna in zip(self._tabla, self._posiciones(h)):
+            fila[columna] += cantidad
+        self.n += cantidad
+    
+    def agregar(self, valor, cantidad: int = 1) -> 'SketchCountMin':
+        """Suma `cantidad` ocurrencias de un valor."""
+        self._agregar_hash(_hash_estable(valor), cantidad)
+        return self
+    
+    def agregar_conteos(self, conteos) -> 'SketchCountMin':
+        """Suma pares (valor, cantidad), p. ej. los de un Counter de un bloque."""
+        for valor, cantidad in conteos:
+            self.agregar(valor, cantidad)
+        return self
+    
+    def estimar(self, valor) -> int:
+        """Frecuencia estimada (cota superior) de un valor."""
+        posiciones = self._posiciones(_hash_estable(valor))
+        return min(fila[columna] for fila, columna in zip(self._tabla, posiciones))
+    
+    def error_maximo(self) -> float:
+        """Sobreestimación máxima (con probabilidad 1 - delta): epsilon * N."""
+        return self.epsilon * self.n
+    
+    def combinar(self, otro: 'SketchCountMin') -> 'SketchCountMin':
+        """Suma otro sketch con las mismas dimensiones."""
+        if (otro.ancho, otro.profundidad) != (self.ancho, self.profundidad):
+            raise ValueError("Sólo se pueden combinar sketches con las mismas dimensiones")
+        for fila, fila_otro in zip(self._tabla, otro._tabla):
+            for columna, cantidad in enumerate(fila_otro):
+                if cantidad:
+                    fila[columna] += cantidad
+        self.n += otro.n
+        return self
+    
+    def serializar(self) -> bytes:
+        """Serializa el sketch en un formato binario compacto y versionado."""
+        encabezado = struct.pack('<3sBIIQ', self._MAGICO, self._VERSION,
+                                 self.ancho, self.profundidad, self.n)
+        return encabezado + b''.join(fila.tobytes() for fila in self._tabla)
+    
+    @classmethod
+    def deserializar(cls, datos: bytes) -> 'SketchCountMin':
+        """Reconstruye un sketch a partir de serializar()."""
+        encabezado = struct.Struct('<3sBIIQ')
+        magico, version, ancho, profundidad, n = encabezado.unpack_from(datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de sketch Count-Min no reconocido")
+        sketch = cls.__new__(cls)
+        sketch.ancho, sketch.profundidad, sketch.n = ancho, profundidad, n
+        sketch._tabla = []
+        posicion = encabezado.size
+        for _ in range(profundidad):
+            fila = array('Q')
+            fila.frombytes(datos[posicion:posicion + 8 * ancho])
+            sketch._tabla.append(fila)
+            posicion += 8 * ancho
+        return sketch
+    
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(ancho={self.ancho}, "
+                f"profundidad={self.profundidad}, n={self.n})")
+
+
+class SketchMisraGries:
+    """
+    Resumen Misra-Gries de los elementos más frecuentes (heavy hitters)
+    
+    Guarda a lo sumo k contadores. Todo valor con frecuencia mayor que
+    N/(k+1) está garantizado entre los candidatos, y cada contador
+    subestima la frecuencia real en a lo sumo error_maximo() ≤ N/(k+1).
+    Resúmenes de distintas particiones se combinan sumando contadores y
+    volviendo a reducir (Agarwal et al., "Mergeable summaries").
+    """
+    
+    def __init__(self, k: int = 100):
+        """
+        Args:
+            k: Número de contadores (candidatos) a conservar
+        """
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+        self.k = k
+        self.n = 0
+        self._contadores = {}
+        self._descontado = 0
+    
+    def _reducir(self):
+        """Resta el (k+1)-ésimo mayor contador a todos y descarta los no positivos."""
+        umbral = nlargest(self.k + 1, self._contadores.values())[-1]
+        self._descontado += umbral
+        self._contadores = {valor: cantidad - umbral
+                            for valor, cantidad in self._contadores.items()
+                            if cantidad > umbral}
+    
+    def agregar(self, valor, cantidad: int = 1) -> 'SketchMisraGries':
+        """Suma `cantidad` ocurrencias de un valor."""
+        self._contadores[valor] = self._contadores.get(valor, 0) + cantidad
+        self.n += cantidad
+        # Se reduce por lotes (al doble de k) para que el costo amortizado sea O(1)
+        if len(self._contadores) > 2 * self.k:
+            self._reducir()
+        return self
+    
+    def agregar_conteos(self, conteos) -> 'SketchMisraGries':
+        """Suma pares (valor, cantidad), p. ej. los de un Counter de un bloque."""
+        for valor, cantidad in conteos:
+            self.agregar(valor, cantidad)
+        return self
+    
+    def combinar(self, otro: 'SketchMisraGries') -> 'SketchMisraGries':
+        """Fusiona el resumen de otra partición."""
+        for valor, cantidad in otro._contadores.items():
+            self._contadores[valor] = self._contadores.get(valor, 0) + cantidad
+        self.n += otro.n
+        self._descontado += otro._descontado
+        if len(self._contadores) > self.k:
+            self._reducir()
+        return self
+    
+    def candidatos(self) -> Dict:
+        """Retorna {valor: conteo (cota inferior)} de los candidatos, de mayor a menor."""
+        contadores = self._contadores
+        if len(contadores) > self.k:
+            self._reducir()
+            contadores = self._contadores
+        return dict(sorted(contadores.items(), key=lambda par: par[1], reverse=True))
+    
+    def error_maximo(self) -> int:
+        """Subestimación máxima de cualquier contador."""
+        return self._descontado
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}(k={self.k}, n={self.n})"
+
+
+class SketchHyperLogLog:
+    """
+    Estimador HyperLogLog del número de valores distintos
+    
+    Usa m = 2**precision registros de un byte; el error relativo típico es
+    1.04/√m (≈0.8% con precision=14, en 16 KB). La cardinalidad se estima
+    con el estimador mejorado de Ertl (2017), que a partir del histograma
+    de los registros corrige tanto los registros vacíos como los saturados
+    y no tiene el sesgo del estimador original al pasar de conteo lineal
+    a la media armónica (alrededor de 2.5·m). Sketches con la misma
+    precisión se combinan tomando el máximo de cada registro.
+    """
+    
+    _MAGICO = b'HLL'
+    _VERSION = 1
+    
+    def __init__(self, precision: int = 14):
+        """
+        Args:
+            precision: Bits del hash que eligen el registro (4 a 18)
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("La precisión debe estar entre 4 y 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self._registros = bytearray(self.m)
+    
+    def _agregar_hash(self, h: int):
+        h &= 0xFFFFFFFFFFFFFFFF
+        indice = h >> (64 - self.precision)
+        resto = h & ((1 << (64 - self.precision)) - 1)
+        # Posición del primer bit 1 en los 64 - precision bits restantes
+        rango = 64 - self.precision - resto.bit_length() + 1
+        if rango > self._registros[indice]:
+            self._registros[indice] = rango
+    
+    def agregar(self, valor) -> 'SketchHyperLogLog':
+        """Registra un valor."""
+        self._agregar_hash(_hash_estable(valor))
+        return self
+    
+    def extender(self, valores) -> 'SketchHyperLogLog':
+        """Registra todos los valores de un iterable (p. ej. un flujo)."""
+        for valor in valores:
+            self._agregar_hash(_hash_estable(valor))
+        return self
+    
+    @staticmethod
+    def _sigma(x: float) -> float:
+        """Serie σ(x) = x + Σ x^(2^k)·2^(k-1) de la corrección de registros vacíos."""
+        if x == 1:
+            return math.inf
+        y, z = 1.0, x
+        while True:
+            x *= x
+            anterior = z
+            z += x * y
+            y += y
+            if z == anterior:
+                return z
+    
+    @staticmethod
+    def _tau(x: float) -> float:
+        """Serie τ(x) de la corrección de registros saturados."""
+        if x == 0 or x == 1:
+            return 0.0
+        y, z = 1.0, 1 - x
+        while True:
+            x = math.sqrt(x)
+            anterior = z
+            y *= 0.5
+            z -= (1 - x) ** 2 * y
+            if z == anterior:
+                return z / 3
+    
+    def cardinalidad(self) -> int:
+        """Número estimado de valores distintos (estimador mejorado de Ertl)."""
+        m = self.m
+        q = 64 - self.precision
+        histograma = [0] * (q + 2)
+        for valor, cantidad in Counter(self._registros).items():
+            histograma[valor] += cantidad
+        if histograma[0] == m:
+            return 0
+        z = m * self._tau(1 - histograma[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + histograma[k])
+        z += m * self._sigma(histograma[0] / m)
+        return int(round(m * m / (2 * math.log(2) * z)))
+    
+    def error_relativo(self) -> float:
+        """Error estándar relativo de cardinalidad(): 1.04/√m."""
+        return 1.04 / math.sqrt(self.m)
+    
+    def combinar(self, otro: 'SketchHyperLogLog') -> 'SketchHyperLogLog':
+        """Une otro sketch con la misma precisión."""
+        if otro.precision != self.precision:
+            raise ValueError("Sólo se pueden combinar sketches con la misma precisión")
+        self._registros = bytearray(map(max, self._registros, otro._registros))
+        return self
+    
+    def serializar(self) -> bytes:
+        """Serializa el sketch en un formato binario compacto y versionado."""
+        return struct.pack('<3sBB', self._MAGICO, self._VERSION, self.precision) + bytes(self._registros)
+    
+    @classmethod
+    def deserializar(cls, datos: bytes) -> 'SketchHyperLogLog':
+        """Reconstruye un sketch a partir de serializar()."""
+        magico, version, precision = struct.unpack_from('<3sBB', datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de sketch HyperLogLog no reconocido")
+        sketch = cls(precision)
+        sketch._registros[:] = datos[5:5 + sketch.m]
+        return sketch
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}(precision={self.precision})"
+
+
+class HistogramaHDR:
+    """
+    Histograma de rango dinámico alto (estilo HDR) con error relativo acotado
+    
+    Las cubetas crecen geométricamente con razón γ = (1 + α)/(1 - α): la
+    cubeta i cubre (γ^(i-1), γ^i] y se representa por 2γ^i/(γ + 1), por lo
+    que cualquier percentil se estima con error relativo ≤ α. Sólo se
+    guardan las cubetas ocupadas (O(log(max/min)/α) en el peor caso), se
+    llena en una pasada, se actualiza valor a valor y dos histogramas con
+    el mismo α se combinan sumando cubetas. Admite ceros y negativos.
+    """
+    
+    def __init__(self, error_relativo: float = 0.01):
+        """
+        Args:
+            error_relativo: Error relativo máximo α de los percentiles (0-1),
+                respecto del estadístico de orden que corresponde a cada uno
+        """
+        if not 0 < error_relativo < 1:
+            raise ValueError("El error relativo debe estar entre 0 y 1")
+        self.error_relativo = error_relativo
+        self._gamma = (1 + error_relativo) / (1 - error_relativo)
+        self._log_gamma = math.log(self._gamma)
+        self._positivos = Counter()
+        self._negativos = Counter()
+        self._ceros = 0
+        self.n = 0
+        self.suma = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+    
+    def _indice(self, x: float) -> int:
+        return math.ceil(math.log(x) / self._log_gamma)
+    
+    def _representante(self, indice: int) -> float:
+        return 2 * self._gamma ** indice / (self._gamma + 1)
+    
+    def agregar(self, x: float, cantidad: int = 1) -> 'HistogramaHDR':
+        """Incorpora `cantidad` ocurrencias de un valor."""
+        x = float(x)
+        if not math.isfinite(x):
+            raise ValueError("Los valores deben ser finitos")
+        if x > 0:
+            self._positivos[self._indice(x)] += cantidad
+        elif x < 0:
+            self._negativos[self._indice(-x)] += cantidad
+        else:
+            self._ceros += cantidad
+        self.n += cantidad
+        self.suma += x * cantidad
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+        return self
+    
+    def extender(self, valores) -> 'HistogramaHDR':
+        """Incorpora todos los valores de un iterable (vectorizado si es un ndarray)."""
+        if np is not None and isinstance(valores, np.ndarray):
+            arreglo = valores.astype(float, copy=False).ravel()
+            if arreglo.size == 0:
+                return self
+            if not np.isfinite(arreglo).all():
+                raise ValueError("Los valores deben ser finitos")
+            for signo, cubetas in ((1, self._positivos), (-1, self._negativos)):
+                magnitudes = arreglo[arreglo * signo > 0] * signo
+                indices, cantidades = np.unique(
+                    np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64),
+                    return_counts=True)
+                cubetas.update(dict(zip(indices.tolist(), cantidades.tolist())))
+            self._ceros += int((arreglo == 0).sum())
+            self.n += int(arreglo.size)
+            self.suma += float(arreglo.sum())
+            self.minimo = min(self.minimo, float(arreglo.min()))
+            self.maximo = max(self.maximo, float(arreglo.max()))
+            return self
+        for x in valores:
+            self.agregar(x)
+        return self
+    
+    def combinar(self, otro: 'HistogramaHDR') -> 'HistogramaHDR':
+        """Suma las cubetas de otro histograma con el mismo error relativo."""
+        if otro.error_relativo != self.error_relativo:
+            raise ValueError("Sólo se pueden combinar histogramas con el mismo error relativo")
+        self._positivos.update(otro._positivos)
+        self._negativos.update(otro._negativos)
+        self._ceros += otro._ceros
+        self.n += otro.n
+        self.suma += otro.suma
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+    
+    def cubetas(self) -> List[Tuple[float, float, int]]:
+        """Cubetas ocupadas en orden: (límite inferior, límite superior, cantidad)."""
+        gamma = self._gamma
+        resultado = [(-gamma ** i, -gamma ** (i - 1), self._negativos[i])
+                     for i in sorted(self._negativos, reverse=True)]
+        if self._ceros:
+            resultado.append((0.0, 0.0, self._ceros))
+        resultado.extend((gamma ** (i - 1), gamma ** i, self._positivos[i])
+                         for i in sorted(self._positivos))
+        return resultado
+    
+    def _valores_ordenados(self):
+        """Pares (representante, cantidad) en orden creciente."""
+        for i in sorted(self._negativos, reverse=True):
+            yield -self._representante(i), self._negativos[i]
+        if self._ceros:
+            yield 0.0, self._ceros
+        for i in sorted(self._positivos):
+            yield self._representante(i), self._positivos[i]
+    
+    def percentiles(self, ps: List[float]) -> List[float]:
+        """Percentiles (0-100) con error relativo ≤ error_relativo."""
+        if self.n == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        for p in ps:
+            if not 0 <= p <= 100:
+                raise ValueError("El percentil debe estar entre 0 y 100")
+        # Rango objetivo de cada percentil, recorriendo las cubetas una vez
+        objetivos = sorted((p / 100 * (self.n - 1), k) for k, p in enumerate(ps))
+        resultado = [0.0] * len(ps)
+        acumulado = 0
+        pendientes = iter(objetivos)
+        objetivo = next(pendientes, None)
+        for valor, cantidad in self._valores_ordenados():
+            acumulado += cantidad
+            while objetivo is not None and objetivo[0] < acumulado:
+                resultado[objetivo[1]] = min(max(valor, self.minimo), self.maximo)
+                objetivo = next(pendientes, None)
+            if objetivo is None:
+                break
+        # Los extremos se conocen exactamente
+        return [self.minimo if p == 0 else self.maximo if p == 100 else valor
+                for p, valor in zip(ps, resultado)]
+    
+    def percentil(self, p: float) -> float:
+        """Percentil p-ésimo (0-100) aproximado."""
+        return self.percentiles([p])[0]
+    
+    def media(self) -> float:
+        """Media exacta de los valores incorporados."""
+        if self.n == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        return self.suma / self.n
+    
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(error_relativo={self.error_relativo}, "
+                f"n={self.n}, cubetas={len(self._positivos) + len(self._negativos)})")
+
+
+def _seleccionar_estadisticos_orden(valores, posiciones) -> Dict[int, float]:
+    """
+    Encuentra varios estadísticos de orden sin ordenar todos los datos
+    
+    Quickselect múltiple con partición en tres vías: cada segmento sólo se
+    sigue particionando si contiene alguna de las posiciones buscadas, por
+    lo que el costo esperado es O(n). Como en introselect, si la recursión
+    se degrada se recurre a ordenar el segmento.
+    
+    Args:
+        valores: Secuencia de números (no se modifica)
+        posiciones: Índices (base 0) de los estadísticos de orden buscados
+    """
+    resultado = {}
+    profundidad_max = 2 * max(1, len(valores)).bit_length()
+    pendientes = [(valores, sorted(set(posiciones)), 0, profundidad_max)]
+    
+    while pendientes:
+        segmento, buscadas, desplazamiento, profundidad = pendientes.pop()
+        tamano = len(segmento)
+        if tamano <= 32 or profundidad == 0:
+            ordenado = sorted(segmento)
+            for k in buscadas:
+                resultado[k] = ordenado[k - desplazamiento]
+            continue
+        
+        # Pivote: mediana de tres muestras
+        pivote = sorted((segmento[0], segmento[tamano // 2], segmento[-1]))[1]
+        menores = [x for x in segmento if x < pivote]
+        mayores = [x for x in segmento if x > pivote]
+        limite_menores = desplazamiento + len(menores)
+        limite_iguales = desplazamiento + tamano - len(mayores)
+        
+        en_menores = [k for k in buscadas if k < limite_menores]
+        en_mayores = [k for k in buscadas if k >= limite_iguales]
+        for k in buscadas:
+            if limite_menores <= k < limite_iguales:
+                resultado[k] = pivote
+        if en_menores:
+            pendientes.append((menores, en_menores, desplazamiento, profundidad - 1))
+        if en_mayores:
+            pendientes.append((mayores, en_mayores, limite_iguales, profundidad - 1))
+    
+    return resultado
+
+
+def _interpolar_percentiles(n: int, ps: List[float], estadisticos_orden) -> List[float]:
+    """
+    Percentiles por interpolación lineal entre estadísticos de orden
+    
+    Args:
+        n: Tamaño de la muestra
+        ps: Percentiles (0-100), ya validados
+        estadisticos_orden: Función que recibe una lista de posiciones y
+            retorna {posición: k-ésimo menor valor}
+    """
+    posiciones = []
+    for p in ps:
+        if p == 0:
+            posiciones.append((0, 0, 0.0))
+        elif p == 100:
+            posiciones.append((n - 1, n - 1, 0.0))
+        else:
+            # Método de interpolación lineal
+            indice = (p / 100) * (n - 1)
+            indice_inferior = int(indice)
+            fraccion = indice - indice_inferior
+            indice_superior = indice_inferior + 1 if fraccion else indice_inferior
+            posiciones.append((indice_inferior, indice_superior, fraccion))
+    
+    orden = estadisticos_orden(
+        [k for inferior, superior, _ in posiciones for k in (inferior, superior)])
+    
+    return [orden[inferior] + fraccion * (orden[superior] - orden[inferior])
+            for inferior, superior, fraccion in posiciones]
+
+
+# Formatos binarios soportados por desde_archivo (orden de bytes nativo)
+_FORMATOS_BINARIOS = {'f64': 'd', 'f32': 'f', 'i32': 'i', 'i64': 'q'}
+_CODIGOS_NUMERICOS = 'bBhHiIlLqQfd'
+
+
+def _es_buffer_numerico(datos) -> bool:
+    """Indica si los datos son un buffer tipado cuyos elementos ya son números."""
+    if isinstance(datos, memoryview):
+        return datos.ndim == 1 and datos.format in _CODIGOS_NUMERICOS
+    if isinstance(datos, array):
+        return datos.typecode in _CODIGOS_NUMERICOS
+    return False
+
+
+def _es_secuencia_numerica(datos) -> bool:
+    """Indica si los datos son una lista o tupla cuyos elementos son int o float."""
+    return isinstance(datos, (list, tuple)) and set(map(type, datos)) <= {int, float}
+
+
+def _mapear_binario(ruta: str, formato: str) -> memoryview:
+    """
+    Mapea en memoria un archivo binario de valores y lo expone como
+    memoryview tipado, sin leerlo ni crear objetos por elemento. El
+    memoryview mantiene vivo el mapeo mientras se use.
+    """
+    if formato not in _FORMATOS_BINARIOS:
+        raise ValueError(f"Formato debe ser 'csv' o uno de {sorted(_FORMATOS_BINARIOS)}")
+    with open(ruta, 'rb') as archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        mapeo = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapeo).cast(_FORMATOS_BINARIOS[formato])
+
+
+def _buffer_little_endian(datos, codigo: str) -> memoryview:
+    """
+    Expone un tramo de bytes de una instantánea (little-endian) como
+    memoryview tipado; sólo se copia en plataformas big-endian.
+    """
+    vista = memoryview(datos).cast('B').cast(codigo)
+    if sys.byteorder == 'little':
+        return vista
+    valores = array(codigo, vista)
+    valores.byteswap()
+    return memoryview(valores)
+
+
+def _bytes_little_endian(valores, codigo: str) -> bytes:
+    """Bytes little-endian de una secuencia numérica (inverso de _buffer_little_endian)."""
+    if np is not None and isinstance(valores, np.ndarray):
+        return np.ascontiguousarray(valores, dtype='<' + codigo).tobytes()
+    buffer = array(codigo, valores)
+    if sys.byteorder != 'little':
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def _codificar_categorias(bloques) -> Tuple[List, array]:
+    """
+    Codificación por diccionario: retorna (categorías en orden de aparición,
+    array('I') con el código de cada dato). Recibe un iterable de bloques
+    para poder codificar un archivo sin materializar la lista de str.
+    """
+    indices = {}
+    codigos = array('I')
+    for bloque in bloques:
+        codigos.extend([indices.setdefault(valor, len(indices)) for valor in bloque])
+    return list(indices), codigos
+
+
+def _contar_codigos(codigos, cantidad_categorias: int) -> List[int]:
+    """Conteo por código (equivalente a bincount) de un arreglo de códigos enteros."""
+    if np is not None:
+        return np.bincount(np.asarray(codigos), minlength=cantidad_categorias).tolist()
+    conteos = [0] * cantidad_categorias
+    for codigo, cantidad in Counter(codigos).items():
+        conteos[codigo] = cantidad
+    return conteos
+
+
+def _leer_columna_csv(ruta: str, columna: Union[int, str], delimitador: str,
+                      encabezado: bool, tamano_bloque: int):
+    """
+    Lee una columna de un CSV en bloques de `tamano_bloque` filas
+    
+    Genera listas con los textos de la columna, de modo que el archivo
+    nunca se carga completo en memoria.
+    """
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        lector = csv.reader(archivo, delimiter=delimitador)
+        indice = columna
+        if encabezado:
+            nombres = next(lector, [])
+            if isinstance(columna, str):
+                if columna not in nombres:
+                    raise ValueError(f"La columna '{columna}' no existe en el archivo")
+                indice = nombres.index(columna)
+        elif isinstance(columna, str):
+            raise ValueError("Para elegir la columna por nombre se requiere encabezado")
+        while True:
+            bloque = [fila[indice] for fila in islice(lector, tamano_bloque)]
+            if not bloque:
+                return
+            yield bloque
+
+
+def _dividir_en_bloques(n: int, partes: int) -> List[Tuple[int, int]]:
+    """Divide el rango [0, n) en hasta `partes` bloques contiguos de tamaño similar."""
+    partes = max(1, min(partes, n))
+    base, extra = divmod(n, partes)
+    limites = []
+    inicio = 0
+    for i in range(partes):
+        fin = inicio + base + (1 if i < extra else 0)
+        limites.append((inicio, fin))
+        inicio = fin
+    return limites
+
+
+def _momentos_de_bloque(bloque) -> AcumuladorMomentos:
+    """Momentos parciales de un bloque (se ejecuta en un proceso trabajador)."""
+    if np is not None and isinstance(bloque, np.ndarray):
+        return AcumuladorMomentos.desde_arreglo(bloque)
+    return AcumuladorMomentos.desde_secuencia(bloque)
+
+
+def _comomentos_de_bloque(bloque_x, bloque_y) -> AcumuladorComomentos:
+    """Co-momentos parciales de un bloque (se ejecuta en un proceso trabajador)."""
+    if np is not None and isinstance(bloque_x, np.ndarray):
+        return AcumuladorComomentos.desde_arreglos(bloque_x, bloque_y)
+    return AcumuladorComomentos().extender(bloque_x, bloque_y)
+
+
+_TAMANO_BLOQUE_COMPENSADO = 65536
+
+
+def _bloques_compensados(*columnas):
+    """
+    Recorre columnas paralelas en bloques de _TAMANO_BLOQUE_COMPENSADO
+    Retorna (vectorizado, generador de tuplas de bloques); los bloques de
+    arreglos NumPy se operan vectorizados y los demás como secuencias.
+    """
+    vectorizado = np is not None and all(isinstance(c, np.ndarray) for c in columnas)
+    n = len(columnas[0])
+    bloques = (tuple(c[inicio:inicio + _TAMANO_BLOQUE_COMPENSADO] for c in columnas)
+               for inicio in range(0, n, _TAMANO_BLOQUE_COMPENSADO))
+    return vectorizado, bloques
+
+
+def _suma_compensada(parciales) -> float:
+    """Suma con math.fsum (redondeo correcto) valores o listas de NumPy."""
+    if np is not None and isinstance(parciales, np.ndarray):
+        parciales = parciales.tolist()
+    return math.fsum(parciales)
+
+
+def _momentos_compensados(valores) -> AcumuladorMomentos:
+    """
+    Momentos con sumas compensadas en dos pasadas por bloques
+    
+    La media sale de math.fsum y las potencias de los desvíos se suman con
+    math.fsum dentro de cada bloque y de nuevo entre bloques. El error de
+    la media redondeada se corrige con el residuo Σ(x - x̄)/n, así los
+    momentos no pierden precisión aunque los datos tengan un desplazamiento
+    grande (por ejemplo marcas de tiempo en nanosegundos).
+    """
+    acumulador = AcumuladorMomentos()
+    n = len(valores)
+    if n == 0:
+        return acumulador
+    _, bloques = _bloques_compensados(valores)
+    media = math.fsum([_suma_compensada(bloque) for bloque, in bloques]) / n
+    
+    vectorizado, bloques = _bloques_compensados(valores)
+    parciales = ([], [], [], [])
+    minimo, maximo = math.inf, -math.inf
+    for bloque, in bloques:
+        if vectorizado:
+            desvios = bloque - media
+            cuadrados = desvios * desvios
+            potencias = (desvios, cuadrados, cuadrados * desvios, cuadrados * cuadrados)
+            minimo = min(minimo, float(bloque.min()))
+            maximo = max(maximo, float(bloque.max()))
+        else:
+            desvios = [x - media for x in bloque]
+            cuadrados = list(map(mul, desvios, desvios))
+            potencias = (desvios, cuadrados, list(map(mul, cuadrados, desvios)),
+                         list(map(mul, cuadrados, cuadrados)))
+            minimo = min(minimo, min(bloque))
+            maximo = max(maximo, max(bloque))
+        for parcial, potencia in zip(parciales, potencias):
+            parcial.append(_suma_compensada(potencia))
+    s1, s2, s3, s4 = (math.fsum(parcial) for parcial in parciales)
+    
+    # Momentos respecto de la media exacta x̄ + r, con r = Σ(x - x̄)/n
+    r = s1 / n
+    acumulador.n = n
+    acumulador.media = media + r
+    acumulador.m2 = s2 - n * r * r
+    acumulador.m3 = s3 - 3 * r * s2 + 2 * n * r ** 3
+    acumulador.m4 = s4 - 4 * r * s3 + 6 * r * r * s2 - 3 * n * r ** 4
+    acumulador.minimo, acumulador.maximo = minimo, maximo
+    return acumulador
+
+
+def _comomentos_compensados(datos_x, datos_y) -> AcumuladorComomentos:
+    """
+    Co-momentos con sumas compensadas en dos pasadas por bloques, con la
+    misma corrección del residuo de las medias que _momentos_compensados.
+    """
+    acumulador = AcumuladorComomentos()
+    n = len(datos_x)
+    if n == 0:
+        return acumulador
+    _, bloques = _bloques_compensados(datos_x, datos_y)
+    sumas = [(_suma_compensada(bx), _suma_compensada(by)) for bx, by in bloques]
+    media_x = math.fsum(s for s, _ in sumas) / n
+    media_y = math.fsum(s for _, s in sumas) / n
+    
+    vectorizado, bloques = _bloques_compensados(datos_x, datos_y)
+    parciales = ([], [], [], [], [])
+    for bloque_x, bloque_y in bloques:
+        if vectorizado:
+            desvios_x, desvios_y = bloque_x - media_x, bloque_y - media_y
+            productos = (desvios_x, desvios_y, desvios_x * desvios_x,
+                         desvios_y * desvios_y, desvios_x * desvios_y)
+        else:
+            desvios_x = [x - media_x for x in bloque_x]
+            desvios_y = [y - media_y for y in bloque_y]
+            productos = (desvios_x, desvios_y, list(map(mul, desvios_x, desvios_x)),
+                         list(map(mul, desvios_y, desvios_y)),
+                         list(map(mul, desvios_x, desvios_y)))
+        for parcial, producto in zip(parciales, productos):
+            parcial.append(_suma_compensada(producto))
+    sx, sy, sxx, syy, sxy = (math.fsum(parcial) for parcial in parciales)
+    
+    rx, ry = sx / n, sy / n
+    acumulador.n = n
+    acumulador.media_x, acumulador.media_y = media_x + rx, media_y + ry
+    acumulador.m2_x = sxx - n * rx * rx
+    acumulador.m2_y = syy - n * ry * ry
+    acumulador.c_xy = sxy - n * rx * ry
+    return acumulador
+
+
+def _rangos_promedio(valores):
+    """
+    Rangos (1..n) con un único argsort; los empates reciben el promedio
+    de los rangos que ocupan. Retorna un ndarray si NumPy está disponible.
+    """
+    if np is not None:
+        arreglo = np.asarray(valores, dtype=float)
+        orden = np.argsort(arreglo, kind='stable')
+        ordenados = arreglo[orden]
+        nuevo = np.r_[True, ordenados[1:] != ordenados[:-1]]
+        inicios = np.flatnonzero(np.r_[nuevo, True])
+        promedios = (inicios[:-1] + inicios[1:] + 1) / 2
+        rangos = np.empty(arreglo.size)
+        rangos[orden] = promedios[np.cumsum(nuevo) - 1]
+        return rangos
+    orden = sorted(range(len(valores)), key=valores.__getitem__)
+    rangos = [0.0] * len(valores)
+    inicio = 0
+    while inicio < len(orden):
+        fin = inicio + 1
+        while fin < len(orden) and valores[orden[fin]] == valores[orden[inicio]]:
+            fin += 1
+        promedio = (inicio + fin + 1) / 2
+        for k in range(inicio, fin):
+            rangos[orden[k]] = promedio
+        inicio = fin
+    return rangos
+
+
+def _pares_empatados(conteos) -> int:
+    """Σ t(t-1)/2 sobre los tamaños t de cada grupo de empate."""
+    return sum(t * (t - 1) // 2 for t in conteos)
+
+
+def _contar_inversiones(valores) -> int:
+    """
+    Pares i < j con valores[i] > valores[j], por merge sort de abajo hacia
+    arriba en O(n log n). En cada nivel se cuentan, para cada elemento de la
+    mitad derecha de un bloque, los de la mitad izquierda mayores que él.
+    """
+    n = len(valores)
+    inversiones = 0
+    ancho = 1
+    if np is not None:
+        # Rangos densos desplazados por bloque: un solo searchsorted por nivel
+        _, rangos = np.unique(np.asarray(valores), return_inverse=True)
+        actual = rangos.astype(np.int64)
+        posiciones = np.arange(n)
+        while ancho < n:
+            bloque = posiciones // (2 * ancho)
+            claves = bloque * n + actual
+            derecha = (posiciones % (2 * ancho)) >= ancho
+            izquierdas = claves[~derecha]
+            fin_bloque = np.searchsorted(izquierdas, (bloque[derecha] + 1) * n)
+            inversiones += int((fin_bloque - np.searchsorted(izquierdas, claves[derecha],
+                                                             side='right')).sum())
+            actual = np.sort(claves, kind='stable') - bloque * n
+            ancho *= 2
+        return inversiones
+    actual = list(valores)
+    while ancho < n:
+        siguiente = []
+        for inicio in range(0, n, 2 * ancho):
+            izquierda = actual[inicio:inicio + ancho]
+            derecha = actual[inicio + ancho:inicio + 2 * ancho]
+            tamano = len(izquierda)
+            inversiones += sum(tamano - bisect_right(izquierda, v) for v in derecha)
+            # sorted() fusiona las dos corridas ya ordenadas en tiempo lineal
+            siguiente.extend(sorted(izquierda + derecha))
+        actual = siguiente
+        ancho *= 2
+    return inversiones
+
+
+def _tau_b_kendall(datos_x, datos_y) -> float:
+    """
+    Tau-b de Kendall con el algoritmo de Knight, O(n log n): se ordenan
+    los pares por (x, y) y los pares discordantes son las inversiones de
+    la secuencia de y resultante.
+    """
+    n = len(datos_x)
+    if np is not None:
+        x = np.asarray(datos_x, dtype=float)
+        y = np.asarray(datos_y, dtype=float)
+        orden = np.lexsort((y, x))
+        x, y = x[orden], y[orden]
+        empates_x = _pares_empatados(np.unique(x, return_counts=True)[1].tolist())
+        empates_y = _pares_empatados(np.unique(y, return_counts=True)[1].tolist())
+        nuevo_par = np.r_[True, (x[1:] != x[:-1]) | (y[1:] != y[:-1]), True]
+        empates_xy = _pares_empatados(np.diff(np.flatnonzero(nuevo_par)).tolist())
+    else:
+        pares = sorted(zip(datos_x, datos_y))
+        y = [par[1] for par in pares]
+        empates_x = _pares_empatados(Counter(datos_x).values())
+        empates_y = _pares_empatados(Counter(datos_y).values())
+        empates_xy = _pares_empatados(Counter(pares).values())
+    
+    total = n * (n - 1) // 2
+    discordantes = _contar_inversiones(y)
+    denominador = math.sqrt((total - empates_x) * (total - empates_y))
+    if denominador == 0:
+        raise ValueError("No se puede calcular correlación con d.s 0")
+    return (total - empates_x - empates_y + empates_xy - 2 * discordantes) / denominador
+
+
+def _reducir_en_paralelo(funcion, bloques, trabajadores: int):
+    """
+    Evalúa `funcion` sobre cada bloque en un ProcessPoolExecutor y combina
+    los acumuladores parciales en orden con sus fórmulas de fusión.
+    
+    Args:
+        funcion: Función de nivel de módulo (serializable) que recibe los
+            argumentos de un bloque y retorna un acumulador
+        bloques: Lista de tuplas de argumentos, una por bloque
+        trabajadores: Número de procesos
+    """
+    with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+        parciales = list(ejecutor.map(funcion, *zip(*bloques)))
+    total = parciales[0]
+    for parcial in parciales[1:]:
+        total.combinar(parcial)
+    return total
+
+
+_ESTADISTICOS_BOOTSTRAP = ('media', 'mediana', 'percentil', 'correlacion_pearson')
+_ELEMENTOS_POR_LOTE = 1 << 22
+
+
+def _estadistico_de_remuestra(estadistico: str, columnas, indices, p: float) -> float:
+    """Evalúa el estadístico sobre una remuestra dada por sus índices (sin NumPy)."""
+    if estadistico == 'media':
+        valores = columnas[0]
+        return math.fsum([valores[i] for i in indices]) / len(indices)
+    if estadistico == 'correlacion_pearson':
+        datos_x, datos_y = columnas
+        acumulador = AcumuladorComomentos().extender([datos_x[i] for i in indices],
+                                                     [datos_y[i] for i in indices])
+        try:
+            return acumulador.correlacion()
+        except ValueError:
+            return math.nan
+    valores = columnas[0]
+    muestra = [valores[i] for i in indices]
+    return _interpolar_percentiles(
+        len(muestra), [p], lambda posiciones: _seleccionar_estadisticos_orden(muestra, posiciones))[0]
+
+
+def _estadistico_de_lote(estadistico: str, columnas, indices, p: float):
+    """Evalúa el estadístico sobre un lote de remuestras (una por fila de `indices`)."""
+    if estadistico == 'media':
+        return columnas[0][indices].mean(axis=1)
+    if estadistico == 'correlacion_pearson':
+        x, y = columnas[0][indices], columnas[1][indices]
+        x -= x.mean(axis=1, keepdims=True)
+        y -= y.mean(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (x * y).sum(axis=1) / np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+    return np.percentile(columnas[0][indices], p, axis=1)
+
+
+def _replicas_bootstrap(estadistico: str, columnas, replicas: int, semilla, p: float) -> List[float]:
+    """
+    Genera `replicas` valores del estadístico sobre remuestras con reemplazo
+    (se ejecuta en un proceso trabajador). Con NumPy los índices se sortean
+    por lotes de matrices replicas × n y el estadístico se evalúa por filas.
+    """
+    n = len(columnas[0])
+    if np is not None:
+        generador = np.random.default_rng(semilla)
+        columnas = [np.asarray(columna, dtype=np.float64) for columna in columnas]
+        lote = max(1, _ELEMENTOS_POR_LOTE // n)
+        resultado = []
+        for inicio in range(0, replicas, lote):
+            indices = generador.integers(0, n, size=(min(lote, replicas - inicio), n),
+                                         dtype=np.int32 if n < 2**31 else np.int64)
+            resultado.extend(_estadistico_de_lote(estadistico, columnas, indices, p).tolist())
+        return resultado
+    generador = random.Random(semilla)
+    posiciones = range(n)
+    return [_estadistico_de_remuestra(estadistico, columnas, generador.choices(posiciones, k=n), p)
+            for _ in range(replicas)]
+
+
+def _bootstrap(estadistico: str, columnas, estimacion: float, nivel: float, replicas: int,
+               semilla, trabajadores: int, p: float = 50) -> Dict:
+    """
+    Intervalo de confianza bootstrap por el método de percentiles
+    
+    Las réplicas se reparten entre procesos; cada uno recibe una semilla
+    derivada de `semilla`, por lo que el resultado es reproducible para
+    una misma semilla y número de trabajadores.
+    """
+    if not 0 < nivel < 1:
+        raise ValueError("El nivel de confianza debe estar entre 0 y 1")
+    if replicas < 2:
+        raise ValueError("Se necesitan al menos 2 réplicas")
+    if trabajadores < 1:
+        raise ValueError("El número de trabajadores debe ser al menos 1")
+    columnas = [array(c.format, c) if isinstance(c, memoryview) else c for c in columnas]
+    if np is not None:
+        semillas = np.random.SeedSequence(semilla).spawn(trabajadores)
+    else:
+        generador = random.Random(semilla)
+        semillas = [generador.getrandbits(64) for _ in range(trabajadores)]
+    tareas = [(estadistico, columnas, fin - inicio, semilla_parte, p)
+              for (inicio, fin), semilla_parte
+              in zip(_dividir_en_bloques(replicas, trabajadores), semillas)]
+    if trabajadores > 1:
+        with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+            partes = list(ejecutor.map(_replicas_bootstrap, *zip(*tareas)))
+    else:
+        partes = [_replicas_bootstrap(*tareas[0])]
+    
+    valores = sorted(v for parte in partes for v in parte if not math.isnan(v))
+    if len(valores) < 2:
+        raise ValueError("El estadístico no está definido en las remuestras")
+    cola = (1 - nivel) / 2 * 100
+    inferior, superior = _interpolar_percentiles(
+        len(valores), [cola, 100 - cola],
+        lambda posiciones: {k: valores[k] for k in posiciones})
+    media = math.fsum(valores) / len(valores)
+    return {
+        'estadistico': estadistico,
+        'estimacion': estimacion,
+        'inferior': inferior,
+        'superior': superior,
+        'nivel': nivel,
+        'replicas': len(valores),
+        'error_estandar': math.sqrt(math.fsum((v - media) ** 2 for v in valores) / (len(valores) - 1))
+    }
+
+
+class _ListaOrdenada:
+    """
+    Lista ordenada por bloques (estilo sortedcontainers) para estadísticos
+    de orden en ventanas móviles: insertar y quitar cuestan una búsqueda
+    O(log w) más un desplazamiento dentro de un bloque de tamaño acotado.
+    El acceso por posición usa un árbol de Fenwick sobre los tamaños de
+    los bloques, O(log(w/512)); el árbol se reconstruye de forma perezosa
+    solo cuando un bloque se divide o desaparece.
+    """
+    
+    _CARGA = 512
+    
+    def __init__(self):
+        self._bloques = []
+        self._maximos = []
+        self._indice = None    # árbol de Fenwick (base 1) de tamaños de bloque
+        self._n = 0
+    
+    def __len__(self):
+        return self._n
+    
+    def agregar(self, x: float):
+        """Inserta un valor manteniendo el orden."""
+        self._n += 1
+        if not self._bloques:
+            self._bloques.append([x])
+            self._maximos.append(x)
+            self._indice = None
+            return
+        i = bisect_left(self._maximos, x)
+        if i == len(self._bloques):
+            i -= 1
+            self._bloques[i].append(x)
+            self._maximos[i] = x
+        else:
+            insort(self._bloques[i], x)
+        bloque = self._bloques[i]
+        if len(bloque) > 2 * self._CARGA:
+            self._bloques[i:i + 1] = [bloque[:self._CARGA], bloque[self._CARGA:]]
+            self._maximos[i:i + 1] = [bloque[self._CARGA - 1], bloque[-1]]
+            self._indice = None
+        else:
+            self._actualizar_indice(i, 1)
+    
+    def quitar(self, x: float):
+        """Quita una ocurrencia de un valor presente en la lista."""
+        i = bisect_left(self._maximos, x)
+        bloque = self._bloques[i]
+        del bloque[bisect_left(bloque, x)]
+        self._n -= 1
+        if bloque:
+            self._maximos[i] = bloque[-1]
+            self._actualizar_indice(i, -1)
+        else:
+            del self._bloques[i]
+            del self._maximos[i]
+            self._indice = None
+    
+    def _actualizar_indice(self, i: int, delta: int):
+        """Suma delta al tamaño del bloque i en el árbol, si está construido."""
+        arbol = self._indice
+        if arbol is None:
+            return
+        i += 1
+        while i < len(arbol):
+            arbol[i] += delta
+            i += i & -i
+    
+    def _construir_indice(self) -> List[int]:
+        """Construye en O(número de bloques) el árbol de Fenwick de tamaños."""
+        arbol = [0] + [len(bloque) for bloque in self._bloques]
+        for i in range(1, len(arbol)):
+            j = i + (i & -i)
+            if j < len(arbol):
+                arbol[j] += arbol[i]
+        self._indice = arbol
+        return arbol
+    
+    def __getitem__(self, k: int) -> float:
+        """Retorna el k-ésimo menor valor (base 0)."""
+        if not 0 <= k < self._n:
+            raise IndexError("Índice fuera de la lista ordenada")
+        arbol = self._indice if self._indice is not None else self._construir_indice()
+        # Descenso por el árbol: último bloque cuyo prefijo acumulado es <= k
+        posicion = 0
+        paso = 1 << (len(arbol) - 1).bit_length() - 1
+        while paso:
+            siguiente = posicion + paso
+            if siguiente < len(arbol) and arbol[siguiente] <= k:
+                posicion = siguiente
+                k -= arbol[siguiente]
+            paso >>= 1
+        return self._bloques[posicion][k]
+
+
+class VentanaMovil:
+    """
+    Estadísticas sobre una ventana deslizante de los últimos valores
+    
+    La ventana puede ser por cantidad (los últimos `tamano` valores) o por
+    tiempo (los valores con marca de tiempo dentro de los últimos
+    `duracion`). Cada actualización cuesta O(1) amortizado para media,
+    varianza, mínimo y máximo (momentos con alta y baja, y colas
+    monótonas) y O(log w) más un desplazamiento acotado para mediana y
+    percentiles (lista ordenada por bloques).
+    """
+    
+    def __init__(self, tamano: int = None, duracion: float = None):
+        """
+        Args:
+            tamano: Número de valores de la ventana
+            duracion: Ancho temporal de la ventana (mismas unidades que
+                las marcas de tiempo pasadas a agregar)
+        """
+        if (tamano is None) == (duracion is None):
+            raise ValueError("Se debe indicar exactamente uno: tamano o duracion")
+        if tamano is not None and tamano < 1:
+            raise ValueError("El tamaño de la ventana debe ser al menos 1")
+        if duracion is not None and duracion <= 0:
+            raise ValueError("La duración de la ventana debe ser positiva")
+        self.tamano = tamano
+        self.duracion = duracion
+        self._valores = deque()        # (secuencia, marca de tiempo, valor)
+        self._minimos = deque()        # (secuencia, valor), valores crecientes
+        self._maximos = deque()        # (secuencia, valor), valores decrecientes
+        self._ordenados = _ListaOrdenada()
+        self._secuencia = 0
+        self._n = 0
+        self._media = 0.0
+        self._m2 = 0.0
+    
+    @property
+    def n(self) -> int:
+        """Retorna la cantidad de valores dentro de la ventana."""
+        return self._n
+    
+    def agregar(self, x: float, marca_tiempo: float = None) -> 'VentanaMovil':
+        """
+        Incorpora un valor y descarta los que salen de la ventana
+        
+        Args:
+            x: Valor numérico
+            marca_tiempo: Obligatoria en ventanas por duración; debe ser
+                no decreciente
+        """
+        try:
+            x = float(x)
+        except (ValueError, TypeError) as e:
+            raise TypeError("Todos los datos deben ser numéricos") from e
+        if self.duracion is not None and marca_tiempo is None:
+            raise ValueError("Las ventanas por duración requieren marca_tiempo")
+        
+        secuencia = self._secuencia
+        self._secuencia += 1
+        self._valores.append((secuencia, marca_tiempo, x))
+        self._ordenados.agregar(x)
+        
+        # Alta en los momentos (Welford)
+        self._n += 1
+        delta = x - self._media
+        self._media += delta / self._n
+        self._m2 += delta * (x - self._media)
+        
+        # Colas monótonas para mínimo y máximo
+        while self._minimos and self._minimos[-1][1] >= x:
+            self._minimos.pop()
+        self._minimos.append((secuencia, x))
+        while self._maximos and self._maximos[-1][1] <= x:
+            self._maximos.pop()
+        self._maximos.append((secuencia, x))
+        
+        if self.tamano is not None:
+            while self._n > self.tamano:
+                self._quitar_mas_antiguo()
+        else:
+            while self._valores[0][1] <= marca_tiempo - self.duracion:
+                self._quitar_mas_antiguo()
+        return self
+    
+    def _quitar_mas_antiguo(self):
+        """Da de baja el valor más antiguo de la ventana."""
+        secuencia, _, x = self._valores.popleft()
+        self._ordenados.quitar(x)
+        if self._minimos[0][0] == secuencia:
+            self._minimos.popleft()
+        if self._maximos[0][0] == secuencia:
+            self._maximos.popleft()
+        
+        # Baja en los momentos (Welford inverso)
+        self._n -= 1
+        if self._n == 0:
+            self._media = self._m2 = 0.0
+            return
+        media_anterior = self._media
+        self._media -= (x - media_anterior) / self._n
+        self._m2 = max(0.0, self._m2 - (x - media_anterior) * (x - self._media))
+    
+    def _validar_no_vacia(self):
+        if self._n == 0:
+            raise ValueError("La ventana está vacía")
+    
+    def media(self) -> float:
+        """Media de la ventana"""
+        self._validar_no_vacia()
+        return self._media
+    
+    def varianza(self, muestral: bool = True) -> float:
+        """Varianza de la ventana (muestral con n-1 o poblacional con n)"""
+        self._validar_no_vacia()
+        divisor = self._n - 1 if muestral else self._n
+        return self._m2 / divisor
+    
+    def desviacion_estandar(self, muestral: bool = True) -> float:
+        """Desviación estándar de la ventana"""
+        return math.sqrt(self.varianza(muestral))
+    
+    def minimo(self) -> float:
+        """Mínimo de la ventana"""
+        self._validar_no_vacia()
+        return self._minimos[0][1]
+    
+    def maximo(self) -> float:
+        """Máximo de la ventana"""
+        self._validar_no_vacia()
+        return self._maximos[0][1]
+    
+    def percentiles(self, ps: List[float]) -> List[float]:
+        """Percentiles de la ventana (0-100), con interpolación lineal"""
+        self._validar_no_vacia()
+        for p in ps:
+            if not 0 <= p <= 100:
+                raise ValueError("El percentil debe estar entre 0 y 100")
+        ordenados = self._ordenados
+        return _interpolar_percentiles(
+            self._n, ps, lambda posiciones: {k: ordenados[k] for k in posiciones})
+    
+    def percentil(self, p: float) -> float:
+        """Percentil p-ésimo de la ventana (0-100)"""
+        return self.percentiles([p])[0]
+    
+    def mediana(self) -> float:
+        """Mediana de la ventana"""
+        return self.percentil(50)
+    
+    def resumen(self, percentiles: Tuple[float, ...] = (50, 95)) -> Dict:
+        """
+        Resumen de la ventana actual
+        La varianza y la desviación son None con un solo valor.
+        """
+        varianza = self.varianza() if self._n > 1 else None
+        resumen = {
+            'n': self._n,
+            'media': self.media(),
+            'varianza': varianza,
+            'desviacion_estandar': math.sqrt(varianza) if varianza is not None else None,
+            'minimo': self.minimo(),
+            'maximo': self.maximo()}
+        for p, valor in zip(percentiles, self.percentiles(list(percentiles))):
+            resumen[f'p{p:g}'] = valor
+        return resumen
+    
+    def __repr__(self):
+        ancho = f"tamano={self.tamano}" if self.tamano is not None else f"duracion={self.duracion}"
+        return f"{self.__class__.__name__}({ancho}, n={self._n})"
+
+
+def _copiar_resultado(resultado):
+    """Copia profunda de resultados mutables para no exponer la caché."""
+    if resultado is None or isinstance(resultado, (int, float, str)):
+        return resultado
+    return copy.deepcopy(resultado)
+
+
+def _memoizado(metodo):
+    """
+    Decorador: guarda el resultado del método en la caché de la instancia
+    
+    La clave es el nombre del método más sus argumentos con los valores por
+    defecto aplicados, así varianza() y varianza(True) comparten entrada
+    (las listas se convierten en tuplas). Si el método llama a otros
+    métodos memoizados mientras se calcula, queda registrado como
+    dependiente de ellos, de modo que invalidar uno invalida también todo
+    lo que se derivó de él.
+    Los errores no se guardan y los resultados mutables se entregan copiados.
+    Con un Perfilador activo cada llamada se mide a través de él.
+    """
+    nombre = metodo.__name__
+    firma = inspect.signature(metodo)
+    clave_por_defecto = (nombre,) + tuple(
+        p.default for p in list(firma.parameters.values())[1:])
+    
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        estado = self._cache
+        if estado is not None and estado.perfil is not None:
+            return estado.perfil.medir(nombre, consultar, self, args, kwargs)
+        return consultar(self, args, kwargs)
+    
+    def consultar(self, args, kwargs):
+        if args or kwargs:
+            argumentos = firma.bind(self, *args, **kwargs)
+            argumentos.apply_defaults()
+            clave = (nombre,) + tuple(tuple(a) if isinstance(a, list) else a
+                                      for a in list(argumentos.arguments.values())[1:])
+        else:
+            clave = clave_por_defecto
+        estado = self._cache
+        if estado is None:
+            estado = self._cache = _EstadoCache()
+        try:
+            calculado = clave in estado.resultados
+        except TypeError:
+            # Argumentos no hashables: se calcula sin caché
+            return metodo(self, *args, **kwargs)
+        pila = estado.pila
+        if pila:
+            estado.dependientes.setdefault(clave, set()).add(pila[-1])
+        if calculado:
+            estado.aciertos[nombre] += 1
+            return _copiar_resultado(estado.resultados[clave])
+        estado.fallos[nombre] += 1
+        pila.append(clave)
+        try:
+            resultado = metodo(self, *args, **kwargs)
+        finally:
+            pila.pop()
+        estado.guardar(clave, resultado)
+        return _copiar_resultado(resultado)
+    
+    return envoltura
+
+
+def _perfilado(metodo):
+    """
+    Decorador para los métodos públicos sin caché (resúmenes, tablas,
+    histogramas, ...): con un Perfilador activo la llamada se mide igual
+    que la de un método memoizado, así su tiempo y las pasadas que hace
+    directamente quedan a su nombre. Sin perfilador sólo comprueba un
+    atributo.
+    """
+    nombre = metodo.__name__
+    
+    def llamar(self, args, kwargs):
+        return metodo(self, *args, **kwargs)
+    
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        estado = self._cache
+        if estado is not None and estado.perfil is not None:
+            return estado.perfil.medir(nombre, llamar, self, args, kwargs)
+        return metodo(self, *args, **kwargs)
+    
+    return envoltura
+
+
+class _EstadoCache:
+    """
+    Caché de resultados de un analizador: valores, grafo de dependencias,
+    pila de cálculos en curso y contadores de aciertos/fallos. Se crea en
+    el primer método memoizado, así los analizadores que nunca se consultan
+    no pagan su memoria. Guarda a lo sumo MAXIMO_ENTRADAS resultados: al
+    superarlo descarta el más antiguo (y lo que depende de él).
+    """
+    __slots__ = ('resultados', 'dependientes', 'pila', 'aciertos', 'fallos', 'perfil')
+    
+    MAXIMO_ENTRADAS = 256
+    
+    def __init__(self):
+        self.resultados = {}
+        self.dependientes = {}
+        self.pila = []
+        self.aciertos = Counter()
+        self.fallos = Counter()
+        self.perfil = None
+    
+    def __len__(self):
+        return len(self.resultados)
+    
+    def guardar(self, clave, resultado):
+        """Guarda un resultado respetando el límite de entradas."""
+        self.resultados[clave] = resultado
+        if len(self.resultados) > self.MAXIMO_ENTRADAS:
+            self.descartar([next(iter(self.resultados))])
+    
+    def descartar(self, claves):
+        """Elimina las claves y, transitivamente, los resultados que dependen de ellas."""
+        pendientes = list(claves)
+        while pendientes:
+            clave = pendientes.pop()
+            self.resultados.pop(clave, None)
+            pendientes.extend(self.dependientes.pop(clave, ()))
+
+
+class Perfilador:
+    """
+    Instrumentación opcional de un analizador
+    
+    Por cada método memoizado o público marcado con @_perfilado (resumen,
+    histograma, tabla_frecuencias, ...) registra llamadas, aciertos de caché, tiempo
+    total (incluye los métodos que llama) y propio (sin ellos), pasadas
+    completas sobre los datos por operación ('momentos', 'ordenar',
+    'seleccion', 'conteo', ...) y, con medir_memoria=True, los bytes
+    asignados (pico de tracemalloc sobre el inicio de cada llamada). Se
+    obtiene con AnalizadorBase.perfilar() y se activa como gestor de
+    contexto. Desactivado, cada método sólo comprueba un atributo.
+    """
+    
+    __slots__ = ('_analizador', '_callback', '_medir_memoria', '_inicio_tracemalloc',
+                 '_metricas', '_pila')
+    
+    CAMPOS = ('llamadas', 'aciertos_cache', 'segundos', 'segundos_propios',
+              'pasadas', 'bytes_asignados')
+    _AYUDAS = {
+        'llamadas': 'Llamadas por método',
+        'aciertos_cache': 'Llamadas respondidas desde la caché',
+        'segundos': 'Tiempo total por método, incluidos los métodos anidados',
+        'segundos_propios': 'Tiempo por método sin los métodos anidados',
+        'pasadas': 'Pasadas completas sobre los datos',
+        'bytes_asignados': 'Bytes asignados (pico sobre el inicio de cada llamada)'
+    }
+    
+    def __init__(self, analizador: 'AnalizadorBase', callback=None,
+                 medir_memoria: bool = False):
+        """
+        Args:
+            analizador: Analizador a instrumentar
+            callback: Función opcional llamada tras cada método con
+                (nombre, {'segundos', 'acierto_cache', 'pasadas', 'bytes_asignados'})
+            medir_memoria: Si True mide bytes con tracemalloc (mucho más lento)
+        """
+        self._analizador = analizador
+        self._callback = callback
+        self._medir_memoria = medir_memoria
+        self._inicio_tracemalloc = False
+        self._metricas = {}
+        self._pila = []
+    
+    def __enter__(self) -> 'Perfilador':
+        analizador = self._analizador
+        if analizador._cache is None:
+            analizador._cache = _EstadoCache()
+        if analizador._cache.perfil is not None:
+            raise ValueError("El analizador ya se está perfilando")
+        if self._medir_memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._inicio_tracemalloc = True
+        analizador._cache.perfil = self
+        return self
+    
+    def __exit__(self, *excepcion):
+        if self._analizador._cache is not None:
+            self._analizador._cache.perfil = None
+        if self._inicio_tracemalloc:
+            tracemalloc.stop()
+            self._inicio_tracemalloc = False
+        return False
+    
+    def _metrica(self, nombre: str) -> Dict:
+        metrica = self._metricas.get(nombre)
+        if metrica is None:
+            metrica = self._metricas[nombre] = {
+                'llamadas': 0, 'aciertos_cache': 0, 'segundos': 0.0, 'segundos_propios': 0.0,
+                'pasadas': 0, 'bytes_asignados': 0, 'operaciones': Counter()}
+        return metrica
+    
+    def medir(self, nombre: str, funcion, analizador, args, kwargs):
+        """Ejecuta una llamada de método midiéndola (lo usa @_memoizado)."""
+        metrica = self._metrica(nombre)
+        aciertos = analizador._cache.aciertos[nombre]
+        # Marco de la llamada: [tiempo de hijos, pasadas, pico de memoria,
+        # memoria inicial, método]
+        marco = [0.0, 0, 0, 0, nombre]
+        if self._medir_memoria:
+            actual, pico = tracemalloc.get_traced_memory()
+            if self._pila:
+                self._pila[-1][2] = max(self._pila[-1][2], pico)
+            tracemalloc.reset_peak()
+            marco[2] = marco[3] = actual
+        self._pila.append(marco)
+        inicio = time.perf_counter()
+        try:
+            return funcion(analizador, args, kwargs)
+        finally:
+            segundos = time.perf_counter() - inicio
+            self._pila.pop()
+            acierto = analizador._cache.aciertos[nombre] != aciertos
+            asignados = 0
+            if self._medir_memoria:
+                pico = max(tracemalloc.get_traced_memory()[1], marco[2])
+                asignados = pico - marco[3]
+                if self._pila:
+                    self._pila[-1][2] = max(self._pila[-1][2], pico)
+            if self._pila:
+                self._pila[-1][0] += segundos
+            metrica['llamadas'] += 1
+            metrica['aciertos_cache'] += acierto
+            metrica['segundos'] += segundos
+            metrica['segundos_propios'] += segundos - marco[0]
+            metrica['bytes_asignados'] += asignados
+            if self._callback is not None:
+                self._callback(nombre, {'segundos': segundos, 'acierto_cache': acierto,
+                                        'pasadas': marco[1], 'bytes_asignados': asignados})
+    
+    def pasada(self, operacion: str, cantidad: int = 1):
+        """Registra pasadas sobre los datos en el método medido más interno."""
+        metrica = self._metrica(self._pila[-1][4] if self._pila else 'otros')
+        metrica['pasadas'] += cantidad
+        metrica['operaciones'][operacion] += cantidad
+        if self._pila:
+            self._pila[-1][1] += cantidad
+    
+    def como_dict(self) -> Dict:
+        """Retorna {método: métricas}, con las pasadas desglosadas por operación."""
+        return {nombre: dict(metrica, operaciones=dict(metrica['operaciones']))
+                for nombre, metrica in sorted(self._metricas.items())}
+    
+    def como_prometheus(self, prefijo: str = 'corepy') -> str:
+        """Exporta las métricas en el formato de texto de Prometheus."""
+        clase = type(self._analizador).__name__
+        lineas = []
+        for campo in self.CAMPOS:
+            metrica = f"{prefijo}_{campo}_total"
+            lineas.append(f"# HELP {metrica} {self._AYUDAS[campo]}")
+            lineas.append(f"# TYPE {metrica} counter")
+            for nombre, valores in sorted(self._metricas.items()):
+                etiquetas = f'analizador="{clase}",metodo="{nombre}"'
+                if campo == 'pasadas':
+                    for operacion, cantidad in sorted(valores['operaciones'].items()):
+                        lineas.append(f'{metrica}{{{etiquetas},operacion="{operacion}"}} {cantidad}')
+                else:
+                    lineas.append(f"{metrica}{{{etiquetas}}} {valores[campo]}")
+        return "\n".join(lineas) + "\n"
+    
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(analizador={type(self._analizador).__name__}, "
+                f"metodos={len(self._metricas)})")
 
 
 class AnalizadorBase(ABC):
     """Clase abstracta base para todos los analizadores estadísticos."""
     
-    def __init__(self, datos: List):
-        if not datos:
-            raise ValueError("El conjunto de datos no puede estar vacío")
-        self._datos = datos
-        self._n = len(datos)
+    __slots__ = ('_datos', '_n', '_cache')
+    
+    def __init__(self, datos: List, n: int = None):
+        """
+        Args:
+            datos: Datos a analizar, o None si el analizador se construye
+                desde un estado resumido (frecuencias, momentos y sketch)
+            n: Tamaño de la muestra cuando no se conservan los datos
+        """
+        if datos is None and n is not None:
+            if n <= 0:
+                raise ValueError("El conjunto de datos no puede estar vacío")
+            self._datos = None
+            self._n = n
+        else:
+            if datos is None or len(datos) == 0:
+                raise ValueError("El conjunto de datos no puede estar vacío")
+            self._datos = datos
+            self._n = len(datos)
+        self._iniciar_cache()
+    
+    def _iniciar_cache(self):
+        """La caché de los métodos @_memoizado se crea al primer uso."""
+        self._cache = None
+    
+    def invalidar_cache(self, metodo: str = None):
+        """
+        Descarta resultados memoizados
+        
+        Args:
+            metodo: Si se indica, sólo los resultados de ese método (con
+                cualquier argumento) y, transitivamente, los que dependen
+                de ellos. Si es None se vacía toda la caché y también los
+                valores derivados de los datos (momentos, copia ordenada,
+                sketches, frecuencias): tras modificar la lista original
+                todo se recalcula sobre los datos actuales.
+        """
+        if metodo is None:
+            self._descartar_derivados()
+        self._descartar_resultados(metodo)
+    
+    def _descartar_resultados(self, metodo: str = None):
+        """Vacía la caché de resultados (o sólo la de `metodo` y sus dependientes)."""
+        estado = self._cache
+        if estado is None:
+            return
+        if metodo is None:
+            estado.resultados.clear()
+            estado.dependientes.clear()
+            return
+        estado.descartar([clave for clave in estado.resultados if clave[0] == metodo])
+    
+    def _descartar_derivados(self):
+        """
+        Descarta el estado calculado a partir de los datos. Los analizadores
+        incrementales no lo redefinen: su estado es la única copia.
+        """
+    
+    def info_cache(self) -> Dict:
+        """
+        Retorna aciertos y fallos de la caché (totales y por método) y el
+        grafo de dependencias observado: {método: métodos que lo usan}
+        """
+        estado = self._cache if self._cache is not None else _EstadoCache()
+        metodos = sorted(set(estado.aciertos) | set(estado.fallos))
+        dependencias = {}
+        for clave, dependientes in estado.dependientes.items():
+            dependencias.setdefault(clave[0], set()).update(d[0] for d in dependientes)
+        return {
+            'aciertos': sum(estado.aciertos.values()),
+            'fallos': sum(estado.fallos.values()),
+            'entradas': len(estado.resultados),
+            'por_metodo': {m: {'aciertos': estado.aciertos[m],
+                               'fallos': estado.fallos[m]} for m in metodos},
+            'dependencias': {m: sorted(d) for m, d in sorted(dependencias.items())}
+        }
+    
+    async def resumen_async(self, ejecutor=None) -> Dict:
+        """
+        Versión asíncrona de resumen(): el cálculo se delega a un ejecutor
+        para no bloquear el bucle de eventos
+        
+        Args:
+            ejecutor: ThreadPoolExecutor o ProcessPoolExecutor; None usa el
+                ejecutor por defecto del bucle. Con procesos el analizador
+                se serializa y su caché local no se actualiza
+        """
+        bucle = asyncio.get_running_loop()
+        return await bucle.run_in_executor(ejecutor, self.resumen)
+    
+    def perfilar(self, callback=None, medir_memoria: bool = False) -> Perfilador:
+        """
+        Instrumentación opcional por método, como gestor de contexto:
+        
+            with analizador.perfilar() as perfil:
+                analizador.resumen()
+            print(perfil.como_prometheus())
+        
+        Args:
+            callback: Función opcional llamada tras cada método con (nombre, métricas)
+            medir_memoria: Si True mide los bytes asignados con tracemalloc
+        """
+        return Perfilador(self, callback, medir_memoria)
+    
+    def _registrar_pasada(self, operacion: str, cantidad: int = 1):
+        """Cuenta una pasada sobre los datos si hay un perfilado activo."""
+        estado = self._cache
+        if estado is not None and estado.perfil is not None:
+            estado.perfil.pasada(operacion, cantidad)
+    
+    def serializar(self) -> bytes:
+        """
+        Instantánea binaria del estado calculado. La redefinen los
+        analizadores que admiten instantáneas (cuantitativo, incremental y
+        cualitativo exacto); en los demás lanza TypeError.
+        """
+        raise TypeError(f"{type(self).__name__} no admite instantáneas")
+    
+    @classmethod
+    def deserializar(cls, datos: bytes) -> 'AnalizadorBase':
+        """Reconstruye el analizador a partir de serializar()."""
+        raise TypeError(f"{cls.__name__} no admite instantáneas")
+    
+    def guardar(self, ruta: str):
+        """Guarda la instantánea de serializar() en un archivo."""
+        with open(ruta, 'wb') as archivo:
+            archivo.write(self.serializar())
+    
+    @classmethod
+    def cargar(cls, ruta: str) -> 'AnalizadorBase':
+        """
+        Carga una instantánea guardada con guardar(). El archivo se mapea
+        en memoria con mmap, así las muestras que contiene se leen sin
+        copiarlas; el mapeo se mantiene vivo mientras el analizador lo use.
+        """
+        with open(ruta, 'rb') as archivo:
+            if os.fstat(archivo.fileno()).st_size == 0:
+                raise ValueError("La instantánea está vacía")
+            mapeo = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.deserializar(memoryview(mapeo))
     
     @property
     def datos(self):
@@ -40,75 +2414,450 @@ class AnalizadorBase(ABC):
         pass
     
     def __repr__(self):
-        return f"{self.__class__.__name__}(n={self._n})"
+        return f"{self.__class__.__name__}(n={self.n})"
     
 class AnalizadorCuantitativo(AnalizadorBase):
-    """Analizador para datos numéricos continuos o discretos."""
+    """
+    Analizador para datos numéricos continuos o discretos.
+
+    Si NumPy está instalado los datos se guardan además en un ndarray
+    float64 contiguo y media, varianza, asimetría, curtosis, mínimo,
+    máximo y percentiles se calculan con kernels vectorizados. Los
+    resultados coinciden con la ruta en Python puro dentro de una
+    tolerancia relativa de 1e-9 (la suma por pares de NumPy redondea
+    distinto); las modas se devuelven con los valores originales.
+
+    Las listas de int/float y los buffers tipados se guardan por referencia,
+    sin copiarlos: si el llamador los modifica debe llamar a
+    invalidar_cache() para que los resultados se recalculen.
+
+    Con modo_cuantiles='aproximado' los percentiles, cuartiles y la
+    mediana se obtienen de un SketchKLL de memoria acotada en lugar de
+    seleccionar u ordenar todos los datos.
+
+    Con trabajadores > 1 los momentos se calculan por bloques en un
+    ProcessPoolExecutor y se combinan con las fórmulas de Pébay. En
+    plataformas que usan 'spawn' (Windows, macOS) el código que crea el
+    analizador debe estar protegido por if __name__ == '__main__'.
+    """
+    
+    __slots__ = ('_arreglo', '_datos_ordenados', '_momentos', '_momentos_compensados',
+                 '_modo_cuantiles', '_k_sketch', '_sketch', '_trabajadores')
+
+    BACKENDS = ('auto', 'python', 'numpy')
+    MODOS_CUANTILES = ('exacto', 'aproximado')
 
-    def __init__(self, datos: List[Union[int, float]]):
-        # Validar que todos los datos sean numéricos
+    def __init__(self, datos: List[Union[int, float]] = None, backend: str = 'auto',
+                 modo_cuantiles: str = 'exacto', k_sketch: int = 200,
+                 trabajadores: int = 1, momentos: AcumuladorMomentos = None,
+                 sketch: SketchKLL = None):
+        """
+        Args:
+            datos: Lista de valores numéricos
+            backend: 'auto' (NumPy si está disponible), 'python' o 'numpy'
+            modo_cuantiles: 'exacto' o 'aproximado' (sketch KLL)
+            k_sketch: Precisión del sketch KLL en modo aproximado
+            trabajadores: Procesos para calcular los momentos en paralelo
+            momentos: Con datos=None, momentos completos de la muestra
+            sketch: Con datos=None, sketch KLL de la muestra. El analizador
+                queda en modo aproximado y sin datos crudos: moda,
+                histogramas y las demás medidas que los recorren no están
+                disponibles
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError("El backend debe ser 'auto', 'python' o 'numpy'")
+        if modo_cuantiles not in self.MODOS_CUANTILES:
+            raise ValueError("El modo de cuantiles debe ser 'exacto' o 'aproximado'")
+        if trabajadores < 1:
+            raise ValueError("El número de trabajadores debe ser al menos 1")
+        if backend == 'numpy' and np is None:
+            raise ImportError("El backend 'numpy' requiere tener NumPy instalado")
+        if datos is None:
+            if momentos is None or sketch is None:
+                raise ValueError("Sin datos se deben indicar los momentos y el sketch")
+            if momentos.orden < 4 or momentos.n != sketch.n:
+                raise ValueError("Los momentos y el sketch no describen la misma muestra")
+            super().__init__(None, n=momentos.n)
+            self._arreglo = self._datos_ordenados = self._momentos_compensados = None
+            self._momentos = momentos
+            self._modo_cuantiles = 'aproximado'
+            self._k_sketch = sketch.k
+            self._sketch = sketch
+            self._trabajadores = trabajadores
+            return
+        
+        # Validar que todos los datos sean numéricos. Las listas de int y
+        # float, los buffers tipados y los ndarray se conservan tal cual (sin
+        # copiar: si luego se modifican hay que llamar a invalidar_cache());
+        # el backend NumPy guarda además su copia float64 para los cálculos
+        usar_numpy = np is not None and backend != 'python'
         try:
-            self._validar_datos_numericos(datos)
+            valores = self._validar_datos_numericos(datos)
+            arreglo = None
+            if usar_numpy:
+                arreglo = np.asarray(valores, dtype=np.float64)
+                if arreglo.ndim != 1:
+                    raise TypeError("Se esperaba una secuencia de una dimensión")
         except (ValueError, TypeError) as e:
             raise TypeError("Todos los datos deben ser numéricos") from e
         
-        super().__init__(datos)
+        super().__init__(valores)
+        self._arreglo = arreglo
+        self._datos_ordenados = None
+        self._momentos = None
+        self._momentos_compensados = None
+        self._modo_cuantiles = modo_cuantiles
+        self._k_sketch = k_sketch
+        self._sketch = None
+        self._trabajadores = trabajadores
+
+    @property
+    def backend(self) -> str:
+        """Retorna el backend de cálculo en uso ('numpy' o 'python')."""
+        return 'numpy' if self._arreglo is not None else 'python'
+
+    @property
+    def aproximado(self) -> bool:
+        """Indica si los cuantiles se calculan con el sketch KLL."""
+        return self._modo_cuantiles == 'aproximado'
+
+    def _valores(self, medida: str = "Este cálculo"):
+        """
+        Datos sobre los que operan los cálculos (el ndarray con el backend
+        NumPy). Falla si el analizador no conserva los datos crudos.
+        """
+        if self._datos is None:
+            raise ValueError(f"{medida} requiere los datos crudos; el analizador "
+                             "sólo conserva momentos y sketch")
+        return self._arreglo if self._arreglo is not None else self._datos
+
+    def _obtener_sketch(self) -> SketchKLL:
+        """Construye el sketch KLL de los datos si aún no existe."""
+        if self._sketch is None:
+            self._valores("El sketch")
+            self._registrar_pasada('sketch')
+            self._sketch = SketchKLL(self._k_sketch)
+            if self._arreglo is not None:
+                for inicio in range(0, self._n, 65536):
+                    self._sketch.extender(self._arreglo[inicio:inicio + 65536].tolist())
+            else:
+                self._sketch.extender(self._datos)
+        return self._sketch
+
+    @_perfilado
+    def error_cuantiles(self) -> float:
+        """Error de rango normalizado de los cuantiles (0 en modo exacto)."""
+        return self._obtener_sketch().error_rango() if self.aproximado else 0.0
+
+    def _descartar_derivados(self):
+        """Recalcula el tamaño y descarta momentos, copia ordenada y sketch."""
+        if self._datos is None:
+            return  # momentos y sketch son el único estado
+        self._n = len(self._datos)
+        if self._arreglo is not None and self._arreglo is not self._datos:
+            self._arreglo = np.asarray(self._datos, dtype=np.float64)
         self._datos_ordenados = None
+        self._momentos = None
+        self._momentos_compensados = None
+        self._sketch = None
+
+    @classmethod
+    def desde_archivo(cls, ruta: str, columna: Union[int, str] = 0, formato: str = 'csv',
+                      delimitador: str = ',', encabezado: bool = True,
+                      tamano_bloque: int = 65536, **opciones) -> 'AnalizadorCuantitativo':
+        """
+        Crea el analizador leyendo los datos desde un archivo
+        
+        Los CSV se leen por bloques y los valores se guardan en un
+        array('d') compacto. Los archivos binarios ('f64', 'f32', 'i32',
+        'i64', en orden de bytes nativo) se mapean en memoria con mmap y
+        se usan sin copiarlos. El resultado es idéntico al de construir el
+        analizador con una lista de los mismos valores.
+        
+        Args:
+            ruta: Ruta del archivo
+            columna: Índice o nombre de la columna (sólo CSV)
+            formato: 'csv', 'f64', 'f32', 'i32' o 'i64'
+            delimitador: Separador de campos del CSV
+            encabezado: Si la primera fila del CSV contiene los nombres
+            tamano_bloque: Filas leídas por bloque
+            **opciones: Argumentos adicionales para el constructor
+        """
+        if formato != 'csv':
+            return cls(_mapear_binario(ruta, formato), **opciones)
+        valores = array('d')
+        for bloque in _leer_columna_csv(ruta, columna, delimitador,
+                                        encabezado, tamano_bloque):
+            try:
+                valores.extend(map(float, bloque))
+            except ValueError as e:
+                raise TypeError("Todos los datos deben ser numéricos") from e
+        return cls(valores, **opciones)
+
+    _MAGICO = b'ACU'
+    _VERSION = 1
+    _ENCABEZADO = struct.Struct('<3sBBxxxQ')
+
+    @_perfilado
+    def serializar(self) -> bytes:
+        """
+        Instantánea binaria versionada: modo de cuantiles, momentos y, en
+        modo exacto, la muestra ordenada en float64 little-endian (8 bytes
+        por dato, sin los objetos de la lista original ni su copia
+        ordenada). En modo aproximado se guardan los compactores del
+        sketch KLL en lugar de la muestra (unos KB sin importar n).
+        """
+        encabezado = self._ENCABEZADO.pack(self._MAGICO, self._VERSION,
+                                           int(self.aproximado), self._k_sketch)
+        if self.aproximado:
+            cuerpo = self._obtener_sketch().serializar()
+        else:
+            cuerpo = _bytes_little_endian(self._ordenar_datos(), 'd')
+        return encabezado + self._obtener_momentos().serializar() + cuerpo
+
+    @classmethod
+    def deserializar(cls, datos: bytes, **opciones) -> 'AnalizadorCuantitativo':
+        """
+        Reconstruye el analizador a partir de serializar(). Con un
+        memoryview o mmap la muestra ordenada se usa sin copiarla; los
+        datos quedan en orden ascendente. Las instantáneas aproximadas se
+        reconstruyen sin datos crudos, desde sus momentos y su sketch.
+        
+        Args:
+            datos: Bytes de serializar() (bytes, memoryview o mmap)
+            **opciones: Argumentos adicionales para el constructor (backend, trabajadores)
+        """
+        datos = memoryview(datos)
+        magico, version, aproximado, k_sketch = cls._ENCABEZADO.unpack_from(datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de instantánea no reconocido")
+        inicio = cls._ENCABEZADO.size
+        momentos = AcumuladorMomentos.deserializar(datos[inicio:inicio + 64])
+        inicio += 64
+        if aproximado:
+            try:
+                sketch = SketchKLL.deserializar(datos[inicio:])
+            except struct.error as e:
+                raise ValueError("La instantánea está truncada") from e
+            opciones.pop('modo_cuantiles', None)
+            opciones.pop('k_sketch', None)
+            return cls(momentos=momentos, sketch=sketch, **opciones)
+        if len(datos) - inicio != 8 * momentos.n:
+            raise ValueError(f"La instantánea debería tener {momentos.n} datos "
+                             f"y tiene {(len(datos) - inicio) / 8:g}")
+        muestra = _buffer_little_endian(datos[inicio:], 'd')
+        opciones.setdefault('modo_cuantiles', 'exacto')
+        opciones.setdefault('k_sketch', k_sketch)
+        analizador = cls(muestra, **opciones)
+        analizador._datos_ordenados = (analizador._arreglo if analizador._arreglo is not None
+                                       else analizador._datos)
+        analizador._momentos = momentos
+        return analizador
+
+    def combinar(self, otro: 'AnalizadorCuantitativo') -> 'AnalizadorCuantitativo':
+        """
+        Fusiona la muestra de otro analizador (p. ej. una instantánea de
+        otra hora) sin volver a los datos crudos: las dos muestras ordenadas
+        se intercalan y los momentos se combinan con las fórmulas de Pébay.
+        Los datos quedan en orden ascendente. Si alguno de los dos no
+        conserva los datos crudos se combinan sus sketches KLL y el
+        resultado queda en modo aproximado, sin datos.
+        """
+        if self._datos is None or otro._datos is None:
+            sketch = SketchKLL(self._obtener_sketch().k).combinar(self._obtener_sketch())
+            sketch.combinar(otro._obtener_sketch())
+            momentos = AcumuladorMomentos().combinar(self._obtener_momentos())
+            momentos.combinar(otro._obtener_momentos())
+            self._datos = self._arreglo = self._datos_ordenados = None
+            self._n = momentos.n
+            self._momentos, self._momentos_compensados = momentos, None
+            self._sketch, self._k_sketch = sketch, sketch.k
+            self._modo_cuantiles = 'aproximado'
+            self._descartar_resultados()
+            return self
+        propios, ajenos = self._ordenar_datos(), otro._ordenar_datos()
+        if self._arreglo is not None:
+            ordenados = np.concatenate((propios, np.asarray(ajenos, dtype=np.float64)))
+            ordenados.sort(kind='mergesort')  # aprovecha los dos tramos ya ordenados
+            self._arreglo = ordenados
+        else:
+            ordenados = list(merge(propios, ajenos))
+        momentos = AcumuladorMomentos().combinar(self._obtener_momentos())
+        self._datos = self._datos_ordenados = ordenados
+        self._n = len(ordenados)
+        self._momentos = momentos.combinar(otro._obtener_momentos())
+        self._momentos_compensados = None
+        self._sketch = None
+        self._descartar_resultados()
+        return self
 
     def _validar_datos_numericos(self, datos):
-        """Valida que todos los elementos sean numéricos."""
+        """
+        Valida que todos los elementos sean numéricos. Los buffers tipados
+        y las secuencias de int/float se retornan sin copiar ni convertir
+        (moda y datos conservan los valores originales); cualquier otro
+        contenido (p. ej. textos numéricos o Decimal) se convierte a float.
+        """
+        if np is not None and isinstance(datos, np.ndarray):
+            if datos.dtype.kind in 'biuf':
+                return datos
+            return datos.astype(np.float64)
+        if _es_buffer_numerico(datos):
+            return datos
+        if _es_secuencia_numerica(datos):
+            return datos
         return [float(x) for x in datos]
     
     def _ordenar_datos(self):
         """Ordena los datos si aún no están ordenados."""
         if self._datos_ordenados is None:
-            self._datos_ordenados = sorted(self._datos)
+            valores = self._valores("Ordenar los datos")
+            self._registrar_pasada('ordenar')
+            if self._arreglo is not None:
+                self._datos_ordenados = np.sort(valores)
+            else:
+                self._datos_ordenados = sorted(valores)
         return self._datos_ordenados
+
+    def _obtener_momentos(self, compensado: bool = False) -> AcumuladorMomentos:
+        """
+        Calcula los momentos si aún no están calculados
+        
+        La primera llamada calcula en una sola pasada todos los momentos
+        (n, media, M2, M3, M4, mínimo y máximo); media, varianza, mínimo,
+        máximo, asimetría y curtosis se leen después de ese acumulador sin
+        volver a recorrer los datos.
+        
+        Args:
+            compensado: Si True usa sumas compensadas (math.fsum) por bloques,
+                más lentas pero sin pérdida de precisión por cancelación
+        """
+        if compensado:
+            if self._momentos_compensados is None:
+                valores = self._valores("La suma compensada")
+                self._registrar_pasada('momentos_compensados', 2)
+                self._momentos_compensados = _momentos_compensados(valores)
+            return self._momentos_compensados
+        if self._momentos is None or self._momentos.orden < 4:
+            valores = self._valores("Calcular los momentos")
+            self._registrar_pasada('momentos')
+            if self._trabajadores > 1:
+                if isinstance(valores, memoryview):
+                    valores = array(valores.format, valores)  # serializable
+                bloques = [(valores[inicio:fin],) for inicio, fin
+                           in _dividir_en_bloques(self._n, self._trabajadores)]
+                self._momentos = _reducir_en_paralelo(
+                    _momentos_de_bloque, bloques, self._trabajadores)
+            else:
+                self._momentos = _momentos_de_bloque(valores)
+        return self._momentos
     
-    def media(self) -> float:
-        """Calcula la media aritmética (promedio)."""
-        return sum(self._datos) / self._n
+    @_memoizado
+    def media(self, compensado: bool = False) -> float:
+        """
+        Calcula la media aritmética (promedio)
+        
+        Args:
+            compensado: Si True suma con math.fsum (más exacto, más lento)
+        """
+        return self._obtener_momentos(compensado).media
+    
+    def _estadisticos_orden(self, posiciones) -> Dict:
+        """
+        Retorna {k: k-ésimo menor valor} para las posiciones pedidas
+        Usa los datos ordenados si ya existen; si no, selección en O(n)
+        sin construir la copia ordenada completa.
+        """
+        if self._datos_ordenados is not None:
+            datos_ord = self._datos_ordenados
+            return {k: datos_ord[k] for k in posiciones}
+        self._valores("Los cuantiles exactos")
+        self._registrar_pasada('seleccion')
+        if self._arreglo is not None:
+            posiciones = sorted(set(posiciones))
+            particionado = np.partition(self._arreglo, posiciones)
+            return {k: particionado[k] for k in posiciones}
+        return _seleccionar_estadisticos_orden(self._datos, posiciones)
     
+    @_memoizado
     def mediana(self) -> float:
-        """Calcula la mediana (percentil 50)."""
-        datos_ord = self._ordenar_datos()
-        mitad = self._n // 2
-        
-        if self._n % 2 == 0:
-            return (datos_ord[mitad - 1] + datos_ord[mitad]) / 2
-        else:
-            return datos_ord[mitad]
+        """Calcula la mediana (percentil 50), tomada de Q2 de cuartiles()."""
+        return self.cuartiles()[1]
         
+    @_memoizado
     def moda(self) -> Union[List[float], str]:
-        """Calcula la moda (valor más frecuente)."""
-        frecuencias = Counter(self._datos)
-        max_freq = max(frecuencias.values())
-        
-        modas = [valor for valor, freq in frecuencias.items() if freq == max_freq]
+        """
+        Calcula la moda (valor más frecuente)
+        Recorre los datos ordenados por rachas, reutilizando el ordenamiento
+        que también usan mediana y percentiles. Si hay empate las modas se
+        retornan en el orden en que aparecen por primera vez en los datos.
+        """
+        self._valores("La moda")
+        datos_ord = self._ordenar_datos()
+        if self._arreglo is not None:
+            modas = self._modas_vectorizadas(datos_ord)
+        else:
+            modas = self._modas_por_rachas(datos_ord)
         
+        convertido = self._arreglo is not None and self._arreglo is not self._datos
+        if len(modas) < self._n and (len(modas) > 1 or convertido):
+            # Orden de primera aparición y, si el backend convirtió los datos,
+            # los valores originales (p. ej. int en lugar de float)
+            if np is not None and isinstance(self._datos, np.ndarray):
+                modas = self._datos[np.isin(self._datos, modas)].tolist()
+            else:
+                modas = filter(set(modas).__contains__, self._datos)
+            modas = list(dict.fromkeys(modas))
         if len(modas) == self._n:
             return "No hay moda (todos los valores son únicos)"
         elif len(modas) == 1:
             return modas[0]
         else:
             return modas  # Distribución multimodal
+
+    @staticmethod
+    def _modas_por_rachas(datos_ord) -> List[float]:
+        """Valores con la racha más larga dentro de una lista ordenada."""
+        n = len(datos_ord)
+        modas = []
+        max_freq = 0
+        inicio = 0
+        for i in range(1, n + 1):
+            if i == n or datos_ord[i] != datos_ord[inicio]:
+                freq = i - inicio
+                if freq > max_freq:
+                    max_freq = freq
+                    modas = [datos_ord[inicio]]
+                elif freq == max_freq:
+                    modas.append(datos_ord[inicio])
+                inicio = i
+        return modas
+
+    @staticmethod
+    def _modas_vectorizadas(datos_ord) -> List[float]:
+        """Equivalente vectorizado de _modas_por_rachas sobre un ndarray."""
+        inicios = np.flatnonzero(np.concatenate(
+            ([True], datos_ord[1:] != datos_ord[:-1])))
+        frecuencias = np.diff(np.append(inicios, datos_ord.size))
+        return datos_ord[inicios[frecuencias == frecuencias.max()]].tolist()
         
-    def varianza(self, muestral: bool = True) -> float:
+    @_memoizado
+    def varianza(self, muestral: bool = True, compensado: bool = False) -> float:
         """
         Calcula la varianza
         
         Args:
             muestral: Si True, usa n-1 (varianza muestral), si False usa n (poblacional)
+            compensado: Si True suma los desvíos con math.fsum (más exacto, más lento)
         """
-        media = self.media()
-        suma_cuadrados = sum((x - media) ** 2 for x in self._datos)
-        divisor = self._n - 1 if muestral else self._n
-        return suma_cuadrados / divisor
+        return self._obtener_momentos(compensado).varianza(muestral)
     
-    def desviacion_estandar(self, muestral: bool = True) -> float:
+    @_memoizado
+    def desviacion_estandar(self, muestral: bool = True, compensado: bool = False) -> float:
         """Calcula la desviación estándar"""
-        return math.sqrt(self.varianza(muestral))
+        return math.sqrt(self.varianza(muestral, compensado))
     
+    @_memoizado
     def coeficiente_variacion(self) -> float:
         """
         Calcula el coeficiente de variación (CV)
@@ -119,6 +2868,7 @@ class AnalizadorCuantitativo(AnalizadorBase):
             raise ValueError("No se puede calcular CV cuando la media es 0")
         return (self.desviacion_estandar() / media) * 100
     
+    @_perfilado
     def percentil(self, p: float) -> float:
         """
         Calcula el percentil p-ésimo usando interpolación lineal
@@ -126,139 +2876,904 @@ class AnalizadorCuantitativo(AnalizadorBase):
         Args:
             p: Percentil a calcular (0-100)
         """
-        if not 0 <= p <= 100:
-            raise ValueError("El percentil debe estar entre 0 y 100")
-        
-        datos_ord = self._ordenar_datos()
-        
-        if p == 0:
-            return datos_ord[0]
-        if p == 100:
-            return datos_ord[-1]
+        return self.percentiles([p])[0]
+    
+    @_memoizado
+    def percentiles(self, ps: List[float]) -> List[float]:
+        """
+        Calcula varios percentiles a la vez con la misma interpolación
+        lineal que percentil(), seleccionando sólo los estadísticos de
+        orden necesarios en O(n) esperado en lugar de ordenar los datos
         
-        # Método de interpolación lineal
-        indice = (p / 100) * (self._n - 1)
-        indice_inferior = int(indice)
-        indice_superior = indice_inferior + 1
-        fraccion = indice - indice_inferior
+        Args:
+            ps: Percentiles a calcular (0-100)
+        """
+        for p in ps:
+            if not 0 <= p <= 100:
+                raise ValueError("El percentil debe estar entre 0 y 100")
+        if self.aproximado:
+            return self._obtener_sketch().cuantiles([p / 100 for p in ps])
         
-        return datos_ord[indice_inferior] + fraccion * (
-            datos_ord[indice_superior] - datos_ord[indice_inferior])
+        valores = _interpolar_percentiles(self._n, ps, self._estadisticos_orden)
+        if self._arreglo is not None:
+            return [float(valor) for valor in valores]
+        return valores
     
+    @_memoizado
     def cuartiles(self) -> Tuple[float, float, float]:
         """Retorna los cuartiles Q1, Q2, Q3"""
-        return (self.percentil(25), self.percentil(50), self.percentil(75))
+        return tuple(self.percentiles([25, 50, 75]))
     
+    @_memoizado
     def rango_intercuartilico(self) -> float:
         """Calcula el rango intercuartílico (IQR)"""
         q1, _, q3 = self.cuartiles()
         return q3 - q1
 
-    def asimetria(self) -> float:
+    @_memoizado
+    def asimetria(self, compensado: bool = False) -> float:
         """
         Calcula el coeficiente de asimetría de Fisher (sesgo)
         > 0: asimétrica a la derecha
         < 0: asimétrica a la izquierda
         ≈ 0: simétrica
-        """
-        if self._n < 3:
-            raise ValueError("Se necesitan al menos 3 datos para calcular asimetría")
-        
-        media = self.media()
-        desv_std = self.desviacion_estandar(muestral=True)
         
-        if desv_std == 0:
-            return 0.0
-        
-        suma_cubos = sum(((x - media) / desv_std) ** 3 for x in self._datos)
-        # Fórmula de Fisher para asimetría muestral
-        return (self._n * suma_cubos) / ((self._n - 1) * (self._n - 2))
+        Args:
+            compensado: Si True suma los desvíos con math.fsum (más exacto, más lento)
+        """
+        return self._obtener_momentos(compensado).asimetria()
         
-    def curtosis(self) -> float:
+    @_memoizado
+    def curtosis(self, compensado: bool = False) -> float:
         """
         Calcula el coeficiente de curtosis (exceso de curtosis)
         > 0: leptocúrtica (colas pesadas)
         < 0: platicúrtica (colas ligeras)
         ≈ 0: mesocúrtica (similar a normal)
+        
+        Args:
+            compensado: Si True suma los desvíos con math.fsum (más exacto, más lento)
         """
-        if self._n < 4:
-            raise ValueError("Se necesitan al menos 4 datos para calcular curtosis")
+        return self._obtener_momentos(compensado).curtosis()
         
-        media = self.media()
-        desv_std = self.desviacion_estandar(muestral=True)
+    @_memoizado
+    def minimo(self) -> float:
+        """Retorna el valor mínimo"""
+        return self._obtener_momentos().minimo
+    @_memoizado
+    def maximo(self) -> float:
+        """Retorna el valor máximo"""
+        return self._obtener_momentos().maximo
+    @_memoizado
+    def rango(self) -> float:
+        """Calcula el rango (máximo - mínimo)"""
+        return self.maximo() - self.minimo()
+    @_perfilado
+    def resumen(self) -> Dict:
+        """
+        Genera un resumen estadístico completo
+        En modo aproximado se omite la moda (requiere ordenar todos los
+        datos) y se informa el error de rango de los cuantiles.
+        """
+        self._obtener_momentos()  # todos los momentos en un solo cálculo
+        # La moda ordena los datos; cuartiles y mediana reutilizan esa copia
+        moda = None if self.aproximado else self.moda()
+        q1, q2, q3 = self.cuartiles()
         
-        if desv_std == 0:
-            return 0.0
+        resumen = {
+            'n': self._n,
+            'media': round(self.media(), 4),
+            'mediana': round(self.mediana(), 4),
+            'moda': moda,
+            'desviacion_estandar': round(self.desviacion_estandar(), 4),
+            'varianza': round(self.varianza(), 4),
+            'coeficiente_variacion': round(self.coeficiente_variacion(), 2),
+            'minimo': round(self.minimo(), 4),
+            'maximo': round(self.maximo(), 4),
+            'rango': round(self.rango(), 4),
+            'Q1': round(q1, 4),
+            'Q2': round(q2, 4),
+            'Q3': round(q3, 4),
+            'IQR': round(self.rango_intercuartilico(), 4),
+            'asimetria': round(self.asimetria(), 4),
+            'curtosis': round(self.curtosis(), 4)}
+        if self.aproximado:
+            del resumen['moda']
+            resumen['error_cuantiles'] = round(self.error_cuantiles(), 4)
+        return resumen
+    @_perfilado
+    def histograma(self, metodo: str = 'freedman-diaconis', num_bins: int = 10) -> Dict:
+        """
+        Calcula un histograma de los datos
+        
+        Args:
+            metodo: 'fijo' (num_bins de igual ancho), 'freedman-diaconis'
+                (ancho 2·IQR/∛n; si el IQR es 0 se usan num_bins, y el
+                número de intervalos se limita a max(Sturges, √n)) o 'log'
+                (num_bins con bordes en escala logarítmica; datos > 0)
+            num_bins: Número de intervalos para 'fijo' y 'log'
         
-        suma_cuartos = sum(((x - media) / desv_std) ** 4 for x in self._datos)
+        Returns:
+            {'bordes': num_bins + 1 bordes, 'frecuencias': conteo por
+            intervalo}; los intervalos son [a, b) salvo el último, [a, b].
+            Si todos los datos son iguales se retorna un único intervalo
+        """
+        if metodo not in ('fijo', 'freedman-diaconis', 'log'):
+            raise ValueError("El método debe ser 'fijo', 'freedman-diaconis' o 'log'")
+        if num_bins < 1:
+            raise ValueError("Se necesita al menos un intervalo")
+        minimo, maximo = float(self.minimo()), float(self.maximo())
+        if metodo == 'log' and minimo <= 0:
+            raise ValueError("Los intervalos logarítmicos requieren datos positivos")
+        if maximo == minimo:
+            return {'bordes': [minimo, maximo], 'frecuencias': [self._n]}
+        if metodo == 'freedman-diaconis':
+            ancho = 2 * self.rango_intercuartilico() / self._n ** (1 / 3)
+            if ancho > 0:
+                # Con un IQR diminuto el ancho saldría casi nulo
+                limite = max(math.ceil(math.log2(self._n)) + 1, math.ceil(math.sqrt(self._n)))
+                num_bins = max(1, min(math.ceil((maximo - minimo) / ancho), limite))
+        if metodo == 'log':
+            razon = (maximo / minimo) ** (1 / num_bins)
+            bordes = [minimo * razon ** i for i in range(num_bins)] + [maximo]
+        else:
+            ancho = (maximo - minimo) / num_bins
+            bordes = [minimo + ancho * i for i in range(num_bins)] + [maximo]
         
-        # Fórmula de Fisher para curtosis muestral (exceso de curtosis)
-        n = self._n
-        termino1 = (n * (n + 1)) / ((n - 1) * (n - 2) * (n - 3))
-        termino2 = (3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+        valores = self._valores("El histograma")
+        if self._arreglo is not None:
+            frecuencias = np.histogram(valores, bordes)[0].tolist()
+        else:
+            frecuencias = [0] * num_bins
+            ultimo = num_bins - 1
+            for x in valores:
+                frecuencias[min(bisect_right(bordes, x) - 1, ultimo)] += 1
+        return {'bordes': bordes, 'frecuencias': frecuencias}
+    @_perfilado
+    def histograma_hdr(self, error_relativo: float = 0.01) -> HistogramaHDR:
+        """
+        Construye un HistogramaHDR de los datos en una pasada
+        Sus percentiles son una alternativa barata a percentil() con error
+        relativo acotado, y el histograma se puede seguir actualizando o
+        combinar con el de otros trabajadores.
+        """
+        return HistogramaHDR(error_relativo).extender(self._valores("El histograma HDR"))
+    @_perfilado
+    def intervalo_confianza(self, estadistico: str = 'media', nivel: float = 0.95,
+                            replicas: int = 1000, p: float = None, semilla: int = None,
+                            trabajadores: int = None) -> Dict:
+        """
+        Intervalo de confianza bootstrap (método de percentiles)
         
-        return termino1 * suma_cuartos - termino2
+        Args:
+            estadistico: 'media', 'mediana' o 'percentil'
+            nivel: Nivel de confianza (0-1)
+            replicas: Número de remuestras
+            p: Percentil (0-100) cuando estadistico='percentil'
+            semilla: Semilla para resultados reproducibles
+            trabajadores: Procesos entre los que se reparten las réplicas
+                (por defecto los del analizador)
+        
+        Returns:
+            {'estadistico', 'estimacion', 'inferior', 'superior', 'nivel',
+            'replicas', 'error_estandar'}
+        """
+        if estadistico == 'media':
+            estimacion, p = self.media(), 50
+        elif estadistico == 'mediana':
+            estimacion, p = self.mediana(), 50
+        elif estadistico == 'percentil':
+            if p is None:
+                raise ValueError("Se debe indicar el percentil p")
+            estimacion = self.percentil(p)
+        else:
+            raise ValueError("El estadístico debe ser 'media', 'mediana' o 'percentil'")
+        datos = self._valores("El bootstrap")
+        nombre = 'percentil' if estadistico == 'mediana' else estadistico
+        resultado = _bootstrap(nombre, [datos], estimacion, nivel, replicas, semilla,
+                               trabajadores or self._trabajadores, p)
+        resultado['estadistico'] = estadistico
+        return resultado
+    @_perfilado
+    def resumen_cinco_numeros(self) -> Dict:
+        """Retorna el resumen de cinco números de Tukey"""
+        q1, q2, q3 = self.cuartiles()
+        resumen = {
+            'minimo': self.minimo(),
+            'Q1': q1,
+            'mediana': q2,
+            'Q3': q3,
+            'maximo': self.maximo()}
+        if self.aproximado:
+            resumen['error_cuantiles'] = self.error_cuantiles()
+        return resumen
+    def estadisticas_moviles(self, tamano: int = None, duracion: float = None,
+                             marcas_tiempo: List[float] = None,
+                             percentiles: Tuple[float, ...] = (50, 95)):
+        """
+        Genera las estadísticas de una ventana deslizante para cada posición
+        
+        Con `tamano` se emite un resumen por cada ventana completa; con
+        `duracion` (y las marcas de tiempo de cada dato) se emite uno por
+        dato con los valores de los últimos `duracion`. Cada paso cuesta
+        O(1) u O(log w) amortizado (ver VentanaMovil).
+        
+        Args:
+            tamano: Número de valores de la ventana
+            duracion: Ancho temporal de la ventana
+            marcas_tiempo: Marca de tiempo no decreciente de cada dato
+            percentiles: Percentiles a incluir (claves 'p50', 'p95', ...)
+        """
+        self._valores("Las estadísticas móviles")
+        ventana = VentanaMovil(tamano=tamano, duracion=duracion)
+        if duracion is not None:
+            if marcas_tiempo is None or len(marcas_tiempo) != self._n:
+                raise ValueError("Se requiere una marca de tiempo por cada dato")
+            for indice, (x, marca) in enumerate(zip(self._datos, marcas_tiempo)):
+                ventana.agregar(x, marca)
+                yield {'indice': indice, 'marca_tiempo': marca, **ventana.resumen(percentiles)}
+            return
+        for indice, x in enumerate(self._datos):
+            ventana.agregar(x)
+            if indice >= tamano - 1:
+                yield {'indice': indice, **ventana.resumen(percentiles)}
+
+class AnalizadorCuantitativoIncremental(AnalizadorBase):
+    """
+    Analizador cuantitativo para flujos de datos
+    
+    Mantiene actualizados en O(1) por muestra los momentos, el mínimo, el
+    máximo y (opcionalmente) las frecuencias, sin retener los datos crudos.
+    Por defecto la memoria es constante; contar frecuencias la hace crecer
+    con el número de valores distintos.
+    Admite agregar valores sueltos, extender con iterables de cualquier
+    tamaño y combinarse con otro analizador incremental. Con k_sketch
+    también mantiene un SketchKLL para percentiles aproximados.
+    """
+    
+    __slots__ = ('_momentos', '_frecuencias', '_sketch')
+    
+    TAMANO_BLOQUE = 65536
+    
+    def __init__(self, datos=None, contar_frecuencias: bool = False,
+                 k_sketch: int = None):
+        """
+        Args:
+            datos: Iterable inicial opcional
+            contar_frecuencias: Si True guarda el conteo por valor para
+                moda(); la memoria crece con los valores distintos (con
+                datos continuos, con n). Sólo conviene con datos discretos
+                de baja cardinalidad
+            k_sketch: Si se indica, precisión del sketch KLL de cuantiles
+        """
+        self._datos = None
+        self._iniciar_cache()
+        self._momentos = AcumuladorMomentos()
+        self._frecuencias = Counter() if contar_frecuencias else None
+        self._sketch = SketchKLL(k_sketch) if k_sketch is not None else None
+        if datos is not None:
+            self.extender(datos)
+    
+    @property
+    def datos(self):
+        """El analizador incremental no conserva los datos crudos."""
+        return None
+    
+    @property
+    def n(self):
+        """Retorna el número de muestras procesadas."""
+        return self._momentos.n
+    
+    def agregar(self, x: Union[int, float]) -> 'AnalizadorCuantitativoIncremental':
+        """Incorpora un valor al análisis."""
+        try:
+            valor = float(x)
+        except (ValueError, TypeError) as e:
+            raise TypeError("Todos los datos deben ser numéricos") from e
+        if self._cache:
+            self._descartar_resultados()
+        self._momentos.agregar(valor)
+        if self._frecuencias is not None:
+            self._frecuencias[valor] += 1
+        if self._sketch is not None:
+            self._sketch.agregar(valor)
+        return self
+    
+    def extender(self, datos) -> 'AnalizadorCuantitativoIncremental':
+        """Incorpora todos los valores de un iterable, procesándolo por bloques."""
+        self._descartar_resultados()
+        iterador = iter(datos)
+        while True:
+            bloque = list(islice(iterador, self.TAMANO_BLOQUE))
+            if not bloque:
+                return self
+            try:
+                valores = [float(x) for x in bloque]
+            except (ValueError, TypeError) as e:
+                raise TypeError("Todos los datos deben ser numéricos") from e
+            self._momentos.extender(valores)
+            if self._frecuencias is not None:
+                self._frecuencias.update(valores)
+            if self._sketch is not None:
+                self._sketch.extender(valores)
+    
+    def combinar(self, otro: 'AnalizadorCuantitativoIncremental') -> 'AnalizadorCuantitativoIncremental':
+        """Fusiona el estado de otro analizador incremental (p. ej. otra partición)."""
+        self._descartar_resultados()
+        self._momentos.combinar(otro._momentos)
+        if self._frecuencias is not None:
+            if otro._frecuencias is None:
+                self._frecuencias = None
+            else:
+                self._frecuencias.update(otro._frecuencias)
+        if self._sketch is not None:
+            if otro._sketch is None:
+                self._sketch = None
+            else:
+                self._sketch.combinar(otro._sketch)
+        return self
+    
+    _MAGICO = b'ACI'
+    _VERSION = 1
+    _ENCABEZADO = struct.Struct('<3sBBxxxQ')
+    
+    @_perfilado
+    def serializar(self) -> bytes:
+        """
+        Instantánea binaria versionada: momentos, tabla de frecuencias
+        (valores float64 y conteos uint64) si se cuentan y sketch KLL si
+        existe.
+        """
+        banderas = (self._frecuencias is not None) | (self._sketch is not None) << 1
+        frecuencias = self._frecuencias or {}
+        partes = [self._ENCABEZADO.pack(self._MAGICO, self._VERSION, banderas, len(frecuencias)),
+                  self._momentos.serializar()]
+        if frecuencias:
+            partes.append(_bytes_little_endian([float(x) for x in frecuencias], 'd'))
+            partes.append(_bytes_little_endian(list(frecuencias.values()), 'Q'))
+        if self._sketch is not None:
+            partes.append(self._sketch.serializar())
+        return b''.join(partes)
+    
+    @classmethod
+    def deserializar(cls, datos: bytes) -> 'AnalizadorCuantitativoIncremental':
+        """Reconstruye el analizador a partir de serializar()."""
+        datos = memoryview(datos)
+        magico, version, banderas, distintos = cls._ENCABEZADO.unpack_from(datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de instantánea no reconocido")
+        analizador = cls(contar_frecuencias=bool(banderas & 1))
+        inicio = cls._ENCABEZADO.size
+        analizador._momentos = AcumuladorMomentos.deserializar(datos[inicio:inicio + 64])
+        inicio += 64
+        if distintos:
+            valores = _buffer_little_endian(datos[inicio:inicio + 8 * distintos], 'd')
+            inicio += 8 * distintos
+            conteos = _buffer_little_endian(datos[inicio:inicio + 8 * distintos], 'Q')
+            inicio += 8 * distintos
+            analizador._frecuencias.update(dict(zip(valores.tolist(), conteos.tolist())))
+        if banderas & 2:
+            analizador._sketch = SketchKLL.deserializar(datos[inicio:])
+        return analizador
+    
+    def _obtener_momentos(self) -> AcumuladorMomentos:
+        """Retorna los momentos acumulados, validando que haya datos."""
+        if self._momentos.n == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        return self._momentos
+    
+    @_memoizado
+    def media(self) -> float:
+        """Calcula la media aritmética (promedio)."""
+        return self._obtener_momentos().media
+    
+    @_memoizado
+    def moda(self) -> Union[List[float], str]:
+        """
+        Calcula la moda a partir del conteo de frecuencias
+        
+        Se cuentan los valores ya convertidos a float ('3', 3 y 3.0 son el
+        mismo valor); los empates se devuelven en orden de primera aparición.
+        """
+        if self._frecuencias is None:
+            raise ValueError("La moda requiere contar_frecuencias=True")
+        self._obtener_momentos()
+        max_freq = max(self._frecuencias.values())
+        modas = [valor for valor, freq in self._frecuencias.items() if freq == max_freq]
         
+        if len(modas) == self.n:
+            return "No hay moda (todos los valores son únicos)"
+        elif len(modas) == 1:
+            return modas[0]
+        else:
+            return modas  # Distribución multimodal
+    
+    @_memoizado
+    def varianza(self, muestral: bool = True) -> float:
+        """Calcula la varianza (muestral con n-1 o poblacional con n)."""
+        return self._obtener_momentos().varianza(muestral)
+    
+    @_memoizado
+    def desviacion_estandar(self, muestral: bool = True) -> float:
+        """Calcula la desviación estándar"""
+        return math.sqrt(self.varianza(muestral))
+    
+    @_memoizado
+    def coeficiente_variacion(self) -> float:
+        """Calcula el coeficiente de variación (CV)"""
+        media = self.media()
+        if media == 0:
+            raise ValueError("No se puede calcular CV cuando la media es 0")
+        return (self.desviacion_estandar() / media) * 100
+    
+    @_memoizado
+    def asimetria(self) -> float:
+        """Calcula el coeficiente de asimetría de Fisher (sesgo)"""
+        return self._obtener_momentos().asimetria()
+    
+    @_memoizado
+    def curtosis(self) -> float:
+        """Calcula el coeficiente de curtosis (exceso de curtosis)"""
+        return self._obtener_momentos().curtosis()
+    
+    @_memoizado
     def minimo(self) -> float:
         """Retorna el valor mínimo"""
-        return min(self._datos)
+        return self._obtener_momentos().minimo
+    
+    @_memoizado
     def maximo(self) -> float:
         """Retorna el valor máximo"""
-        return max(self._datos)
+        return self._obtener_momentos().maximo
+    
+    @_memoizado
     def rango(self) -> float:
         """Calcula el rango (máximo - mínimo)"""
         return self.maximo() - self.minimo()
-    def resumen(self) -> Dict:
-        """Genera un resumen estadístico completo"""
+    
+    def _obtener_sketch(self) -> SketchKLL:
+        """Retorna el sketch de cuantiles, validando que exista y tenga datos."""
+        if self._sketch is None:
+            raise ValueError("Los percentiles requieren crear el analizador con k_sketch")
+        self._obtener_momentos()
+        return self._sketch
+    
+    @_memoizado
+    def percentiles(self, ps: List[float]) -> List[float]:
+        """Calcula percentiles aproximados (0-100) con el sketch KLL"""
+        for p in ps:
+            if not 0 <= p <= 100:
+                raise ValueError("El percentil debe estar entre 0 y 100")
+        return self._obtener_sketch().cuantiles([p / 100 for p in ps])
+    
+    @_perfilado
+    def percentil(self, p: float) -> float:
+        """Calcula un percentil aproximado (0-100)"""
+        return self.percentiles([p])[0]
+    
+    @_memoizado
+    def mediana(self) -> float:
+        """Calcula la mediana aproximada"""
+        return self.percentil(50)
+    
+    @_memoizado
+    def cuartiles(self) -> Tuple[float, float, float]:
+        """Retorna los cuartiles Q1, Q2, Q3 aproximados"""
+        return tuple(self.percentiles([25, 50, 75]))
+    
+    @_memoizado
+    def rango_intercuartilico(self) -> float:
+        """Calcula el rango intercuartílico (IQR) aproximado"""
+        q1, _, q3 = self.cuartiles()
+        return q3 - q1
+    
+    @_perfilado
+    def error_cuantiles(self) -> float:
+        """Error de rango normalizado de los cuantiles del sketch"""
+        return self._obtener_sketch().error_rango()
+    
+    @_perfilado
+    def resumen_cinco_numeros(self) -> Dict:
+        """Retorna el resumen de cinco números de Tukey (cuartiles aproximados)"""
         q1, q2, q3 = self.cuartiles()
-        
         return {
-            'n': self._n,
+            'minimo': self.minimo(),
+            'Q1': q1,
+            'mediana': q2,
+            'Q3': q3,
+            'maximo': self.maximo(),
+            'error_cuantiles': self.error_cuantiles()}
+    
+    @_perfilado
+    def resumen(self) -> Dict:
+        """Genera un resumen con las medidas disponibles sin datos crudos"""
+        resumen = {
+            'n': self.n,
             'media': round(self.media(), 4),
-            'mediana': round(self.mediana(), 4),
-            'moda': self.moda(),
             'desviacion_estandar': round(self.desviacion_estandar(), 4),
             'varianza': round(self.varianza(), 4),
             'coeficiente_variacion': round(self.coeficiente_variacion(), 2),
             'minimo': round(self.minimo(), 4),
             'maximo': round(self.maximo(), 4),
             'rango': round(self.rango(), 4),
+            'asimetria': round(self.asimetria(), 4),
+            'curtosis': round(self.curtosis(), 4)}
+        if self._frecuencias is not None:
+            resumen['moda'] = self.moda()
+        if self._sketch is not None:
+            q1, q2, q3 = self.cuartiles()
+            resumen.update({
+                'mediana': round(q2, 4),
+                'Q1': round(q1, 4),
+                'Q2': round(q2, 4),
+                'Q3': round(q3, 4),
+                'IQR': round(q3 - q1, 4),
+                'error_cuantiles': round(self.error_cuantiles(), 4)})
+        return resumen
+
+
+class AnalizadorAgrupado(AnalizadorBase):
+    """
+    Analizador cuantitativo por grupos (equivalente a un "group by")
+    
+    Recorre una sola vez las columnas de claves y valores, actualizando un
+    AcumuladorMomentos por grupo y guardando los valores de cada grupo en
+    un array('d') compacto (o, en modo aproximado, un SketchKLL) para los
+    cuartiles. resumen() retorna {clave: resumen del grupo}.
+    """
+    
+    __slots__ = ('_claves', '_momentos', '_valores', '_aproximado', '_k_sketch')
+    
+    def __init__(self, claves: List, valores: List[Union[int, float]],
+                 modo_cuantiles: str = 'exacto', k_sketch: int = 200):
+        """
+        Args:
+            claves: Columna con la clave de grupo de cada fila
+            valores: Columna numérica a resumir
+            modo_cuantiles: 'exacto' o 'aproximado' (sketch KLL por grupo)
+            k_sketch: Precisión del sketch KLL en modo aproximado
+        """
+        if len(claves) != len(valores):
+            raise ValueError("Las claves y los valores deben tener el mismo tamaño")
+        if modo_cuantiles not in AnalizadorCuantitativo.MODOS_CUANTILES:
+            raise ValueError("El modo de cuantiles debe ser 'exacto' o 'aproximado'")
+        super().__init__(valores)
+        self._claves = claves
+        self._aproximado = modo_cuantiles == 'aproximado'
+        self._k_sketch = k_sketch
+        self._momentos = {}
+        self._valores = {}
+        
+        # Métodos de actualización por grupo, resueltos una sola vez
+        agregadores = {}
+        try:
+            for clave, x in zip(claves, valores):
+                destino = agregadores.get(clave)
+                if destino is None:
+                    destino = agregadores[clave] = self._crear_grupo(clave)
+                agregar_momentos, agregar_valor = destino
+                valor = float(x)
+                agregar_momentos(valor)
+                agregar_valor(valor)
+        except (ValueError, TypeError) as e:
+            raise TypeError("Todos los datos deben ser numéricos") from e
+    
+    def _crear_grupo(self, clave) -> Tuple:
+        """Crea los acumuladores de un grupo nuevo y retorna sus métodos de actualización"""
+        momentos = self._momentos[clave] = AcumuladorMomentos()
+        if self._aproximado:
+            sketch = self._valores[clave] = SketchKLL(self._k_sketch)
+            return momentos.agregar, sketch.agregar
+        valores = self._valores[clave] = array('d')
+        return momentos.agregar, valores.append
+    
+    def grupos(self) -> List:
+        """Retorna las claves de grupo en orden de aparición"""
+        return list(self._momentos)
+    
+    @_perfilado
+    def resumen_grupo(self, clave) -> Dict:
+        """
+        Genera el resumen de un grupo
+        Las medidas que el tamaño del grupo no permite calcular son None.
+        """
+        if clave not in self._momentos:
+            raise KeyError(f"El grupo {clave!r} no existe")
+        momentos = self._momentos[clave]
+        n = momentos.n
+        if self._aproximado:
+            q1, q2, q3 = self._valores[clave].cuantiles([0.25, 0.5, 0.75])
+        else:
+            valores = self._valores[clave]
+            q1, q2, q3 = _interpolar_percentiles(
+                n, [25, 50, 75],
+                lambda posiciones: _seleccionar_estadisticos_orden(valores, posiciones))
+        
+        varianza = momentos.varianza() if n > 1 else None
+        desviacion = math.sqrt(varianza) if varianza is not None else None
+        
+        def redondear(valor, decimales=4):
+            return round(valor, decimales) if valor is not None else None
+        
+        resumen = {
+            'n': n,
+            'media': round(momentos.media, 4),
+            'mediana': round(q2, 4),
+            'desviacion_estandar': redondear(desviacion),
+            'varianza': redondear(varianza),
+            'coeficiente_variacion': redondear(
+                desviacion / momentos.media * 100 if desviacion is not None
+                and momentos.media != 0 else None, 2),
+            'minimo': round(momentos.minimo, 4),
+            'maximo': round(momentos.maximo, 4),
+            'rango': round(momentos.maximo - momentos.minimo, 4),
             'Q1': round(q1, 4),
             'Q2': round(q2, 4),
             'Q3': round(q3, 4),
-            'IQR': round(self.rango_intercuartilico(), 4),
-            'asimetria': round(self.asimetria(), 4),
-            'curtosis': round(self.curtosis(), 4)}
-    def resumen_cinco_numeros(self) -> Dict:
-        """Retorna el resumen de cinco números de Tukey"""
-        q1, q2, q3 = self.cuartiles()
-        return {
-            'minimo': self.minimo(),
-            'Q1': q1,
-            'mediana': q2,
-            'Q3': q3,
-            'maximo': self.maximo()}
+            'IQR': round(q3 - q1, 4),
+            'asimetria': redondear(momentos.asimetria() if n >= 3 else None),
+            'curtosis': redondear(momentos.curtosis() if n >= 4 else None)}
+        if self._aproximado:
+            resumen['error_cuantiles'] = round(self._valores[clave].error_rango(), 4)
+        return resumen
+    
+    @_perfilado
+    def resumen(self) -> Dict:
+        """Genera el resumen estadístico de cada grupo: {clave: resumen}"""
+        return {clave: self.resumen_grupo(clave) for clave in self._momentos}
+
+
 class AnalizadorCualitativo(AnalizadorBase):
-    """Analizador para datos categóricos o nominales"""
-    def __init__(self, datos: List):
-        super().__init__(datos)
-        self._frecuencias = None
+    """
+    Analizador para datos categóricos o nominales
+    
+    Con modo='aproximado' no se construye el Counter completo: en una
+    pasada por bloques se alimentan un SketchMisraGries (candidatos a
+    categorías más frecuentes) y un SketchCountMin (frecuencia estimada de
+    cada candidato). Moda, frecuencias y tabla de frecuencias se responden
+    sobre esos candidatos en memoria acotada; cada frecuencia estimada
+    excede la real en a lo sumo error_frecuencias() (con prob. 1 - delta).
+    En la misma pasada un SketchHyperLogLog estima categorias_unicas().
+    
+    Con codificar=True (o desde_codigos / desde_archivo) los datos se
+    guardan codificados por diccionario: la lista de categorías distintas
+    más un array('I') de códigos, de 4 bytes por dato. Las frecuencias se
+    obtienen entonces con un conteo por código (bincount).
+    """
+    
+    __slots__ = ('_frecuencias', '_modo', '_top_k', '_epsilon', '_delta', '_precision_hll',
+                 '_sketch_conteo', '_sketch_distintos', '_categorias')
+    MODOS = ('exacto', 'aproximado')
+    TAMANO_BLOQUE = 65536
+    def __init__(self, datos: List = None, modo: str = 'exacto', top_k: int = 100,
+                 epsilon: float = 0.001, delta: float = 0.01, precision_hll: int = 14,
+                 codificar: bool = False, frecuencias: Dict = None):
+        """
+        Args:
+            datos: Lista de categorías
+            modo: 'exacto' (Counter) o 'aproximado' (sketches)
+            top_k: Categorías candidatas que conserva el modo aproximado
+            epsilon: Error relativo del sketch Count-Min
+            delta: Probabilidad de exceder ese error
+            precision_hll: Precisión del HyperLogLog de categorías únicas
+            codificar: Si True guarda los datos codificados por diccionario
+                en lugar de conservar la lista original
+            frecuencias: Con datos=None, tabla {categoría: conteo} de la
+                muestra (sólo modo exacto). El analizador no conserva los
+                datos crudos: datos es None y tabla_contingencia() no está
+                disponible
+        """
+        if modo not in self.MODOS:
+            raise ValueError("El modo debe ser 'exacto' o 'aproximado'")
+        if datos is None and frecuencias is not None:
+            if modo != 'exacto' or codificar:
+                raise ValueError("Las frecuencias sólo se admiten en modo exacto y sin codificar")
+            frecuencias = Counter(frecuencias)
+            super().__init__(None, n=sum(frecuencias.values()))
+        else:
+            super().__init__(datos)
+        self._frecuencias = frecuencias
+        self._modo = modo
+        self._top_k = top_k
+        self._epsilon = epsilon
+        self._delta = delta
+        self._precision_hll = precision_hll
+        self._sketch_conteo = None
+        self._sketch_distintos = None
+        self._categorias = None
+        if codificar:
+            self._categorias, self._datos = _codificar_categorias([datos])
+    @property
+    def aproximado(self) -> bool:
+        """Indica si las frecuencias se estiman con sketches."""
+        return self._modo == 'aproximado'
+    @property
+    def codificado(self) -> bool:
+        """Indica si los datos están codificados por diccionario."""
+        return self._categorias is not None
+    @classmethod
+    def desde_codigos(cls, codigos, categorias: List, **opciones) -> 'AnalizadorCualitativo':
+        """
+        Crea el analizador a partir de datos ya codificados por diccionario
+        
+        Args:
+            codigos: Código entero de cada dato (lista, array, memoryview o ndarray)
+            categorias: Categoría correspondiente a cada código
+            **opciones: Argumentos adicionales del constructor (modo, top_k, ...)
+        """
+        if len(codigos):
+            if np is not None:
+                minimo, maximo = np.min(codigos), np.max(codigos)
+            else:
+                minimo, maximo = min(codigos), max(codigos)
+            if minimo < 0 or maximo >= len(categorias):
+                raise ValueError("Los códigos deben estar entre 0 y len(categorias) - 1")
+        analizador = cls(codigos, **opciones)
+        analizador._categorias = list(categorias)
+        return analizador
+    @classmethod
+    def desde_archivo(cls, ruta: str, columna: Union[int, str] = 0, formato: str = 'csv',
+                      delimitador: str = ',', encabezado: bool = True,
+                      tamano_bloque: int = 65536, categorias: List = None,
+                      **opciones) -> 'AnalizadorCualitativo':
+        """
+        Crea el analizador leyendo una columna categórica desde un archivo
+        
+        Los CSV se leen por bloques y se codifican por diccionario sobre la
+        marcha, sin crear la lista de str. Los archivos binarios de códigos
+        enteros ('i32', 'i64') se mapean en memoria con mmap y se usan sin
+        copiarlos; si se indican sus categorias quedan codificados.
+        
+        Args:
+            ruta: Ruta del archivo
+            columna: Índice o nombre de la columna (sólo CSV)
+            formato: 'csv', 'i32' o 'i64'
+            delimitador: Separador de campos del CSV
+            encabezado: Si la primera fila del CSV contiene los nombres
+            tamano_bloque: Filas leídas por bloque
+            categorias: Categoría de cada código (sólo binarios)
+            **opciones: Argumentos adicionales del constructor (modo, top_k, ...)
+        """
+        if formato != 'csv':
+            if formato not in ('i32', 'i64'):
+                raise ValueError("Formato debe ser 'csv', 'i32' o 'i64'")
+            codigos = _mapear_binario(ruta, formato)
+            if categorias is not None:
+                return cls.desde_codigos(codigos, categorias, **opciones)
+            return cls(codigos, **opciones)
+        categorias, codigos = _codificar_categorias(
+            _leer_columna_csv(ruta, columna, delimitador, encabezado, tamano_bloque))
+        if not codigos:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        return cls.desde_codigos(codigos, categorias, **opciones)
+    def _bloques_de_conteos(self):
+        """Conteos {categoría: cantidad} de cada bloque de TAMANO_BLOQUE datos"""
+        for inicio in range(0, self._n, self.TAMANO_BLOQUE):
+            conteo = Counter(self._datos[inicio:inicio + self.TAMANO_BLOQUE])
+            if self.codificado:
+                conteo = {self._categorias[codigo]: cantidad for codigo, cantidad in conteo.items()}
+            yield conteo
+    def _descartar_derivados(self):
+        """Descarta frecuencias y sketches si se conservan los datos de los que salen."""
+        if self._datos is not None:
+            self._n = len(self._datos)
+            self._frecuencias = None
+            self._sketch_conteo = None
+            self._sketch_distintos = None
     def _calcular_frecuencias(self):
-        """Calcula las frecuencias si aún no están calculadas"""
+        """
+        Calcula las frecuencias si aún no están calculadas
+        En modo aproximado sólo contiene las categorías candidatas, con su
+        frecuencia estimada por el sketch Count-Min.
+        """
         if self._frecuencias is None:
-            self._frecuencias = Counter(self._datos)
+            self._registrar_pasada('conteo')
+            if self.aproximado:
+                self._frecuencias = self._estimar_frecuencias()
+            elif self.codificado:
+                conteos = _contar_codigos(self._datos, len(self._categorias))
+                self._frecuencias = Counter({cat: cantidad for cat, cantidad
+                                             in zip(self._categorias, conteos) if cantidad})
+            else:
+                self._frecuencias = Counter(self._datos)
         return self._frecuencias
+    def _estimar_frecuencias(self) -> Dict:
+        """Construye los sketches en una pasada por bloques y estima los candidatos"""
+        conteo = SketchCountMin(self._epsilon, self._delta)
+        frecuentes = SketchMisraGries(self._top_k)
+        distintos = SketchHyperLogLog(self._precision_hll)
+        # Contar cada bloque primero: cada valor distinto se hashea una vez
+        for conteo_bloque in self._bloques_de_conteos():
+            bloque = conteo_bloque.items()
+            for valor, cantidad in bloque:
+                h = _hash_estable(valor)
+                conteo._agregar_hash(h, cantidad)
+                distintos._agregar_hash(h)
+            frecuentes.agregar_conteos(bloque)
+        self._sketch_conteo = conteo
+        self._sketch_distintos = distintos
+        return {cat: conteo.estimar(cat) for cat in frecuentes.candidatos()}
+    @_perfilado
+    def error_frecuencias(self) -> float:
+        """Sobreestimación máxima de las frecuencias absolutas (0 en modo exacto)"""
+        if not self.aproximado:
+            return 0.0
+        self._calcular_frecuencias()
+        return self._sketch_conteo.error_maximo()
+    def _validar_modo_exacto(self, medida: str):
+        if self.aproximado:
+            raise ValueError(f"{medida} requiere todas las frecuencias (modo='exacto')")
+    _MAGICO = b'ACL'
+    _VERSION = 1
+    _ENCABEZADO = struct.Struct('<3sBIQQ')
+    @_perfilado
+    def serializar(self) -> bytes:
+        """
+        Instantánea binaria versionada de la tabla de frecuencias: conteos
+        uint64 seguidos de las categorías en JSON (str, int, float, bool o
+        None), sin los datos crudos.
+        """
+        if self.aproximado:
+            raise ValueError("Las instantáneas no están disponibles en modo='aproximado': "
+                             "los sketches no conservan la tabla de frecuencias")
+        frecuencias = self._calcular_frecuencias()
+        categorias = list(frecuencias)
+        if not all(c is None or isinstance(c, (str, int, float)) for c in categorias):
+            raise TypeError("Sólo se pueden serializar categorías str, int, float, bool o None")
+        texto = json.dumps(categorias, ensure_ascii=False).encode('utf-8')
+        encabezado = self._ENCABEZADO.pack(self._MAGICO, self._VERSION, len(categorias),
+                                           self._n, len(texto))
+        return encabezado + _bytes_little_endian(list(frecuencias.values()), 'Q') + texto
+    @classmethod
+    def deserializar(cls, datos: bytes) -> 'AnalizadorCualitativo':
+        """
+        Reconstruye el analizador a partir de serializar(). El resultado
+        responde todas las medidas de frecuencias, pero no conserva los
+        datos crudos (datos es None y tabla_contingencia() no está disponible).
+        """
+        datos = memoryview(datos)
+        magico, version, distintas, n, longitud = cls._ENCABEZADO.unpack_from(datos, 0)
+        if magico != cls._MAGICO or version != cls._VERSION:
+            raise ValueError("Formato de instantánea no reconocido")
+        inicio = cls._ENCABEZADO.size
+        if len(datos) != inicio + 8 * distintas + longitud:
+            raise ValueError("La instantánea está truncada o tiene bytes de más")
+        conteos = _buffer_little_endian(datos[inicio:inicio + 8 * distintas], 'Q').tolist()
+        inicio += 8 * distintas
+        categorias = json.loads(bytes(datos[inicio:inicio + longitud]).decode('utf-8'))
+        if len(categorias) != distintas or sum(conteos) != n:
+            raise ValueError("La tabla de frecuencias no coincide con el tamaño de la muestra")
+        return cls(frecuencias=dict(zip(categorias, conteos)))
+    def combinar(self, otro: 'AnalizadorCualitativo') -> 'AnalizadorCualitativo':
+        """
+        Suma las frecuencias de otro analizador exacto (p. ej. instantáneas
+        de distintas horas); el resultado ya no conserva los datos crudos.
+        """
+        self._validar_modo_exacto("La combinación")
+        otro._validar_modo_exacto("La combinación")
+        frecuencias = Counter(self._calcular_frecuencias())
+        frecuencias.update(otro._calcular_frecuencias())
+        self._frecuencias = frecuencias
+        self._datos = None
+        self._categorias = None
+        self._n += otro._n
+        self._descartar_resultados()
+        return self
+    @_memoizado
     def frecuencias_absolutas(self) -> Dict:
         """Retorna las frecuencias absolutas de cada categoría"""
         return dict(self._calcular_frecuencias())
+    @_memoizado
     def frecuencias_relativas(self) -> Dict[str, float]:
         """Retorna las frecuencias relativas (proporciones)"""
         frec_abs = self._calcular_frecuencias()
         return {cat: freq / self._n for cat, freq in frec_abs.items()}
+    @_memoizado
     def frecuencias_porcentuales(self) -> Dict[str, float]:
         """Retorna las frecuencias en porcentaje"""
         frec_rel = self.frecuencias_relativas()
         return {cat: round(freq * 100, 2) for cat, freq in frec_rel.items()}
+    @_memoizado
     def moda(self) -> Union[List, str]:
         """Retorna la(s) categoría(s) más frecuente(s)"""
         frec = self._calcular_frecuencias()
@@ -269,53 +3784,114 @@ class AnalizadorCualitativo(AnalizadorBase):
             return modas[0]
         else:
             return modas
+    @_memoizado
     def categorias_unicas(self) -> int:
-        """Retorna el número de categorías únicas"""
+        """Retorna el número de categorías únicas (estimado con HyperLogLog en modo aproximado)"""
+        if self.aproximado:
+            self._calcular_frecuencias()
+            return self._sketch_distintos.cardinalidad()
         return len(self._calcular_frecuencias())
+    @_memoizado
     def entropia(self) -> float:
         """
         Calcula la entropía de Shannon
         Mide la incertidumbre o diversidad de las categorías
         """
-        frec_rel = self.frecuencias_relativas()
-        return -sum(p * math.log2(p) for p in frec_rel.values() if p > 0)
+        self._validar_modo_exacto("La entropía")
+        # H = log2(n) - Σ c·log2(c) / n, sobre los conteos enteros
+        conteos = self._calcular_frecuencias().values()
+        return math.log2(self._n) - math.fsum(c * math.log2(c) for c in conteos) / self._n
+    @_memoizado
     def indice_diversidad_simpson(self) -> float:
         """
         Calcula el índice de diversidad de Simpson
         Mide la probabilidad de que dos elementos elegidos al azar sean diferentes
         """
-        frec_rel = self.frecuencias_relativas()
-        return 1 - sum(p ** 2 for p in frec_rel.values())
-    def tabla_frecuencias(self) -> Dict:
-        """Genera una tabla de frecuencias completa"""
-        frec_abs = self.frecuencias_absolutas()
-        frec_rel = self.frecuencias_relativas()
-        frec_porc = self.frecuencias_porcentuales()
+        self._validar_modo_exacto("El índice de Simpson")
+        conteos = self._calcular_frecuencias().values()
+        return 1 - sum(c * c for c in conteos) / (self._n * self._n)
+    @_perfilado
+    def tabla_contingencia(self, claves: List) -> Dict:
+        """
+        Genera la tabla de contingencia de las categorías por grupo
+        Es el equivalente agrupado de tabla_frecuencias(): cuenta los pares
+        (clave, categoría) en una sola pasada.
+        
+        Args:
+            claves: Clave de grupo de cada dato (mismo tamaño que los datos)
+        """
+        if self._datos is None:
+            raise ValueError("La tabla de contingencia requiere los datos crudos")
+        if len(claves) != self._n:
+            raise ValueError("Las claves deben tener el mismo tamaño que los datos")
+        pares = Counter(zip(claves, self._datos))
+        if self.codificado:
+            pares = {(clave, self._categorias[codigo]): freq
+                     for (clave, codigo), freq in pares.items()}
+        
+        # Columnas ordenadas por frecuencia total descendente
+        frec_abs = self._calcular_frecuencias()
+        categorias = sorted(frec_abs, key=lambda x: frec_abs[x], reverse=True)
+        
+        tabla = {}
+        for (clave, categoria), freq in pares.items():
+            if clave not in tabla:
+                tabla[clave] = {'frecuencias': dict.fromkeys(categorias, 0), 'total': 0}
+            tabla[clave]['frecuencias'][categoria] = freq
+            tabla[clave]['total'] += freq
+        for fila in tabla.values():
+            fila['frecuencias_relativas'] = {
+                cat: round(freq / fila['total'], 4) for cat, freq in fila['frecuencias'].items()}
+        return tabla
+    @_perfilado
+    def tabla_frecuencias(self, top_k: int = None) -> Dict:
+        """
+        Genera una tabla de frecuencias completa
+        
+        Args:
+            top_k: Si se indica, sólo las top_k categorías más frecuentes
+                (se seleccionan con un heap en lugar de ordenar todas)
+        """
+        frec_abs = self._calcular_frecuencias()
         
         # Ordenar por frecuencia descendente
-        categorias_ordenadas = sorted(frec_abs.keys(), 
-                                      key=lambda x: frec_abs[x], 
-                                      reverse=True)
+        if top_k is not None:
+            categorias_ordenadas = nlargest(top_k, frec_abs.keys(), key=lambda x: frec_abs[x])
+        else:
+            categorias_ordenadas = sorted(frec_abs.keys(), 
+                                          key=lambda x: frec_abs[x], 
+                                          reverse=True)
         
         tabla = {}
         frec_acum = 0
         frec_rel_acum = 0.0
         
         for cat in categorias_ordenadas:
-            frec_acum += frec_abs[cat]
-            frec_rel_acum += frec_rel[cat]
+            frecuencia = frec_abs[cat]
+            frec_rel = frecuencia / self._n
+            frec_acum += frecuencia
+            frec_rel_acum += frec_rel
             
             tabla[cat] = {
-                'frecuencia_absoluta': frec_abs[cat],
-                'frecuencia_relativa': round(frec_rel[cat], 4),
-                'frecuencia_porcentual': frec_porc[cat],
+                'frecuencia_absoluta': frecuencia,
+                'frecuencia_relativa': round(frec_rel, 4),
+                'frecuencia_porcentual': round(frec_rel * 100, 2),
                 'frecuencia_acumulada': frec_acum,
                 'frecuencia_relativa_acumulada': round(frec_rel_acum, 4)
             }
         
         return tabla
+    @_perfilado
     def resumen(self) -> Dict:
         """Genera un resumen estadístico para datos cualitativos"""
+        if self.aproximado:
+            return {
+                'n': self._n,
+                'categorias_unicas': self.categorias_unicas(),
+                'moda': self.moda(),
+                'frecuencias': self.frecuencias_absolutas(),
+                'error_frecuencias': round(self.error_frecuencias(), 4)
+            }
         return {
             'n': self._n,
             'categorias_unicas': self.categorias_unicas(),
@@ -326,66 +3902,118 @@ class AnalizadorCualitativo(AnalizadorBase):
         }      
 
 class AnalizadorBivariado(AnalizadorBase):
-    """Analizador para relaciones entre dos variables cuantitativas"""
+    """
+    Analizador para relaciones entre dos variables cuantitativas
+    
+    Covarianza, correlación y regresión se leen de un AcumuladorComomentos
+    calculado una sola vez; con trabajadores > 1 se calcula por bloques en
+    un ProcessPoolExecutor.
+    """
+    
+    __slots__ = ('_x', '_y', '_trabajadores', '_comomentos')
     
     def __init__(self, datos_x: List[Union[int, float]], 
-                 datos_y: List[Union[int, float]]):
+                 datos_y: List[Union[int, float]], trabajadores: int = 1):
         if len(datos_x) != len(datos_y):
             raise ValueError("Las dos variables deben tener el mismo tamaño")
+        if trabajadores < 1:
+            raise ValueError("El número de trabajadores debe ser al menos 1")
          
-        super().__init__(list(zip(datos_x, datos_y)))
+        # Se guardan las dos columnas tal cual; los pares no se materializan
+        super().__init__(datos_x)
         self._x = datos_x
         self._y = datos_y
+        self._trabajadores = trabajadores
+        self._comomentos = None
 
-    def covarianza(self, muestral: bool = True) -> float:
-        """Calcula la covarianza entre X e Y"""
-        media_x = sum(self._x) / self._n
-        media_y = sum(self._y) / self._n
+    @property
+    def datos(self):
+        """Retorna los pares (x, y), construidos sólo si se piden."""
+        return list(zip(self._x, self._y))
+
+    def _descartar_derivados(self):
+        """Descarta los co-momentos si se conservan las columnas de las que salen."""
+        if self._x is not None:
+            if len(self._x) != len(self._y):
+                raise ValueError("Las dos variables deben tener el mismo tamaño")
+            self._n = len(self._x)
+            self._comomentos = None
+
+    def _obtener_comomentos(self, compensado: bool = False) -> AcumuladorComomentos:
+        """
+        Calcula los co-momentos en una sola pasada si aún no están calculados
         
-        suma_productos = sum((x - media_x) * (y - media_y) 
-                            for x, y in zip(self._x, self._y))
+        Args:
+            compensado: Si True los calcula con sumas compensadas (math.fsum)
+        """
+        if compensado:
+            self._registrar_pasada('comomentos_compensados', 2)
+            return _comomentos_compensados(self._x, self._y)
+        if self._comomentos is None:
+            self._registrar_pasada('comomentos')
+            if self._trabajadores > 1:
+                def porcion(columna, inicio, fin):
+                    if isinstance(columna, memoryview):
+                        return array(columna.format, columna[inicio:fin])  # serializable
+                    return columna[inicio:fin]
+                bloques = [(porcion(self._x, inicio, fin), porcion(self._y, inicio, fin))
+                           for inicio, fin in _dividir_en_bloques(self._n, self._trabajadores)]
+                self._comomentos = _reducir_en_paralelo(
+                    _comomentos_de_bloque, bloques, self._trabajadores)
+            else:
+                self._comomentos = _comomentos_de_bloque(self._x, self._y)
+        return self._comomentos
+
+    @_memoizado
+    def covarianza(self, muestral: bool = True, compensado: bool = False) -> float:
+        """
+        Calcula la covarianza entre X e Y
         
-        divisor = self._n - 1 if muestral else self._n
-        return suma_productos / divisor  
+        Args:
+            muestral: Si True, usa n-1 (muestral), si False usa n (poblacional)
+            compensado: Si True suma los productos con math.fsum (más exacto, más lento)
+        """
+        return self._obtener_comomentos(compensado).covarianza(muestral)
     
+    @_memoizado
     def correlacion_pearson(self) -> float:
         """
         Calcula el coeficiente de correlación de Pearson
         Mide la relación lineal entre X e Y (-1 a 1)
         """
-        # Calcular desviaciones estándar
-        analizador_x = AnalizadorCuantitativo(self._x)
-        analizador_y = AnalizadorCuantitativo(self._y)
-        
-        desv_x = analizador_x.desviacion_estandar()
-        desv_y = analizador_y.desviacion_estandar()
-        
-        if desv_x == 0 or desv_y == 0:
-            raise ValueError("No se puede calcular correlación con d.s 0")
-        
-        return self.covarianza() / (desv_x * desv_y)   
+        return self._obtener_comomentos().correlacion()
+    
+    @_memoizado
+    def correlacion_spearman(self) -> float:
+        """
+        Calcula el coeficiente de correlación de Spearman
+        Es la correlación de Pearson entre los rangos (empates promediados);
+        mide relaciones monótonas y es robusta a colas pesadas
+        """
+        self._registrar_pasada('rangos', 2)
+        return _comomentos_de_bloque(_rangos_promedio(self._x),
+                                     _rangos_promedio(self._y)).correlacion()
+    
+    @_memoizado
+    def correlacion_kendall(self) -> float:
+        """
+        Calcula el tau-b de Kendall (corregido por empates)
+        Usa el algoritmo de Knight en O(n log n)
+        """
+        self._registrar_pasada('ordenar')
+        return _tau_b_kendall(self._x, self._y)
       
+    @_memoizado
     def coeficiente_determinacion(self) -> float:
         return self.correlacion_pearson() ** 2          
 
+    @_memoizado
     def regresion_lineal_simple(self) -> Dict[str, float]:
         """
         Calcula los parámetros de la regresión lineal simple
         Y = β0 + β1*X
         """
-        media_x = sum(self._x) / self._n
-        media_y = sum(self._y) / self._n
-        
-        # Calcular la pendiente (β1)
-        numerador = sum((x - media_x) * (y - media_y) 
-                       for x, y in zip(self._x, self._y))
-        denominador = sum((x - media_x) ** 2 for x in self._x)    
-
-        if denominador == 0:
-            raise ValueError("No se puede calcular regresión: varianza de X es 0")
-        
-        beta1 = numerador / denominador
-        beta0 = media_y - beta1 * media_x
+        beta0, beta1 = self._obtener_comomentos().regresion()
         
         return {
             'intercepto': round(beta0, 4),
@@ -393,6 +4021,18 @@ class AnalizadorBivariado(AnalizadorBase):
             'ecuacion': f"Y = {beta0:.4f} + {beta1:.4f}*X"
         }
     
+    @_perfilado
+    def intervalo_confianza(self, nivel: float = 0.95, replicas: int = 1000,
+                            semilla: int = None, trabajadores: int = None) -> Dict:
+        """
+        Intervalo de confianza bootstrap de la correlación de Pearson
+        Se remuestrean pares (x, y) con reemplazo; ver
+        AnalizadorCuantitativo.intervalo_confianza() para los argumentos.
+        """
+        return _bootstrap('correlacion_pearson', [self._x, self._y], self.correlacion_pearson(),
+                          nivel, replicas, semilla, trabajadores or self._trabajadores)
+    
+    @_perfilado
     def resumen(self) -> Dict:
         """Genera un resumen del análisis bivariado"""
         try:
@@ -403,29 +4043,327 @@ class AnalizadorBivariado(AnalizadorBase):
             return {'error': str(e)}
         
         return {
-            'n': self._n,
+            'n': self.n,
             'covarianza': round(self.covarianza(), 4),
             'correlacion_pearson': round(correlacion, 4),
             'r_cuadrado': round(r2, 4),
             'regresion_lineal': regresion
         }
     
+
+class AnalizadorBivariadoIncremental(AnalizadorBivariado):
+    """
+    Versión incremental de AnalizadorBivariado para flujos de pares
+    
+    Sólo conserva un AcumuladorComomentos (n, medias, M2 de X e Y y C_xy),
+    actualizado par a par, de modo que la memoria es constante. Todas las
+    medidas se leen en O(1) de ese estado y dos analizadores de distintas
+    particiones se pueden combinar.
+    """
+    
+    __slots__ = ()
+    
+    TAMANO_BLOQUE = 65536
+    
+    def __init__(self, datos_x=None, datos_y=None):
+        """
+        Args:
+            datos_x: Iterable inicial opcional de valores de X
+            datos_y: Iterable inicial opcional de valores de Y
+        """
+        self._x = self._y = self._datos = None
+        self._trabajadores = 1
+        self._iniciar_cache()
+        self._comomentos = AcumuladorComomentos()
+        if datos_x is not None or datos_y is not None:
+            if datos_x is None or datos_y is None:
+                raise ValueError("Se deben indicar ambas variables")
+            self.extender(datos_x, datos_y)
+    
+    @property
+    def datos(self):
+        """El analizador incremental no conserva los pares."""
+        return None
+    
+    @property
+    def n(self):
+        """Retorna el número de pares procesados."""
+        return self._comomentos.n
+    
+    def agregar(self, x: Union[int, float], y: Union[int, float]) -> 'AnalizadorBivariadoIncremental':
+        """Incorpora un par (x, y)."""
+        try:
+            x, y = float(x), float(y)
+        except (ValueError, TypeError) as e:
+            raise TypeError("Todos los datos deben ser numéricos") from e
+        if self._cache:
+            self._descartar_resultados()
+        self._comomentos.agregar(x, y)
+        return self
+    
+    def extender(self, datos_x, datos_y) -> 'AnalizadorBivariadoIncremental':
+        """Incorpora los pares de dos iterables, procesándolos por bloques."""
+        self._descartar_resultados()
+        pares = zip(datos_x, datos_y)
+        while True:
+            bloque = list(islice(pares, self.TAMANO_BLOQUE))
+            if not bloque:
+                return self
+            try:
+                xs = [float(x) for x, _ in bloque]
+                ys = [float(y) for _, y in bloque]
+            except (ValueError, TypeError) as e:
+                raise TypeError("Todos los datos deben ser numéricos") from e
+            self._comomentos.extender(xs, ys)
+    
+    def combinar(self, otro: 'AnalizadorBivariadoIncremental') -> 'AnalizadorBivariadoIncremental':
+        """Fusiona el estado de otro analizador (p. ej. otra partición)."""
+        self._descartar_resultados()
+        self._comomentos.combinar(otro._comomentos)
+        return self
+    
+    def _obtener_comomentos(self, compensado: bool = False) -> AcumuladorComomentos:
+        """Retorna los co-momentos acumulados, validando que haya datos."""
+        if compensado:
+            raise ValueError("La suma compensada requiere los datos completos (AnalizadorBivariado)")
+        if self._comomentos.n == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        return self._comomentos
+    
+    def correlacion_spearman(self) -> float:
+        """No disponible: los rangos requieren los datos completos."""
+        raise ValueError("La correlación de Spearman requiere los datos completos (AnalizadorBivariado)")
+    
+    def correlacion_kendall(self) -> float:
+        """No disponible: el tau de Kendall requiere los datos completos."""
+        raise ValueError("La correlación de Kendall requiere los datos completos (AnalizadorBivariado)")
+    
+    @_perfilado
+    def intervalo_confianza(self, *args, **kwargs) -> Dict:
+        """No disponible: el bootstrap requiere los datos completos."""
+        raise ValueError("El bootstrap requiere los datos completos (AnalizadorBivariado)")
+
+
+class AnalizadorMultivariado(AnalizadorBase):
+    """
+    Analizador para p variables cuantitativas a la vez
+    
+    Calcula en una sola pasada (por bloques de filas) las medias y la
+    matriz de co-momentos de todas las columnas; las matrices de covarianza
+    y correlación y las regresiones simples de una columna contra las demás
+    se derivan de ella sin volver a recorrer los datos.
+    """
+    
+    __slots__ = ('_matriz', '_nombres', '_tamano_bloque', '_acumulador')
+    
+    TAMANO_BLOQUE = 65536
+    
+    def __init__(self, columnas, nombres: List[str] = None, tamano_bloque: int = None):
+        """
+        Args:
+            columnas: {nombre: valores}, lista de columnas del mismo tamaño
+                o ndarray de filas × columnas
+            nombres: Nombre de cada columna (por defecto 'x0', 'x1', ...)
+            tamano_bloque: Filas procesadas por bloque
+        """
+        if isinstance(columnas, dict):
+            nombres = list(columnas) if nombres is None else nombres
+            columnas = list(columnas.values())
+        self._matriz = np is not None and isinstance(columnas, np.ndarray) and columnas.ndim == 2
+        if not self._matriz and columnas is not None:
+            columnas = list(columnas)
+        super().__init__(columnas)
+        
+        p = columnas.shape[1] if self._matriz else len(columnas)
+        self._n = columnas.shape[0] if self._matriz else len(columnas[0])
+        if self._n == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        if not self._matriz and any(len(columna) != self._n for columna in columnas):
+            raise ValueError("Todas las columnas deben tener el mismo tamaño")
+        self._nombres = list(nombres) if nombres is not None else [f"x{i}" for i in range(p)]
+        if len(self._nombres) != p:
+            raise ValueError("Debe haber un nombre por columna")
+        self._tamano_bloque = tamano_bloque or self.TAMANO_BLOQUE
+        self._acumulador = None
+    
+    @classmethod
+    def desde_bloques(cls, bloques, nombres: List[str] = None) -> 'AnalizadorMultivariado':
+        """
+        Crea el analizador recorriendo un flujo de bloques de filas, sin
+        guardarlos (p. ej. un archivo leído por partes)
+        
+        Args:
+            bloques: Iterable de bloques: lista de columnas o ndarray filas × p
+            nombres: Nombre de cada columna
+        """
+        acumulador = None
+        for bloque in bloques:
+            parcial = AcumuladorCovarianzas._desde_bloque(bloque)
+            acumulador = parcial if acumulador is None else acumulador.combinar(parcial)
+        if acumulador is None or acumulador.n == 0:
+            raise ValueError("El conjunto de datos no puede estar vacío")
+        analizador = cls.__new__(cls)
+        analizador._iniciar_cache()
+        analizador._datos = None
+        analizador._matriz = False
+        analizador._n = acumulador.n
+        analizador._nombres = (list(nombres) if nombres is not None
+                               else [f"x{i}" for i in range(acumulador.p)])
+        if len(analizador._nombres) != acumulador.p:
+            raise ValueError("Debe haber un nombre por columna")
+        analizador._acumulador = acumulador
+        return analizador
+    
+    @property
+    def nombres(self) -> List[str]:
+        """Nombres de las columnas, en el orden de las matrices."""
+        return list(self._nombres)
+    
+    def _descartar_derivados(self):
+        """Descarta los co-momentos si se conservan las columnas de las que salen."""
+        if self._datos is not None:
+            self._n = self._datos.shape[0] if self._matriz else len(self._datos[0])
+            self._acumulador = None
+    
+    def _obtener_acumulador(self) -> AcumuladorCovarianzas:
+        """Recorre las filas por bloques una sola vez y guarda los co-momentos."""
+        if self._acumulador is None:
+            self._registrar_pasada('comomentos')
+            acumulador = AcumuladorCovarianzas(len(self._nombres))
+            for inicio in range(0, self._n, self._tamano_bloque):
+                fin = inicio + self._tamano_bloque
+                if self._matriz:
+                    acumulador.extender(self._datos[inicio:fin])
+                else:
+                    acumulador.extender([columna[inicio:fin] for columna in self._datos])
+            self._acumulador = acumulador
+        return self._acumulador
+    
+    def _indice(self, nombre: str) -> int:
+        try:
+            return self._nombres.index(nombre)
+        except ValueError:
+            raise KeyError(f"La columna {nombre!r} no existe") from None
+    
+    @_perfilado
+    def medias(self) -> Dict[str, float]:
+        """Media de cada columna"""
+        medias = self._obtener_acumulador().medias
+        return {nombre: float(media) for nombre, media in zip(self._nombres, medias)}
+    
+    @_perfilado
+    def desviaciones_estandar(self, muestral: bool = True) -> Dict[str, float]:
+        """Desviación estándar de cada columna"""
+        covarianzas = self.matriz_covarianza(muestral)
+        return {nombre: math.sqrt(covarianzas[i][i]) for i, nombre in enumerate(self._nombres)}
+    
+    @_perfilado
+    def matriz_covarianza(self, muestral: bool = True) -> List[List[float]]:
+        """Matriz de covarianzas p × p (filas y columnas en el orden de nombres)"""
+        if muestral and self._n < 2:
+            raise ValueError("Se necesitan al menos 2 datos para la covarianza muestral")
+        return self._obtener_acumulador().covarianzas(muestral)
+    
+    @_perfilado
+    def matriz_correlacion(self) -> List[List[float]]:
+        """
+        Matriz de correlaciones de Pearson p × p
+        Los pares con una columna de desviación estándar 0 quedan en nan.
+        """
+        return self._obtener_acumulador().correlaciones()
+    
+    @_perfilado
+    def correlacion(self, columna_x: str, columna_y: str) -> float:
+        """Correlación de Pearson entre dos columnas"""
+        i, j = self._indice(columna_x), self._indice(columna_y)
+        valor = self.matriz_correlacion()[i][j]
+        if math.isnan(valor):
+            raise ValueError("No se puede calcular correlación con d.s 0")
+        return valor
+    
+    @_perfilado
+    def pares_correlacionados(self, umbral: float = 0.8) -> List[Tuple[str, str, float]]:
+        """
+        Pares de columnas con |r| >= umbral, de mayor a menor |r|
+        Útil para descartar variables redundantes.
+        """
+        correlaciones = self.matriz_correlacion()
+        pares = [(self._nombres[i], self._nombres[j], correlaciones[i][j])
+                 for i in range(len(self._nombres))
+                 for j in range(i + 1, len(self._nombres))
+                 if abs(correlaciones[i][j]) >= umbral]
+        return sorted(pares, key=lambda par: abs(par[2]), reverse=True)
+    
+    @_perfilado
+    def regresiones(self, objetivo: str) -> Dict[str, Dict]:
+        """
+        Regresión lineal simple de `objetivo` contra cada una de las demás
+        columnas: {columna: {'intercepto', 'pendiente', 'r_cuadrado'}}
+        Las columnas con varianza 0 tienen sus valores en None.
+        """
+        y = self._indice(objetivo)
+        acumulador = self._obtener_acumulador()
+        comomentos, medias = acumulador.comomentos, acumulador.medias
+        resultado = {}
+        for x, nombre in enumerate(self._nombres):
+            if x == y:
+                continue
+            sxx, sxy, syy = comomentos[x][x], comomentos[x][y], comomentos[y][y]
+            if sxx == 0:
+                resultado[nombre] = {'intercepto': None, 'pendiente': None, 'r_cuadrado': None}
+                continue
+            pendiente = sxy / sxx
+            resultado[nombre] = {
+                'intercepto': round(float(medias[y] - pendiente * medias[x]), 4),
+                'pendiente': round(float(pendiente), 4),
+                'r_cuadrado': round(float(sxy * sxy / (sxx * syy)), 4) if syy else None
+            }
+        return resultado
+    
+    @_perfilado
+    def resumen(self) -> Dict:
+        """Genera un resumen del análisis multivariado"""
+        return {
+            'n': self._n,
+            'columnas': self.nombres,
+            'medias': {nombre: round(m, 4) for nombre, m in self.medias().items()},
+            'desviaciones_estandar': {nombre: round(d, 4) for nombre, d
+                                      in self.desviaciones_estandar().items()},
+            'matriz_correlacion': [[round(r, 4) for r in fila]
+                                   for fila in self.matriz_correlacion()]
+        }
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n={self._n}, columnas={len(self._nombres)})"
+
 # Función auxiliar para determinar el tipo de datos automáticamente
-def analizar(datos: List, tipo: str = 'auto'):
+def _detectar_tipo(datos) -> Tuple[str, object]:
     """
-    Función helper para crear el analizador apropiado
+    Detecta si una columna es 'cuantitativo' o 'cualitativo'
     
-    Args:
-        datos: Lista de datos a analizar
-        tipo: 'cuantitativo', 'cualitativo' o 'auto' (detecta automáticamente)
+    Los buffers tipados y las listas de int/float se reconocen sin
+    convertir. Cualquier otra columna se convierte a un array('d') en un
+    solo recorrido (a nivel de C) que se detiene en el primer valor que
+    float() no acepta; si se completa, ese array es el que recibe el
+    analizador y la columna no se vuelve a convertir.
+    
+    Returns:
+        (tipo, datos): los datos originales o ya convertidos a array('d')
     """
+    if np is not None and isinstance(datos, np.ndarray):
+        return ('cuantitativo' if datos.dtype.kind in 'biuf' else 'cualitativo'), datos
+    if _es_buffer_numerico(datos) or _es_secuencia_numerica(datos):
+        return 'cuantitativo', datos
+    try:
+        return 'cuantitativo', array('d', map(float, datos))
+    except (ValueError, TypeError):
+        return 'cualitativo', datos
+
+
+def _crear_analizador(datos, tipo: str = 'auto'):
+    """Crea el analizador de una columna; los datos se convierten a lo sumo una vez."""
     if tipo == 'auto':
-        # Intentar detectar el tipo de datos
-        try:
-            [float(x) for x in datos]
-            tipo = 'cuantitativo'
-        except (ValueError, TypeError):
-            tipo = 'cualitativo'
+        tipo, datos = _detectar_tipo(datos)
     
     if tipo == 'cuantitativo':
         return AnalizadorCuantitativo(datos)
@@ -435,6 +4373,193 @@ def analizar(datos: List, tipo: str = 'auto'):
         raise ValueError("Tipo debe ser 'cuantitativo', 'cualitativo' o 'auto'")
 
 
+def analizar(datos: List, tipo: str = 'auto'):
+    """
+    Función helper para crear el analizador apropiado
+    
+    Args:
+        datos: Lista de datos a analizar
+        tipo: 'cuantitativo', 'cualitativo' o 'auto' (detecta automáticamente)
+    """
+    return _crear_analizador(datos, tipo)
+
+
+def _es_bloque(elemento) -> bool:
+    """Indica si un elemento de un flujo asíncrono es un bloque de valores."""
+    if np is not None and isinstance(elemento, np.ndarray):
+        return True
+    return isinstance(elemento, (list, tuple, array, memoryview))
+
+
+def _analizar_bloque(bloque, opciones: Dict) -> 'AnalizadorCuantitativoIncremental':
+    """Analizador incremental de un bloque (se ejecuta en el ejecutor)."""
+    return AnalizadorCuantitativoIncremental(bloque, **opciones)
+
+
+async def _analizar_flujo(flujo, ejecutor, tamano_bloque: int,
+                          opciones: Dict) -> 'AnalizadorCuantitativoIncremental':
+    """
+    Consume un iterador asíncrono bloque a bloque: cada bloque se analiza
+    en el ejecutor mientras se espera el siguiente, y el resultado parcial
+    se combina en el analizador incremental dentro del bucle de eventos.
+    Los bloques memoryview se copian antes de enviarlos: no se pueden
+    serializar para un ProcessPoolExecutor y el productor puede reutilizar
+    su buffer. Si el flujo falla o se cancela, el bloque pendiente se
+    cancela y se espera antes de propagar el error.
+    """
+    bucle = asyncio.get_running_loop()
+    analizador = AnalizadorCuantitativoIncremental(**opciones)
+    pendiente = None
+    sueltos = []
+    
+    async def enviar(bloque):
+        nonlocal pendiente
+        if isinstance(bloque, memoryview):
+            bloque = array(bloque.format, bloque) if _es_buffer_numerico(bloque) else bloque.tolist()
+        anterior = pendiente
+        pendiente = bucle.run_in_executor(ejecutor, _analizar_bloque, bloque, opciones)
+        if anterior is not None:
+            analizador.combinar(await anterior)
+    
+    try:
+        async for elemento in flujo:
+            if _es_bloque(elemento):
+                if sueltos:
+                    await enviar(sueltos)
+                    sueltos = []
+                await enviar(elemento)
+            else:
+                sueltos.append(elemento)
+                if len(sueltos) >= tamano_bloque:
+                    await enviar(sueltos)
+                    sueltos = []
+        if sueltos:
+            await enviar(sueltos)
+        if pendiente is not None:
+            ultimo, pendiente = pendiente, None
+            analizador.combinar(await ultimo)
+        return analizador
+    finally:
+        if pendiente is not None:
+            pendiente.cancel()
+            await asyncio.gather(pendiente, return_exceptions=True)
+
+
+async def analizar_async(datos, tipo: str = 'auto', ejecutor=None,
+                         tamano_bloque: int = 65536, **opciones):
+    """
+    Versión asíncrona de analizar() para servicios basados en asyncio
+    
+    La construcción del analizador (detección de tipo, validación y
+    conversión) se hace en un ejecutor. Si datos es un iterador asíncrono
+    se alimenta un AnalizadorCuantitativoIncremental bloque a bloque, sin
+    retener los datos crudos.
+    
+    Args:
+        datos: Datos a analizar, o iterador asíncrono de valores sueltos o
+            bloques (listas, tuplas, array, memoryview o ndarray)
+        tipo: 'cuantitativo', 'cualitativo' o 'auto' (detecta automáticamente)
+        ejecutor: ThreadPoolExecutor o ProcessPoolExecutor; None usa el
+            ejecutor por defecto del bucle
+        tamano_bloque: Valores sueltos del flujo que se agrupan por bloque
+        **opciones: Opciones de AnalizadorCuantitativoIncremental
+            (contar_frecuencias, k_sketch) para flujos asíncronos
+    """
+    if hasattr(datos, '__aiter__'):
+        if tipo == 'cualitativo':
+            raise ValueError("Los flujos asíncronos sólo admiten datos cuantitativos")
+        if tamano_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+        return await _analizar_flujo(datos, ejecutor, tamano_bloque, opciones)
+    bucle = asyncio.get_running_loop()
+    return await bucle.run_in_executor(ejecutor, _crear_analizador, datos, tipo)
+
+
+def _resumir_columna(datos, tipo: str) -> Dict:
+    """Resumen de una columna (se ejecuta en un proceso trabajador)."""
+    return _crear_analizador(datos, tipo).resumen()
+
+
+def _precalcular_momentos(analizadores: List['AnalizadorCuantitativo']):
+    """
+    Calcula en lote los momentos de columnas numéricas del mismo tamaño:
+    se apilan en una matriz n × k y cada reducción se hace por columnas
+    con una sola operación vectorizada, en lugar de k llamadas pequeñas.
+    """
+    por_tamano = {}
+    for analizador in analizadores:
+        if analizador._arreglo is not None and analizador._momentos is None:
+            por_tamano.setdefault(analizador.n, []).append(analizador)
+    for n, grupo in por_tamano.items():
+        ancho = max(1, _ELEMENTOS_POR_LOTE // n)
+        for inicio in range(0, len(grupo), ancho):
+            parte = grupo[inicio:inicio + ancho]
+            matriz = np.column_stack([analizador._arreglo for analizador in parte])
+            medias = matriz.mean(axis=0)
+            desvios = matriz - medias
+            cuadrados = desvios * desvios
+            m2 = cuadrados.sum(axis=0)
+            m3 = (cuadrados * desvios).sum(axis=0)
+            m4 = (cuadrados * cuadrados).sum(axis=0)
+            minimos, maximos = matriz.min(axis=0), matriz.max(axis=0)
+            for j, analizador in enumerate(parte):
+                momentos = AcumuladorMomentos()
+                momentos.n = n
+                momentos.media, momentos.m2 = float(medias[j]), float(m2[j])
+                momentos.m3, momentos.m4 = float(m3[j]), float(m4[j])
+                momentos.minimo, momentos.maximo = float(minimos[j]), float(maximos[j])
+                analizador._momentos = momentos
+
+
+def analizar_lote(columnas, tipos: Dict[str, str] = None, resumir: bool = False,
+                  trabajadores: int = 1) -> Dict:
+    """
+    Analiza muchas columnas en una sola llamada (tablas anchas)
+    
+    Cada columna se clasifica con un recorrido que se detiene en el primer
+    valor no numérico; las columnas que hubo que convertir (p. ej. textos
+    numéricos) pasan al analizador ya convertidas, sin un segundo recorrido. Con NumPy los
+    momentos de las columnas numéricas del mismo tamaño se calculan en lote.
+    
+    Args:
+        columnas: {nombre: valores}, lista de filas {columna: valor} o
+            ndarray 2D (columnas 0..k-1)
+        tipos: Tipo forzado por columna ('cuantitativo' o 'cualitativo');
+            las demás se detectan
+        resumir: Si True retorna {nombre: resumen()} en lugar de los analizadores
+        trabajadores: Con resumir=True, procesos entre los que se reparten
+            las columnas
+    
+    Returns:
+        {nombre: analizador} o {nombre: resumen}
+    """
+    if np is not None and isinstance(columnas, np.ndarray) and columnas.ndim == 2:
+        columnas = {j: columnas[:, j] for j in range(columnas.shape[1])}
+    elif isinstance(columnas, list):
+        nombres = list(dict.fromkeys(clave for fila in columnas for clave in fila))
+        columnas = {nombre: [fila.get(nombre) for fila in columnas] for nombre in nombres}
+    if trabajadores < 1:
+        raise ValueError("El número de trabajadores debe ser al menos 1")
+    tipos = tipos or {}
+    nombres = list(columnas)
+    
+    if resumir and trabajadores > 1:
+        with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+            resumenes = ejecutor.map(_resumir_columna, [columnas[n] for n in nombres],
+                                     [tipos.get(n, 'auto') for n in nombres],
+                                     chunksize=max(1, len(nombres) // (4 * trabajadores)))
+            return dict(zip(nombres, resumenes))
+    
+    analizadores = {nombre: _crear_analizador(columnas[nombre], tipos.get(nombre, 'auto'))
+                    for nombre in nombres}
+    if np is not None:
+        _precalcular_momentos([a for a in analizadores.values()
+                               if isinstance(a, AnalizadorCuantitativo)])
+    if resumir:
+        return {nombre: analizador.resumen() for nombre, analizador in analizadores.items()}
+    return analizadores
+
+
 # Ejemplo de uso
 if __name__ == "__main__":
     print("=" * 60)
@@ -3,11 +3,35 @@ Archivo de pruebas para la librería CorePy
 Ejecutar: python test_core.py
 """
 
+import asyncio
+import csv
+import math
+import os
+import random
+import statistics
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from core import (
     AnalizadorCuantitativo, 
     AnalizadorCualitativo, 
     AnalizadorBivariado,
-    analizar
+    AnalizadorBivariadoIncremental,
+    AnalizadorCuantitativoIncremental,
+    AnalizadorAgrupado,
+    AnalizadorMultivariado,
+    AcumuladorMomentos,
+    AcumuladorCovarianzas,
+    SketchKLL,
+    SketchCountMin,
+    SketchMisraGries,
+    SketchHyperLogLog,
+    HistogramaHDR,
+    VentanaMovil,
+    analizar,
+    analizar_async,
+    analizar_lote
 )
 
 
@@ -315,6 +339,1407 @@ def test_casos_borde():
         return False
 
 
+def test_momentos_una_pasada():
+    """Compara el acumulador de momentos con las fórmulas de dos pasadas"""
+    print("\n" + "="*70)
+    print("TEST 6: MOMENTOS EN UNA SOLA PASADA")
+    print("="*70)
+    
+    # Datos con un desplazamiento grande para exigir estabilidad numérica
+    datos = [1e6 + x for x in [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]]
+    
+    try:
+        n = len(datos)
+        media = sum(datos) / n
+        m2 = sum((x - media) ** 2 for x in datos)
+        
+        acumulador = AcumuladorMomentos().extender(datos)
+        analizador = AnalizadorCuantitativo(datos)
+        
+        resultados = [
+            math.isclose(acumulador.media, media, rel_tol=1e-12),
+            math.isclose(acumulador.varianza(), m2 / (n - 1), rel_tol=1e-9),
+            acumulador.minimo == min(datos) and acumulador.maximo == max(datos),
+            math.isclose(analizador.asimetria(), AcumuladorMomentos().extender(
+                [x - 1e6 for x in datos]).asimetria(), rel_tol=1e-6),
+            analizador.moda() == 1e6 + 90
+        ]
+        print(f"Media: {acumulador.media:.4f}")
+        print(f"Varianza: {acumulador.varianza():.4f}")
+        print(f"Asimetría: {analizador.asimetria():.4f}")
+        print(f"Curtosis: {analizador.curtosis():.4f}")
+        
+        if all(resultados):
+            print("\n✅ TEST 6 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 6: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 6: {str(e)}")
+        return False
+
+
+def test_backend_numpy():
+    """Verifica que el backend NumPy coincida con la ruta en Python puro"""
+    print("\n" + "="*70)
+    print("TEST 7: BACKEND NUMPY VECTORIZADO")
+    print("="*70)
+    
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("\n⚠️ NumPy no está instalado: se omite la comparación")
+        print("\n✅ TEST 7 COMPLETADO CON ÉXITO")
+        return True
+    
+    datos = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]
+    
+    try:
+        puro = AnalizadorCuantitativo(datos, backend='python')
+        vectorizado = AnalizadorCuantitativo(datos, backend='numpy')
+        print(f"Backend: {vectorizado.backend}")
+        
+        resultados = []
+        for metodo in ['media', 'mediana', 'varianza', 'asimetria', 'curtosis',
+                       'minimo', 'maximo', 'rango_intercuartilico']:
+            esperado = getattr(puro, metodo)()
+            obtenido = getattr(vectorizado, metodo)()
+            print(f"{metodo}: {esperado:.6f} vs {obtenido:.6f}")
+            resultados.append(math.isclose(esperado, obtenido, rel_tol=1e-9))
+        resultados.append(vectorizado.percentil(90) == puro.percentil(90))
+        resultados.append(vectorizado.moda() == puro.moda())
+        
+        if all(resultados):
+            print("\n✅ TEST 7 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 7: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 7: {str(e)}")
+        return False
+
+
+def test_percentiles_seleccion():
+    """Verifica percentiles por selección contra el cálculo con ordenamiento"""
+    print("\n" + "="*70)
+    print("TEST 8: PERCENTILES POR SELECCIÓN")
+    print("="*70)
+    
+    datos = [(i * 7919) % 1000 / 10 for i in range(1, 501)]
+    
+    try:
+        analizador = AnalizadorCuantitativo(datos, backend='python')
+        p50, p95, p99 = analizador.percentiles([50, 95, 99])
+        print(f"p50={p50:.4f}  p95={p95:.4f}  p99={p99:.4f}")
+        
+        ordenados = sorted(datos)
+        indice = 0.95 * (len(datos) - 1)
+        inferior = int(indice)
+        esperado_p95 = ordenados[inferior] + (indice - inferior) * (
+            ordenados[inferior + 1] - ordenados[inferior])
+        
+        resultados = [
+            math.isclose(p95, esperado_p95),
+            analizador.mediana() == p50,
+            analizador.cuartiles()[1] == p50,
+            analizador._datos_ordenados is None,  # no se construyó la copia ordenada
+            AnalizadorCuantitativo([7]).percentil(30) == 7
+        ]
+        
+        if all(resultados):
+            print("\n✅ TEST 8 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 8: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 8: {str(e)}")
+        return False
+
+
+def test_analizador_incremental():
+    """Verifica que el análisis incremental coincida con el análisis en lote"""
+    print("\n" + "="*70)
+    print("TEST 9: ANALIZADOR INCREMENTAL (FLUJOS)")
+    print("="*70)
+    
+    datos = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]
+    
+    try:
+        lote = AnalizadorCuantitativo(datos, backend='python')
+        
+        # Dos particiones procesadas por separado y luego combinadas
+        parte1 = AnalizadorCuantitativoIncremental(contar_frecuencias=True)
+        for x in datos[:6]:
+            parte1.agregar(x)
+        parte2 = AnalizadorCuantitativoIncremental(contar_frecuencias=True).extender(
+            iter(datos[6:]))
+        incremental = parte1.combinar(parte2)
+        
+        print(f"n: {incremental.n}")
+        print(f"Media: {incremental.media():.4f}")
+        print(f"Desviación Estándar: {incremental.desviacion_estandar():.4f}")
+        
+        resultados = [incremental.n == lote.n, incremental.moda() == lote.moda()]
+        # Entrada mixta: se cuenta el valor convertido, empates por primera aparición
+        mixto = AnalizadorCuantitativoIncremental(['3', 2, 2.0, '3'], contar_frecuencias=True)
+        resultados.append(mixto.moda() == [3.0, 2.0])
+        mixto.agregar(' 2 ')
+        resultados.append(mixto.moda() == 2.0)
+        # Por defecto la memoria es constante: no se cuentan frecuencias
+        try:
+            AnalizadorCuantitativoIncremental(datos).moda()
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        for metodo in ['media', 'varianza', 'desviacion_estandar', 'asimetria',
+                       'curtosis', 'rango']:
+            resultados.append(math.isclose(getattr(incremental, metodo)(),
+                                           getattr(lote, metodo)(), rel_tol=1e-9))
+        
+        if all(resultados):
+            print("\n✅ TEST 9 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 9: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 9: {str(e)}")
+        return False
+
+
+def test_sketch_kll():
+    """Verifica el sketch KLL: precisión, combinación y serialización"""
+    print("\n" + "="*70)
+    print("TEST 10: CUANTILES APROXIMADOS CON SKETCH KLL")
+    print("="*70)
+    
+    datos = [(i * 7919) % 10007 for i in range(20000)]
+    
+    try:
+        # Dos "trabajadores" construyen sketches por separado
+        sketch1 = SketchKLL(k=200, semilla=1).extender(datos[:12000])
+        sketch2 = SketchKLL(k=200, semilla=2).extender(datos[12000:])
+        sketch = sketch1.combinar(sketch2)
+        restaurado = SketchKLL.deserializar(sketch.serializar())
+        
+        exacto = AnalizadorCuantitativo(datos, backend='python')
+        aproximado = AnalizadorCuantitativo(datos, modo_cuantiles='aproximado')
+        resumen = aproximado.resumen_cinco_numeros()
+        print(f"Sketch: {sketch}")
+        print(f"Cinco números (aprox.): {resumen}")
+        
+        error = sketch.error_rango()
+        ordenados = sorted(datos)
+        resultados = [
+            sketch.n == len(datos),
+            restaurado.cuantiles([0.5, 0.9]) == sketch.cuantiles([0.5, 0.9]),
+            resumen['minimo'] == exacto.minimo() and resumen['maximo'] == exacto.maximo(),
+            'error_cuantiles' in aproximado.resumen() and 'moda' not in aproximado.resumen()
+        ]
+        for q in [0.1, 0.25, 0.5, 0.75, 0.95]:
+            rango_real = sum(1 for x in ordenados if x <= sketch.cuantil(q)) / len(datos)
+            resultados.append(abs(rango_real - q) <= error)
+        
+        if all(resultados):
+            print("\n✅ TEST 10 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 10: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 10: {str(e)}")
+        return False
+
+
+def test_reduccion_paralela():
+    """Verifica que la reducción en paralelo coincida con la serial"""
+    print("\n" + "="*70)
+    print("TEST 11: REDUCCIÓN PARALELA POR BLOQUES")
+    print("="*70)
+    
+    horas_estudio = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    calificaciones = [50, 55, 62, 68, 75, 79, 85, 90, 93, 98]
+    
+    try:
+        serial = AnalizadorCuantitativo(calificaciones, backend='python')
+        paralelo = AnalizadorCuantitativo(calificaciones, backend='python', trabajadores=3)
+        biv_serial = AnalizadorBivariado(horas_estudio, calificaciones)
+        biv_paralelo = AnalizadorBivariado(horas_estudio, calificaciones, trabajadores=3)
+        
+        print(f"Media: {serial.media():.4f} vs {paralelo.media():.4f}")
+        print(f"Correlación: {biv_serial.correlacion_pearson():.4f} vs "
+              f"{biv_paralelo.correlacion_pearson():.4f}")
+        
+        resultados = [
+            math.isclose(serial.media(), paralelo.media(), rel_tol=1e-12),
+            math.isclose(serial.varianza(), paralelo.varianza(), rel_tol=1e-9),
+            math.isclose(serial.curtosis(), paralelo.curtosis(), rel_tol=1e-9),
+            math.isclose(biv_serial.covarianza(), biv_paralelo.covarianza(), rel_tol=1e-9),
+            math.isclose(biv_serial.correlacion_pearson(),
+                         biv_paralelo.correlacion_pearson(), rel_tol=1e-9),
+            biv_serial.regresion_lineal_simple() == biv_paralelo.regresion_lineal_simple()
+        ]
+        
+        # Columnas memoryview: cada bloque se copia antes de enviarlo a otro proceso
+        biv_vistas = AnalizadorBivariado(memoryview(array('d', horas_estudio)),
+                                         memoryview(array('d', calificaciones)),
+                                         trabajadores=2)
+        resultados.extend([
+            math.isclose(biv_serial.covarianza(), biv_vistas.covarianza(), rel_tol=1e-9),
+            math.isclose(biv_serial.correlacion_pearson(),
+                         biv_vistas.correlacion_pearson(), rel_tol=1e-9),
+            biv_serial.regresion_lineal_simple() == biv_vistas.regresion_lineal_simple()
+        ])
+        
+        if all(resultados):
+            print("\n✅ TEST 11 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 11: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 11: {str(e)}")
+        return False
+
+
+def test_carga_desde_archivo():
+    """Verifica que cargar desde CSV o binario dé lo mismo que una lista"""
+    print("\n" + "="*70)
+    print("TEST 12: CARGA DESDE ARCHIVOS (CSV Y BINARIO MAPEADO)")
+    print("="*70)
+    
+    calificaciones = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]
+    transportes = ['auto', 'bus', 'bicicleta', 'bus', 'auto', 'metro', 'bus',
+                   'bicicleta', 'auto', 'bus', 'metro', 'bus', 'auto', 'bus', 'metro']
+    
+    try:
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta_csv = os.path.join(carpeta, 'datos.csv')
+            with open(ruta_csv, 'w', newline='', encoding='utf-8') as archivo:
+                escritor = csv.writer(archivo)
+                escritor.writerow(['calificacion', 'transporte'])
+                escritor.writerows(zip(calificaciones, transportes))
+            ruta_binaria = os.path.join(carpeta, 'datos.f64')
+            with open(ruta_binaria, 'wb') as archivo:
+                array('d', calificaciones).tofile(archivo)
+            
+            desde_csv = AnalizadorCuantitativo.desde_archivo(
+                ruta_csv, columna='calificacion', backend='python')
+            desde_binario = AnalizadorCuantitativo.desde_archivo(
+                ruta_binaria, formato='f64', backend='python')
+            categorias = AnalizadorCualitativo.desde_archivo(ruta_csv, columna=1)
+            
+            esperado = AnalizadorCuantitativo(calificaciones, backend='python').resumen()
+            print(f"Media (CSV): {desde_csv.media():.4f}")
+            print(f"Media (binario mapeado): {desde_binario.media():.4f}")
+            print(f"Moda (categorías CSV): {categorias.moda()}")
+            
+            resultados = [
+                desde_csv.resumen() == esperado,
+                desde_binario.resumen() == esperado,
+                categorias.resumen() == AnalizadorCualitativo(transportes).resumen()
+            ]
+            del desde_binario  # libera el mapeo antes de borrar el archivo
+        
+        if all(resultados):
+            print("\n✅ TEST 12 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 12: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 12: {str(e)}")
+        return False
+
+
+def test_analisis_agrupado():
+    """Verifica el resumen por grupo y la tabla de contingencia"""
+    print("\n" + "="*70)
+    print("TEST 13: ANÁLISIS AGRUPADO Y TABLA DE CONTINGENCIA")
+    print("="*70)
+    
+    servicios = ['api', 'web', 'api', 'db', 'web', 'api', 'db', 'web', 'api', 'db',
+                 'web', 'api', 'db', 'web', 'api']
+    latencias = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]
+    estados = ['ok', 'ok', 'error', 'ok', 'ok', 'ok', 'error', 'ok', 'ok', 'ok',
+               'error', 'ok', 'ok', 'ok', 'ok']
+    
+    try:
+        resumen = AnalizadorAgrupado(servicios, latencias).resumen()
+        for servicio, valores in resumen.items():
+            print(f"{servicio}: media={valores['media']}  Q1={valores['Q1']}  Q3={valores['Q3']}")
+        
+        resultados = [set(resumen) == {'api', 'web', 'db'}]
+        for servicio in resumen:
+            grupo = [x for s, x in zip(servicios, latencias) if s == servicio]
+            esperado = AnalizadorCuantitativo(grupo, backend='python').resumen()
+            resultados.append(all(resumen[servicio][clave] == esperado[clave]
+                                  for clave in ('n', 'media', 'varianza', 'Q1', 'Q3',
+                                                'asimetria', 'curtosis')))
+        
+        tabla = AnalizadorCualitativo(estados).tabla_contingencia(servicios)
+        print(f"Tabla de contingencia (api): {tabla['api']['frecuencias']}")
+        resultados.append(tabla['api']['frecuencias'] == {'ok': 5, 'error': 1})
+        resultados.append(sum(fila['total'] for fila in tabla.values()) == len(estados))
+        
+        if all(resultados):
+            print("\n✅ TEST 13 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 13: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 13: {str(e)}")
+        return False
+
+
+def test_ventana_movil():
+    """Verifica las estadísticas móviles contra recalcular cada ventana"""
+    print("\n" + "="*70)
+    print("TEST 14: ESTADÍSTICAS EN VENTANA MÓVIL")
+    print("="*70)
+    
+    latencias = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]
+    tamano = 5
+    
+    try:
+        analizador = AnalizadorCuantitativo(latencias, backend='python')
+        resultados = []
+        for estadisticas in analizador.estadisticas_moviles(tamano=tamano):
+            fin = estadisticas['indice'] + 1
+            ventana = AnalizadorCuantitativo(latencias[fin - tamano:fin], backend='python')
+            resultados.extend([
+                math.isclose(estadisticas['media'], ventana.media()),
+                math.isclose(estadisticas['varianza'], ventana.varianza()),
+                estadisticas['minimo'] == ventana.minimo(),
+                estadisticas['maximo'] == ventana.maximo(),
+                estadisticas['p50'] == ventana.mediana(),
+                math.isclose(estadisticas['p95'], ventana.percentil(95))
+            ])
+        print(f"Última ventana: {estadisticas}")
+        
+        # Ventana temporal: sólo los datos de los últimos 3 segundos
+        temporal = VentanaMovil(duracion=3)
+        for segundo, valor in enumerate(latencias):
+            temporal.agregar(valor, marca_tiempo=segundo)
+        print(f"Ventana temporal: {temporal} → media {temporal.media():.2f}")
+        resultados.append(temporal.n == 3 and temporal.maximo() == 94)
+        
+        # Ventana ancha: la lista ordenada se reparte en varios bloques
+        ancha = VentanaMovil(tamano=3000)
+        aleatorios = [(i * 7919) % 10007 for i in range(5000)]
+        for valor in aleatorios:
+            ancha.agregar(valor)
+        ordenados = sorted(aleatorios[-3000:])
+        resultados.append(ancha.mediana() == (ordenados[1499] + ordenados[1500]) / 2)
+        resultados.append(ancha.percentiles([0, 100]) == [ordenados[0], ordenados[-1]])
+        
+        if all(resultados):
+            print("\n✅ TEST 14 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 14: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 14: {str(e)}")
+        return False
+
+
+def test_frecuencias_aproximadas():
+    """Verifica el modo aproximado de AnalizadorCualitativo y sus sketches"""
+    print("\n" + "="*70)
+    print("TEST 15: FRECUENCIAS APROXIMADAS (COUNT-MIN + MISRA-GRIES)")
+    print("="*70)
+    
+    # Pocas categorías muy frecuentes y una cola larga de categorías raras
+    datos = [f"usuario{i % 5}" for i in range(6000)] + [f"raro{i}" for i in range(4000)]
+    
+    try:
+        exacto = AnalizadorCualitativo(datos)
+        aproximado = AnalizadorCualitativo(datos, modo='aproximado', top_k=20, epsilon=0.01)
+        tabla = aproximado.tabla_frecuencias(top_k=5)
+        error = aproximado.error_frecuencias()
+        reales = exacto.frecuencias_absolutas()
+        print(f"Top 5 aproximado: {list(tabla)}")
+        print(f"Error máximo de frecuencia: {error:.1f}")
+        
+        resultados = [
+            set(tabla) == {f"usuario{i}" for i in range(5)},
+            aproximado.moda() in tabla,
+            'error_frecuencias' in aproximado.resumen()
+        ]
+        for categoria, frecuencia in aproximado.frecuencias_absolutas().items():
+            resultados.append(reales[categoria] <= frecuencia <= reales[categoria] + error)
+        try:
+            aproximado.entropia()
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        # Sketches de dos particiones combinados
+        mitad = len(datos) // 2
+        conteo = SketchCountMin(0.01).agregar_conteos((x, 1) for x in datos[:mitad])
+        otro = SketchCountMin(0.01).agregar_conteos((x, 1) for x in datos[mitad:])
+        conteo.combinar(SketchCountMin.deserializar(otro.serializar()))
+        frecuentes = SketchMisraGries(10).agregar_conteos((x, 1) for x in datos[:mitad])
+        frecuentes.combinar(SketchMisraGries(10).agregar_conteos((x, 1) for x in datos[mitad:]))
+        resultados.append(conteo.n == len(datos))
+        resultados.append(conteo.estimar("usuario0") >= reales["usuario0"])
+        for categoria, frecuencia in frecuentes.candidatos().items():
+            resultados.append(reales[categoria] - frecuentes.error_maximo() <= frecuencia <= reales[categoria])
+        resultados.append(all(f"usuario{i}" in frecuentes.candidatos() for i in range(5)))
+        
+        if all(resultados):
+            print("\n✅ TEST 15 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 15: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 15: {str(e)}")
+        return False
+
+
+def test_hyperloglog():
+    """Verifica el conteo aproximado de distintos con HyperLogLog"""
+    print("\n" + "="*70)
+    print("TEST 16: CATEGORÍAS ÚNICAS CON HYPERLOGLOG")
+    print("="*70)
+    
+    datos = [f"cliente{(i * 7) % 30000}" for i in range(60000)]
+    
+    try:
+        # Flujo partido en dos particiones con categorías en común
+        sketch = SketchHyperLogLog(precision=14).extender(datos[:40000])
+        otro = SketchHyperLogLog(precision=14).extender(datos[20000:])
+        sketch.combinar(SketchHyperLogLog.deserializar(otro.serializar()))
+        estimacion = sketch.cardinalidad()
+        analizador = AnalizadorCualitativo(datos, modo='aproximado')
+        print(f"Distintos reales: 30000, estimados: {estimacion} "
+              f"(error típico {sketch.error_relativo():.2%})")
+        print(f"categorias_unicas() aproximado: {analizador.categorias_unicas()}")
+        
+        # Tolerancia de 4 errores estándar
+        tolerancia = 4 * sketch.error_relativo()
+        resultados = [
+            abs(estimacion / 30000 - 1) <= tolerancia,
+            abs(analizador.categorias_unicas() / 30000 - 1) <= tolerancia,
+            SketchHyperLogLog(precision=10).extender(['a', 'b', 'a']).cardinalidad() == 2,
+            len(sketch.serializar()) < 17 * 1024
+        ]
+        
+        # Barrido de 2.5·m a 5·m: la zona donde el estimador original pasa de
+        # conteo lineal a media armónica y tenía un sesgo de +2%
+        m = sketch.m
+        errores = []
+        for i, factor in enumerate((2.5, 2.75, 3.0, 3.5, 4.0, 4.5, 5.0)):
+            cardinalidad = int(factor * m)
+            barrido = SketchHyperLogLog(precision=14).extender(
+                range(i * 10 ** 6, i * 10 ** 6 + cardinalidad))
+            errores.append(barrido.cardinalidad() / cardinalidad - 1)
+        sesgo = sum(errores) / len(errores)
+        print(f"Barrido 2.5m-5m: sesgo medio {sesgo:+.2%}, "
+              f"error máximo {max(map(abs, errores)):.2%}")
+        resultados.append(abs(sesgo) <= 0.01)
+        resultados.append(max(map(abs, errores)) <= 3 * sketch.error_relativo())
+        try:
+            sketch.combinar(SketchHyperLogLog(precision=10))
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 16 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 16: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 16: {str(e)}")
+        return False
+
+
+def test_codificacion_diccionario():
+    """Verifica que los datos codificados por diccionario den los mismos resultados"""
+    print("\n" + "="*70)
+    print("TEST 17: CODIFICACIÓN POR DICCIONARIO")
+    print("="*70)
+    
+    estados = ['OK', 'ERROR', 'OK', 'TIMEOUT', 'OK', 'ERROR', 'OK', 'OK'] * 500
+    claves = ['web', 'api'] * 2000
+    
+    try:
+        original = AnalizadorCualitativo(estados)
+        codificado = AnalizadorCualitativo(estados, codificar=True)
+        print(f"Codificado: {codificado.codificado}, códigos: {codificado._datos.typecode}")
+        
+        resultados = [
+            codificado.codificado and not original.codificado,
+            codificado.tabla_frecuencias() == original.tabla_frecuencias(),
+            codificado.resumen() == original.resumen(),
+            codificado.tabla_contingencia(claves) == original.tabla_contingencia(claves),
+            math.isclose(codificado.entropia(), original.entropia())
+        ]
+        
+        # Columna de códigos int32 mapeada en memoria con su diccionario
+        categorias = ['OK', 'ERROR', 'TIMEOUT']
+        codigos = array('i', [categorias.index(e) for e in estados])
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, 'estados.i32')
+            with open(ruta, 'wb') as archivo:
+                codigos.tofile(archivo)
+            mapeado = AnalizadorCualitativo.desde_archivo(ruta, formato='i32', categorias=categorias)
+            resultados.append(mapeado.frecuencias_absolutas() == original.frecuencias_absolutas())
+            del mapeado
+        
+        try:
+            AnalizadorCualitativo.desde_codigos([0, 3], categorias)
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 17 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 17: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 17: {str(e)}")
+        return False
+
+
+def test_cache_resultados():
+    """Verifica la caché de resultados: aciertos, dependencias e invalidación"""
+    print("\n" + "="*70)
+    print("TEST 18: CACHÉ DE RESULTADOS CON DEPENDENCIAS")
+    print("="*70)
+    
+    datos = [12, 15, 18, 20, 22, 25, 28, 30, 35, 40]
+    
+    try:
+        analizador = AnalizadorCuantitativo(datos)
+        primero = analizador.resumen()
+        segundo = analizador.resumen()
+        info = analizador.info_cache()
+        print(f"Aciertos: {info['aciertos']}, fallos: {info['fallos']}")
+        print(f"Dependencias: {info['dependencias']}")
+        
+        resultados = [
+            primero == segundo,
+            all(m['fallos'] == 1 for m in info['por_metodo'].values()),
+            'desviacion_estandar' in info['dependencias']['varianza']
+        ]
+        
+        # Invalidar la varianza invalida lo que se derivó de ella
+        analizador.invalidar_cache('varianza')
+        analizador.coeficiente_variacion()
+        info = analizador.info_cache()
+        resultados.append(info['por_metodo']['coeficiente_variacion']['fallos'] == 2)
+        resultados.append(info['por_metodo']['media']['fallos'] == 1)
+        
+        # Modificar un resultado devuelto no altera la caché
+        cualitativo = AnalizadorCualitativo(['a', 'b', 'a'])
+        cualitativo.frecuencias_relativas()['a'] = 0
+        resultados.append(cualitativo.frecuencias_relativas()['a'] == 2 / 3)
+        
+        # Sin argumentos también se descartan momentos, copia ordenada y
+        # frecuencias: los cambios en la lista original se ven al recalcular
+        lista = [1.0, 2.0, 3.0, 10.0]
+        mutable = AnalizadorCuantitativo(lista, backend='python')
+        resultados.append(mutable.media() == 4.0 and mutable.mediana() == 2.5)
+        lista[:] = [20.0, 22.0, 24.0]
+        mutable.invalidar_cache()
+        resultados.append(mutable.media() == 22.0 and mutable.mediana() == 22.0)
+        
+        # La caché tiene un tamaño máximo
+        for i in range(1000):
+            mutable.percentiles([i / 10])
+        resultados.append(mutable.info_cache()['entradas'] <= 256)
+        
+        # En el analizador incremental los datos nuevos invalidan la caché
+        incremental = AnalizadorCuantitativoIncremental([1, 2, 3])
+        resultados.append(incremental.media() == 2)
+        incremental.agregar(10)
+        resultados.append(incremental.media() == 4)
+        
+        if all(resultados):
+            print("\n✅ TEST 18 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 18: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 18: {str(e)}")
+        return False
+
+
+def test_analizador_multivariado():
+    """Verifica las matrices del analizador multivariado contra el bivariado"""
+    print("\n" + "="*70)
+    print("TEST 19: ANÁLISIS MULTIVARIADO (MATRICES DE COVARIANZA Y CORRELACIÓN)")
+    print("="*70)
+    
+    horas = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+    notas = [50, 55, 60, 65, 70, 75, 80, 85, 90, 92]
+    faltas = [9, 8, 8, 6, 5, 5, 3, 2, 2, 1]
+    
+    try:
+        columnas = {'horas': horas, 'notas': notas, 'faltas': faltas}
+        analizador = AnalizadorMultivariado(columnas, tamano_bloque=3)
+        por_bloques = AnalizadorMultivariado.desde_bloques(
+            ([horas[i:i + 4], notas[i:i + 4], faltas[i:i + 4]] for i in range(0, 10, 4)),
+            nombres=['horas', 'notas', 'faltas'])
+        correlaciones = analizador.matriz_correlacion()
+        print(f"Matriz de correlación: {analizador.resumen()['matriz_correlacion']}")
+        print(f"Pares con |r| >= 0.95: {analizador.pares_correlacionados(0.95)}")
+        
+        resultados = []
+        for x, y in [('horas', 'notas'), ('horas', 'faltas'), ('notas', 'faltas')]:
+            bivariado = AnalizadorBivariado(columnas[x], columnas[y])
+            i, j = analizador.nombres.index(x), analizador.nombres.index(y)
+            resultados.extend([
+                math.isclose(correlaciones[i][j], bivariado.correlacion_pearson()),
+                math.isclose(correlaciones[j][i], correlaciones[i][j]),
+                math.isclose(analizador.matriz_covarianza()[i][j], bivariado.covarianza()),
+                math.isclose(por_bloques.correlacion(x, y), bivariado.correlacion_pearson())
+            ])
+        regresion = analizador.regresiones('notas')['horas']
+        esperada = AnalizadorBivariado(horas, notas).regresion_lineal_simple()
+        resultados.append(regresion['pendiente'] == esperada['pendiente'])
+        resultados.append(all(math.isclose(correlaciones[i][i], 1) for i in range(3)))
+        
+        # Fusionar en un acumulador vacío copia el estado: `otro` no cambia
+        otro = AcumuladorCovarianzas(3).extender([horas[:5], notas[:5], faltas[:5]])
+        medias_antes, covarianzas_antes = [float(m) for m in otro.medias], otro.covarianzas()
+        total = AcumuladorCovarianzas(3).combinar(otro)
+        total.extender([horas[5:], notas[5:], faltas[5:]])
+        resultados.append([float(m) for m in otro.medias] == medias_antes)
+        resultados.append(otro.covarianzas() == covarianzas_antes)
+        resultados.append(all(math.isclose(a, b) for a, b in
+                              zip(total.covarianzas()[0], analizador.matriz_covarianza()[0])))
+        
+        try:
+            AnalizadorMultivariado([horas, notas[:5]])
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 19 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 19: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 19: {str(e)}")
+        return False
+
+
+def test_bivariado_incremental():
+    """Verifica el analizador bivariado incremental contra el analizador completo"""
+    print("\n" + "="*70)
+    print("TEST 20: ANÁLISIS BIVARIADO INCREMENTAL")
+    print("="*70)
+    
+    horas = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+    notas = [50, 55, 60, 65, 70, 75, 80, 85, 90, 92]
+    
+    try:
+        completo = AnalizadorBivariado(horas, notas)
+        
+        # Un flujo par a par y otro por particiones combinadas
+        flujo = AnalizadorBivariadoIncremental()
+        for x, y in zip(horas, notas):
+            flujo.agregar(x, y)
+        particion = AnalizadorBivariadoIncremental(horas[:4], notas[:4])
+        particion.combinar(AnalizadorBivariadoIncremental(horas[4:], notas[4:]))
+        print(f"Flujo: {flujo.resumen()}")
+        
+        resultados = [flujo.n == 10, particion.n == 10, flujo.datos is None,
+                      completo.datos == list(zip(horas, notas))]
+        for analizador in (flujo, particion):
+            resultados.extend([
+                math.isclose(analizador.covarianza(), completo.covarianza()),
+                math.isclose(analizador.correlacion_pearson(), completo.correlacion_pearson()),
+                math.isclose(analizador.coeficiente_determinacion(),
+                             completo.coeficiente_determinacion()),
+                analizador.regresion_lineal_simple() == completo.regresion_lineal_simple()
+            ])
+        
+        # Un par nuevo invalida los resultados ya calculados
+        antes = flujo.correlacion_pearson()
+        flujo.agregar(12, 60)
+        resultados.append(flujo.correlacion_pearson() < antes)
+        
+        try:
+            AnalizadorBivariadoIncremental().covarianza()
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 20 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 20: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 20: {str(e)}")
+        return False
+
+
+def test_correlaciones_rango():
+    """Verifica Spearman y Kendall (tau-b) contra sus definiciones directas"""
+    print("\n" + "="*70)
+    print("TEST 21: CORRELACIONES DE RANGO (SPEARMAN Y KENDALL)")
+    print("="*70)
+    
+    # Relación monótona pero no lineal, con empates en ambas variables
+    x = [1, 2, 2, 3, 4, 5, 5, 6, 7, 8, 9, 10]
+    y = [1, 4, 4, 9, 16, 25, 20, 36, 49, 49, 81, 1000]
+    
+    try:
+        analizador = AnalizadorBivariado(x, y)
+        spearman = analizador.correlacion_spearman()
+        kendall = analizador.correlacion_kendall()
+        print(f"Pearson:  {analizador.correlacion_pearson():.4f}")
+        print(f"Spearman: {spearman:.4f}")
+        print(f"Kendall:  {kendall:.4f}")
+        
+        # Kendall tau-b por definición, comparando todos los pares
+        concordantes = discordantes = solo_x = solo_y = 0
+        for i in range(len(x)):
+            for j in range(i + 1, len(x)):
+                signo = (x[i] - x[j]) * (y[i] - y[j])
+                concordantes += signo > 0
+                discordantes += signo < 0
+                solo_x += x[i] == x[j] and y[i] != y[j]
+                solo_y += y[i] == y[j] and x[i] != x[j]
+        esperado = (concordantes - discordantes) / math.sqrt(
+            (concordantes + discordantes + solo_x) * (concordantes + discordantes + solo_y))
+        
+        # Spearman: Pearson de los rangos promedio
+        def rangos(valores):
+            return [sum(v < a for v in valores) + (sum(v == a for v in valores) + 1) / 2
+                    for a in valores]
+        
+        resultados = [
+            math.isclose(kendall, esperado),
+            math.isclose(spearman, AnalizadorBivariado(rangos(x), rangos(y)).correlacion_pearson()),
+            math.isclose(AnalizadorBivariado(x, [v ** 3 for v in x]).correlacion_spearman(), 1),
+            math.isclose(AnalizadorBivariado(x, [-v for v in x]).correlacion_kendall(), -1)
+        ]
+        try:
+            AnalizadorBivariado([1, 1, 1], [1, 2, 3]).correlacion_kendall()
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 21 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 21: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 21: {str(e)}")
+        return False
+
+
+def test_histogramas():
+    """Verifica los histogramas de intervalos y el histograma HDR"""
+    print("\n" + "="*70)
+    print("TEST 22: HISTOGRAMAS (FIJO, FREEDMAN-DIACONIS, LOG Y HDR)")
+    print("="*70)
+    
+    # Latencias con cola pesada
+    latencias = [10 + (i % 50) + (i % 97) ** 2 / 10 for i in range(2000)]
+    
+    try:
+        analizador = AnalizadorCuantitativo(latencias)
+        fijo = analizador.histograma('fijo', num_bins=8)
+        fd = analizador.histograma()
+        logaritmico = analizador.histograma('log', num_bins=6)
+        print(f"Fijo (8): {fijo['frecuencias']}")
+        print(f"Freedman-Diaconis: {len(fd['frecuencias'])} intervalos")
+        print(f"Logarítmico (6): {logaritmico['frecuencias']}")
+        
+        ancho_fd = 2 * analizador.rango_intercuartilico() / len(latencias) ** (1 / 3)
+        resultados = [
+            sum(fijo['frecuencias']) == len(latencias),
+            sum(fd['frecuencias']) == len(latencias),
+            sum(logaritmico['frecuencias']) == len(latencias),
+            len(fijo['bordes']) == 9,
+            len(fd['frecuencias']) == math.ceil(
+                (analizador.maximo() - analizador.minimo()) / ancho_fd),
+            math.isclose(logaritmico['bordes'][2] / logaritmico['bordes'][1],
+                         logaritmico['bordes'][1] / logaritmico['bordes'][0])
+        ]
+        
+        # HDR: dos trabajadores llenan su histograma y se combinan
+        hdr = HistogramaHDR(error_relativo=0.01).extender(latencias[:1200])
+        hdr.combinar(HistogramaHDR(error_relativo=0.01).extender(latencias[1200:]))
+        ordenados = sorted(latencias)
+        print(f"{hdr}: p50={hdr.percentil(50):.2f}, p99={hdr.percentil(99):.2f}")
+        resultados.append(hdr.n == len(latencias))
+        for p in [1, 25, 50, 75, 90, 99]:
+            exacto = ordenados[int(p / 100 * (len(latencias) - 1))]
+            resultados.append(abs(hdr.percentil(p) - exacto) <= 0.01 * exacto + 1e-9)
+        resultados.append(analizador.histograma_hdr().percentiles([0, 100]) ==
+                          [analizador.minimo(), analizador.maximo()])
+        
+        # Datos constantes: un único intervalo con cualquier método
+        for metodo in ['fijo', 'freedman-diaconis', 'log']:
+            constante = AnalizadorCuantitativo([5.0] * 20).histograma(metodo)
+            resultados.append(constante == {'bordes': [5.0, 5.0], 'frecuencias': [20]})
+        
+        # IQR diminuto pero no nulo: el número de intervalos queda acotado
+        concentrados = [1 + i * 1e-12 for i in range(100)] + [1e6]
+        acotado = AnalizadorCuantitativo(concentrados).histograma()
+        print(f"IQR diminuto: {len(acotado['frecuencias'])} intervalos")
+        resultados.append(len(acotado['frecuencias']) <= math.ceil(math.sqrt(101)))
+        resultados.append(sum(acotado['frecuencias']) == 101)
+        
+        try:
+            AnalizadorCuantitativo([-1, 2, 3]).histograma('log')
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 22 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 22: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 22: {str(e)}")
+        return False
+
+
+def test_bootstrap():
+    """Verifica los intervalos de confianza bootstrap"""
+    print("\n" + "="*70)
+    print("TEST 23: INTERVALOS DE CONFIANZA BOOTSTRAP")
+    print("="*70)
+    
+    calificaciones = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90, 79, 81, 93]
+    horas = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+    notas = [50, 58, 60, 63, 72, 75, 78, 85, 90, 92]
+    
+    try:
+        analizador = AnalizadorCuantitativo(calificaciones)
+        media = analizador.intervalo_confianza('media', replicas=400, semilla=7)
+        repetido = analizador.intervalo_confianza('media', replicas=400, semilla=7)
+        mediana = analizador.intervalo_confianza('mediana', nivel=0.9, replicas=300, semilla=7)
+        p90 = analizador.intervalo_confianza('percentil', p=90, replicas=300, semilla=7)
+        paralelo = analizador.intervalo_confianza('media', replicas=400, semilla=7, trabajadores=2)
+        correlacion = AnalizadorBivariado(horas, notas).intervalo_confianza(replicas=300, semilla=7)
+        print(f"Media: {media['estimacion']:.2f} IC95% [{media['inferior']:.2f}, {media['superior']:.2f}]")
+        print(f"Mediana: IC90% [{mediana['inferior']:.2f}, {mediana['superior']:.2f}]")
+        print(f"Correlación: IC95% [{correlacion['inferior']:.4f}, {correlacion['superior']:.4f}]")
+        
+        resultados = [
+            media == repetido,
+            paralelo['replicas'] == 400,
+            paralelo == analizador.intervalo_confianza('media', replicas=400, semilla=7,
+                                                       trabajadores=2)
+        ]
+        for intervalo in (media, mediana, p90, correlacion, paralelo):
+            resultados.append(intervalo['inferior'] <= intervalo['estimacion'] <= intervalo['superior'])
+        resultados.append(math.isclose(media['error_estandar'],
+                                       analizador.desviacion_estandar() / math.sqrt(18), rel_tol=0.25))
+        resultados.append(correlacion['superior'] <= 1)
+        
+        try:
+            analizador.intervalo_confianza('percentil')
+            resultados.append(False)
+        except ValueError:
+            resultados.append(True)
+        
+        if all(resultados):
+            print("\n✅ TEST 23 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 23: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 23: {str(e)}")
+        return False
+
+
+def test_analizar_lote():
+    """Verifica el análisis de muchas columnas en una sola llamada"""
+    print("\n" + "="*70)
+    print("TEST 24: ANÁLISIS POR LOTES DE COLUMNAS")
+    print("="*70)
+    
+    tabla = {
+        'edad': [23, 35, 41, 29, 52, 38, 27, 45],
+        'ingreso': [1200.5, 2300.0, 3100.2, 1800.0, 4200.8, 2600.1, 1500.0, 3300.4],
+        'ciudad': ['Lima', 'Cusco', 'Lima', 'Piura', 'Lima', 'Cusco', 'Lima', 'Piura'],
+        'codigo': ['10', '20', '10', '30', '20', '10', 'X', '30'],
+        'nivel': ['1', '2', '3', '2', '1', '3', '2', '1']
+    }
+    
+    try:
+        analizadores = analizar_lote(tabla, tipos={'nivel': 'cualitativo'})
+        resumenes = analizar_lote(tabla, tipos={'nivel': 'cualitativo'}, resumir=True)
+        filas = [dict(zip(tabla, valores)) for valores in zip(*tabla.values())]
+        por_filas = analizar_lote(filas, tipos={'nivel': 'cualitativo'}, resumir=True)
+        for nombre, analizador in analizadores.items():
+            print(f"{nombre}: {type(analizador).__name__}")
+        
+        resultados = [
+            isinstance(analizadores['edad'], AnalizadorCuantitativo),
+            isinstance(analizadores['ingreso'], AnalizadorCuantitativo),
+            isinstance(analizadores['ciudad'], AnalizadorCualitativo),
+            isinstance(analizadores['codigo'], AnalizadorCualitativo),
+            isinstance(analizadores['nivel'], AnalizadorCualitativo),
+            por_filas == resumenes,
+            analizadores['edad'].datos is tabla['edad']  # sin convertir
+        ]
+        # Textos numéricos: la detección los convierte y el analizador
+        # recibe ese buffer, sin una segunda conversión
+        conversiones = []
+        
+        class Texto(str):
+            def __float__(self):
+                conversiones.append(self)
+                return float(str(self))
+        
+        textos = analizar([Texto(x) for x in ['1.5', '2', '2', '4']])
+        resultados.append(isinstance(textos, AnalizadorCuantitativo) and textos.media() == 2.375)
+        resultados.append(isinstance(textos.datos, array) and len(conversiones) == 4)
+        detectado = analizar([1, 2, 2])
+        resultados.append(detectado.datos == [1, 2, 2] and type(detectado.moda()) is int)
+        for nombre, datos in tabla.items():
+            if nombre != 'nivel':
+                resultados.append(resumenes[nombre] == analizar(datos).resumen())
+        paralelo = analizar_lote(tabla, tipos={'nivel': 'cualitativo'}, resumir=True,
+                                 trabajadores=2)
+        resultados.append(paralelo == resumenes)
+        
+        if all(resultados):
+            print("\n✅ TEST 24 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 24: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 24: {str(e)}")
+        return False
+
+
+def test_memoria_compacta():
+    """Verifica los analizadores con __slots__ y la entrada sin copias"""
+    print("\n" + "="*70)
+    print("TEST 25: ANALIZADORES COMPACTOS Y BUFFERS SIN COPIA")
+    print("="*70)
+    
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    valores = [2.5, 3.0, 4.5, 1.0, 6.5, 3.5, 2.0, 5.0]
+    
+    try:
+        analizadores = [
+            AnalizadorCuantitativo(valores),
+            AnalizadorCualitativo(['a', 'b', 'a']),
+            AnalizadorBivariado(valores, valores[::-1]),
+            AnalizadorCuantitativoIncremental(),
+            AnalizadorAgrupado(['x', 'y'] * 4, valores),
+            AnalizadorMultivariado([valores, valores[::-1]])
+        ]
+        resultados = [not hasattr(a, '__dict__') for a in analizadores]
+        print(f"Analizadores sin __dict__: {resultados.count(True)}/{len(resultados)}")
+        
+        # La caché no existe hasta la primera consulta
+        analizador = AnalizadorCuantitativo(valores)
+        resultados.append(analizador.info_cache()['entradas'] == 0)
+        analizador.media()
+        resultados.append(analizador.info_cache()['entradas'] == 1)
+        
+        referencia = AnalizadorCuantitativo(valores).resumen()
+        buffer = array('d', valores)
+        for entrada in (buffer, memoryview(buffer)):
+            analizador = AnalizadorCuantitativo(entrada)
+            resultados.append(analizador.resumen() == referencia)
+            resultados.append(analizador.datos is entrada)
+            if analizador.backend == 'numpy':
+                resultados.append(np.shares_memory(analizador._arreglo, buffer))
+        if np is not None:
+            arreglo = np.array(valores)
+            analizador = AnalizadorCuantitativo(arreglo)
+            resultados.append(analizador.datos is arreglo)
+            resultados.append(analizador.resumen() == referencia)
+        
+        # Las listas de int se conservan tal cual: datos y moda siguen siendo int
+        enteros = [3, 1, 2, 2, 3]
+        analizador = AnalizadorCuantitativo(enteros)
+        resultados.append(analizador.datos is enteros)
+        resultados.append(analizador.moda() == [3, 2]
+                          and all(type(m) is int for m in analizador.moda()))
+        resultados.append(type(AnalizadorCuantitativo([1, 2, 2, 5]).resumen()['moda']) is int)
+        
+        # Otros contenidos numéricos se convierten a float
+        texto = AnalizadorCuantitativo(['2', '4', '6'], backend='python')
+        resultados.append(texto.datos == [2.0, 4.0, 6.0])
+        resultados.append(texto.mediana() == 4.0)
+        
+        if all(resultados):
+            print("\n✅ TEST 25 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 25: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 25: {str(e)}")
+        return False
+
+
+def test_suma_compensada():
+    """Verifica el modo de suma compensada con un desplazamiento grande"""
+    print("\n" + "="*70)
+    print("TEST 26: SUMA COMPENSADA")
+    print("="*70)
+    
+    # Marcas de tiempo grandes con pequeñas variaciones: la suma ingenua
+    # pierde los dígitos que distinguen a los valores
+    base = 1.7e15
+    variaciones = [0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 3.0, 5.0] * 20000
+    datos = [base + v for v in variaciones]
+    n = len(datos)
+    media_exacta = base + sum(variaciones) / n
+    var_exacta = statistics.variance(variaciones)
+    
+    try:
+        analizador = AnalizadorCuantitativo(datos)
+        media = analizador.media(compensado=True)
+        varianza = analizador.varianza(compensado=True)
+        print(f"Media compensada: {media!r} (exacta {media_exacta!r})")
+        print(f"Varianza: {analizador.varianza()!r} → compensada {varianza!r} "
+              f"(exacta {var_exacta!r})")
+        
+        referencia = AnalizadorCuantitativo(variaciones)
+        bivariado = AnalizadorBivariado(datos, [2 * v for v in variaciones])
+        resultados = [
+            media == media_exacta,
+            math.isclose(varianza, var_exacta, rel_tol=1e-12),
+            math.isclose(analizador.desviacion_estandar(compensado=True),
+                         math.sqrt(var_exacta), rel_tol=1e-12),
+            math.isclose(analizador.asimetria(compensado=True),
+                         referencia.asimetria(), rel_tol=1e-9),
+            math.isclose(analizador.curtosis(compensado=True),
+                         referencia.curtosis(), rel_tol=1e-9),
+            math.isclose(bivariado.covarianza(compensado=True), 2 * var_exacta,
+                         rel_tol=1e-12),
+            AnalizadorCuantitativo(datos, backend='python').varianza(compensado=True)
+            == varianza
+        ]
+        
+        try:
+            AnalizadorBivariadoIncremental().extender(datos, datos).covarianza(compensado=True)
+            resultados.append(False)
+        except ValueError as e:
+            print(f"✅ CORRECTO: Error capturado - {e}")
+        
+        if all(resultados):
+            print("\n✅ TEST 26 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 26: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 26: {str(e)}")
+        return False
+
+
+def test_api_asincrona():
+    """Verifica analizar_async, resumen_async y los flujos asíncronos"""
+    print("\n" + "="*70)
+    print("TEST 27: API ASÍNCRONA")
+    print("="*70)
+    
+    datos = [float((i * 37) % 101) for i in range(20000)]
+    
+    async def flujo():
+        for inicio in range(0, len(datos), 3000):
+            yield datos[inicio:inicio + 3000]
+            await asyncio.sleep(0)
+        for x in (1.5, 2.5, 3.5):
+            yield x
+    
+    async def flujo_buffers():
+        buffer = array('d', datos)
+        for inicio in range(0, len(datos), 5000):
+            yield memoryview(buffer)[inicio:inicio + 5000]
+    
+    async def flujo_con_error():
+        yield datos[:1000]
+        yield datos[1000:2000]
+        raise RuntimeError("fuente interrumpida")
+    
+    async def principal():
+        latidos = 0
+        
+        async def latido():
+            nonlocal latidos
+            while True:
+                latidos += 1
+                await asyncio.sleep(0)
+        
+        tarea = asyncio.create_task(latido())
+        analizador = await analizar_async(datos)
+        resumen = await analizador.resumen_async()
+        with ThreadPoolExecutor(max_workers=2) as hilos:
+            categorias = await analizar_async(['a', 'b', 'a'], ejecutor=hilos)
+            incremental = await analizar_async(flujo(), ejecutor=hilos, tamano_bloque=2)
+        with ProcessPoolExecutor(max_workers=2) as procesos:
+            resumen_procesos = await analizador.resumen_async(procesos)
+            # Los memoryview se copian antes de enviarlos a otro proceso
+            buffers = await analizar_async(flujo_buffers(), ejecutor=procesos)
+        tarea.cancel()
+        return (analizador, resumen, categorias, incremental, resumen_procesos,
+                buffers, latidos)
+    
+    try:
+        (analizador, resumen, categorias, incremental, resumen_procesos,
+         buffers, latidos) = asyncio.run(principal())
+        referencia = AnalizadorCuantitativoIncremental(datos + [1.5, 2.5, 3.5])
+        print(f"Media: {resumen['media']} | Flujo: n={incremental.n}, "
+              f"media={incremental.media():.4f} | Latidos del bucle: {latidos}")
+        
+        resultados = [
+            isinstance(analizador, AnalizadorCuantitativo),
+            resumen == AnalizadorCuantitativo(datos).resumen(),
+            resumen_procesos == resumen,
+            categorias.moda() == 'a',
+            isinstance(incremental, AnalizadorCuantitativoIncremental),
+            incremental.resumen() == referencia.resumen(),
+            buffers.n == len(datos) and math.isclose(buffers.media(), statistics.fmean(datos)),
+            latidos > 0
+        ]
+        
+        # Un error del flujo se propaga después de cancelar el bloque pendiente
+        async def con_error():
+            with ThreadPoolExecutor(max_workers=1) as hilos:
+                try:
+                    await analizar_async(flujo_con_error(), ejecutor=hilos)
+                except RuntimeError as e:
+                    return str(e), len(asyncio.all_tasks())
+        mensaje, tareas = asyncio.run(con_error())
+        print(f"✅ CORRECTO: Error capturado - {mensaje}")
+        resultados.append(tareas == 1)
+        
+        async def cualitativo():
+            return await analizar_async(flujo(), tipo='cualitativo')
+        try:
+            asyncio.run(cualitativo())
+            resultados.append(False)
+        except ValueError as e:
+            print(f"✅ CORRECTO: Error capturado - {e}")
+        
+        if all(resultados):
+            print("\n✅ TEST 27 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 27: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 27: {str(e)}")
+        return False
+
+
+def test_instantaneas():
+    """Verifica las instantáneas binarias: guardar, cargar con mmap y combinar"""
+    print("\n" + "="*70)
+    print("TEST 28: INSTANTÁNEAS BINARIAS")
+    print("="*70)
+    
+    hora1 = [12.5, 14.0, 11.2, 15.8, 13.3, 12.9, 16.1, 10.4, 14.7, 13.0]
+    hora2 = [15.2, 17.4, 14.1, 16.6, 18.0, 15.5]
+    colores1 = ['rojo', 'azul', 'rojo', 'verde', 'rojo']
+    colores2 = ['azul', 'azul', 'verde']
+    
+    try:
+        with tempfile.TemporaryDirectory() as directorio:
+            rutas = [os.path.join(directorio, f"hora{i}.bin") for i in (1, 2)]
+            AnalizadorCuantitativo(hora1).guardar(rutas[0])
+            AnalizadorCuantitativo(hora2).guardar(rutas[1])
+            cargado = AnalizadorCuantitativo.cargar(rutas[0])
+            resultados = [cargado.resumen() == AnalizadorCuantitativo(hora1).resumen(),
+                          os.path.getsize(rutas[0]) == 80 + 8 * len(hora1)]
+            
+            # Consolidación de las dos horas sin volver a los datos crudos
+            dia = cargado.combinar(AnalizadorCuantitativo.cargar(rutas[1]))
+            referencia = AnalizadorCuantitativo(hora1 + hora2)
+            print(f"Día consolidado: n={dia.n}, media={dia.media():.4f}, "
+                  f"mediana={dia.mediana():.4f}")
+            resumen, esperado = dia.resumen(), referencia.resumen()
+            resultados.append(resumen.keys() == esperado.keys() and all(
+                math.isclose(resumen[k], esperado[k], abs_tol=1e-4)
+                if isinstance(esperado[k], float) else resumen[k] == esperado[k]
+                for k in esperado))
+            del cargado, dia  # libera los mapeos antes de borrar los archivos
+        
+        incremental = AnalizadorCuantitativoIncremental(hora1, k_sketch=50)
+        restaurado = AnalizadorCuantitativoIncremental.deserializar(incremental.serializar())
+        resultados.append(restaurado.resumen() == incremental.resumen())
+        resultados.append(restaurado.percentil(90) == incremental.percentil(90))
+        
+        frecuencias = AnalizadorCualitativo.deserializar(
+            AnalizadorCualitativo(colores1).serializar())
+        resultados.append(frecuencias.resumen() == AnalizadorCualitativo(colores1).resumen())
+        frecuencias.combinar(AnalizadorCualitativo(colores2))
+        print(f"Frecuencias combinadas: {frecuencias.frecuencias_absolutas()}")
+        resultados.append(frecuencias.resumen()
+                          == AnalizadorCualitativo(colores1 + colores2).resumen())
+        
+        # En modo aproximado se guarda el sketch KLL, no la muestra
+        latencias = [random.Random(7).expovariate(1 / 40) for _ in range(20000)]
+        aproximado = AnalizadorCuantitativo(latencias, modo_cuantiles='aproximado')
+        instantanea = aproximado.serializar()
+        restaurado = AnalizadorCuantitativo.deserializar(instantanea)
+        print(f"Instantánea aproximada: {len(instantanea)} bytes (muestra: {8 * len(latencias)})")
+        resultados.append(len(instantanea) < 8 * len(latencias) // 10)
+        resultados.append(restaurado.datos is None and restaurado.aproximado)
+        resultados.append(restaurado.percentiles([50, 99]) == aproximado.percentiles([50, 99]))
+        resultados.append(math.isclose(restaurado.media(), aproximado.media()))
+        consolidado = restaurado.combinar(AnalizadorCuantitativo(latencias[:5000]))
+        resultados.append(consolidado.n == 25000 and consolidado.datos is None)
+        
+        # Construcción directa desde una tabla de frecuencias
+        tabla = AnalizadorCualitativo(frecuencias={'rojo': 3, 'azul': 1, 'verde': 1})
+        resultados.append(tabla.resumen() == AnalizadorCualitativo(colores1).resumen())
+        
+        exacta = AnalizadorCuantitativo(hora1).serializar()
+        for invalido in (lambda: AnalizadorCuantitativo.deserializar(b'XXX' + bytes(80)),
+                         lambda: AnalizadorCuantitativo.deserializar(exacta[:-8]),
+                         lambda: AnalizadorCualitativo.deserializar(
+                             AnalizadorCualitativo(colores1).serializar()[:-1]),
+                         lambda: AnalizadorCualitativo(colores1, modo='aproximado').serializar(),
+                         lambda: restaurado.moda(),
+                         lambda: frecuencias.tabla_contingencia(['g'] * frecuencias.n)):
+            try:
+                invalido()
+                resultados.append(False)
+            except ValueError as e:
+                print(f"✅ CORRECTO: Error capturado - {e}")
+        
+        # Analizadores sin instantáneas: TypeError
+        for invalido in (lambda: AnalizadorBivariado(hora1, hora1).serializar(),
+                         lambda: AnalizadorBivariado.deserializar(exacta)):
+            try:
+                invalido()
+                resultados.append(False)
+            except TypeError as e:
+                print(f"✅ CORRECTO: Error capturado - {e}")
+        
+        if all(resultados):
+            print("\n✅ TEST 28 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 28: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 28: {str(e)}")
+        return False
+
+
+def test_perfilado():
+    """Verifica la instrumentación por método y sus exportaciones"""
+    print("\n" + "="*70)
+    print("TEST 29: PERFILADO POR MÉTODO")
+    print("="*70)
+    
+    datos = [85, 90, 78, 92, 88, 76, 95, 89, 84, 91, 87, 83, 94, 86, 90]
+    
+    try:
+        analizador = AnalizadorCuantitativo(datos)
+        eventos = []
+        with analizador.perfilar(callback=lambda nombre, medida: eventos.append(nombre),
+                                 medir_memoria=True) as perfil:
+            analizador.resumen()
+            analizador.media()
+        
+        metricas = perfil.como_dict()
+        analizador.varianza(False)  # fuera del contexto: no se registra
+        texto = perfil.como_prometheus()
+        operaciones = {}
+        for m in metricas.values():
+            for operacion, cantidad in m['operaciones'].items():
+                operaciones[operacion] = operaciones.get(operacion, 0) + cantidad
+        print(f"Pasadas por operación: {operaciones}")
+        for metodo in ('media', 'moda', 'percentiles'):
+            m = metricas[metodo]
+            print(f"{metodo}: llamadas={m['llamadas']}, aciertos={m['aciertos_cache']}, "
+                  f"pasadas={m['operaciones']}, bytes={m['bytes_asignados']}")
+        
+        resultados = [
+            metricas['media']['llamadas'] >= 2,
+            metricas['media']['aciertos_cache'] == metricas['media']['llamadas'] - 1,
+            metricas['media']['operaciones'] == {},  # resumen ya calculó los momentos
+            metricas['moda']['operaciones'] == {'ordenar': 1},
+            # resumen se mide como método propio y su pasada de momentos es suya
+            metricas['resumen']['llamadas'] == 1,
+            metricas['resumen']['operaciones'] == {'momentos': 1},
+            metricas['resumen']['segundos'] >= metricas['moda']['segundos'],
+            'otros' not in metricas,
+            operaciones['momentos'] == 1 and operaciones['ordenar'] == 1,
+            all(m['segundos'] >= m['segundos_propios'] >= 0 for m in metricas.values()),
+            metricas['moda']['bytes_asignados'] > 0,
+            len(eventos) == sum(m['llamadas'] for m in metricas.values()),
+            perfil.como_dict() == metricas,
+            '# TYPE corepy_llamadas_total counter' in texto,
+            'corepy_pasadas_total{analizador="AnalizadorCuantitativo",metodo="moda",'
+            'operacion="ordenar"} 1' in texto
+        ]
+        
+        # Una sola pasada de momentos aunque se pidan por separado
+        secuencial = AnalizadorCuantitativo(datos, backend='python')
+        with secuencial.perfilar() as perfil_secuencial:
+            for metodo in ('media', 'varianza', 'asimetria', 'curtosis', 'minimo', 'maximo'):
+                getattr(secuencial, metodo)()
+        pasadas = [m['operaciones'] for m in perfil_secuencial.como_dict().values()
+                   if m['operaciones']]
+        resultados.append(pasadas == [{'momentos': 1}])
+        
+        cualitativo = AnalizadorCualitativo(['a', 'b', 'a'])
+        with cualitativo.perfilar() as perfil_cualitativo:
+            cualitativo.resumen()
+        resultados.append(sum(m['pasadas'] for m in perfil_cualitativo.como_dict().values()) == 1)
+        resultados.append(perfil_cualitativo.como_dict()['resumen']['llamadas'] == 1)
+        histograma = AnalizadorCuantitativo(datos)
+        with histograma.perfilar() as perfil_histograma:
+            histograma.histograma('fijo')
+        resultados.append(perfil_histograma.como_dict()['histograma']['llamadas'] == 1)
+        
+        try:
+            with analizador.perfilar():
+                with analizador.perfilar():
+                    pass
+            resultados.append(False)
+        except ValueError as e:
+            print(f"✅ CORRECTO: Error capturado - {e}")
+        
+        if all(resultados):
+            print("\n✅ TEST 29 COMPLETADO CON ÉXITO")
+            return True
+        print(f"\n❌ ERROR EN TEST 29: {resultados.count(False)} comprobaciones fallaron")
+        return False
+        
+    except Exception as e:
+        print(f"\n❌ ERROR EN TEST 29: {str(e)}")
+        return False
+
+
 def ejecutar_todos_los_tests():
     """Ejecuta todos los tests y muestra un resumen"""
     print("\n" + "="*70)
@@ -326,7 +1751,31 @@ def ejecutar_todos_los_tests():
         'Test 2 - Cualitativo': test_analizador_cualitativo(),
         'Test 3 - Bivariado': test_analizador_bivariado(),
         'Test 4 - Función Helper': test_funcion_analizar(),
-        'Test 5 - Casos Borde': test_casos_borde()
+        'Test 5 - Casos Borde': test_casos_borde(),
+        'Test 6 - Momentos': test_momentos_una_pasada(),
+        'Test 7 - Backend NumPy': test_backend_numpy(),
+        'Test 8 - Percentiles': test_percentiles_seleccion(),
+        'Test 9 - Incremental': test_analizador_incremental(),
+        'Test 10 - Sketch KLL': test_sketch_kll(),
+        'Test 11 - Paralelo': test_reduccion_paralela(),
+        'Test 12 - Archivos': test_carga_desde_archivo(),
+        'Test 13 - Agrupado': test_analisis_agrupado(),
+        'Test 14 - Ventana Móvil': test_ventana_movil(),
+        'Test 15 - Frecuencias Aprox.': test_frecuencias_aproximadas(),
+        'Test 16 - HyperLogLog': test_hyperloglog(),
+        'Test 17 - Codificación': test_codificacion_diccionario(),
+        'Test 18 - Caché': test_cache_resultados(),
+        'Test 19 - Multivariado': test_analizador_multivariado(),
+        'Test 20 - Bivariado Incremental': test_bivariado_incremental(),
+        'Test 21 - Correlaciones de Rango': test_correlaciones_rango(),
+        'Test 22 - Histogramas': test_histogramas(),
+        'Test 23 - Bootstrap': test_bootstrap(),
+        'Test 24 - Lotes': test_analizar_lote(),
+        'Test 25 - Memoria Compacta': test_memoria_compacta(),
+        'Test 26 - Suma Compensada': test_suma_compensada(),
+        'Test 27 - API Asíncrona': test_api_asincrona(),
+        'Test 28 - Instantáneas': test_instantaneas(),
+        'Test 29 - Perfilado': test_perfilado()
     }
     
     # Resumen final